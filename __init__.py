@@ -17,7 +17,7 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, StringProperty,
 from bpy.types import Panel, Menu, Operator, PropertyGroup, UIList
 from bpy.app.handlers import persistent
 
-from phaenotyp import basics, panel, operators, material, geometry, calculation, ga, report, progress
+from phaenotyp import basics, panel, operators, material, geometry, calculation, ga, report, progress, results
 
 # pass infos to basics to keep control of used version
 # the phaenotyp_version is stored in saved files
@@ -275,6 +275,23 @@ class phaenotyp_properties(PropertyGroup):
 				   ]
 			)
 
+		result_precision: EnumProperty(
+			name="result_precision:",
+			description="Precision of the results only used for visualization and reports",
+			items=[
+					("double", "Double precision", ""),
+					("compact", "Compact (single precision)", "")
+				   ]
+			)
+
+		cache_size: IntProperty(
+			name = "cache_size",
+			description="Amount of calculated models to keep on the disk to be reused (0 to disable)",
+			default = 1000,
+			min = 0,
+			max = 100000
+			)
+
 	if "supports":
 		loc_x: BoolProperty(name = 'loc_x', default = True)
 		loc_y: BoolProperty(name = 'loc_y', default = True)
@@ -307,6 +324,22 @@ class phaenotyp_properties(PropertyGroup):
 			min = 1,
 			max = 12
 			)
+
+		stations: IntProperty(
+			name = "stations",
+			description = "Amount of stations along each member for the results and the viz",
+			default = 11,
+			min = 3,
+			max = 41
+			)
+
+		stations_optimization: IntProperty(
+			name = "stations_optimization",
+			description = "Amount of stations along each member during bruteforce, genetic algorithm and gradient descent. The results are interpolated to the stations of the members",
+			default = 11,
+			min = 3,
+			max = 41
+			)
 		
 		member_type: EnumProperty(
 			name = "member_type",
@@ -807,6 +840,26 @@ class phaenotyp_properties(PropertyGroup):
 			max = 250
 			)
 
+		retention_size: IntProperty(
+			name = "retention_size",
+			description="Amount of best individuals to keep the results from (0 to keep all)",
+			default = 0,
+			min = 0,
+			max = 10000
+			)
+
+		retention_recompute: BoolProperty(
+			name = "retention_recompute",
+			description="Calculate individuals without results again if selected by ranking",
+			default = True
+			)
+
+		fitness_only: BoolProperty(
+			name = "fitness_only",
+			description="Calculate only the results needed by the fitness with a weight above zero. Individuals are calculated with all results if selected by ranking or reported",
+			default = False
+			)
+
 		mate_type: EnumProperty(
 			name = "mate_type",
 			description = "Type of mating",
@@ -1924,6 +1977,23 @@ class WM_OT_ranking(Operator):
 		operators.ranking()
 		return {"FINISHED"}
 
+class WM_OT_rerank(Operator):
+	'''
+	Is calling rerank from the module called operators.
+	Check out further info in there.
+	'''
+	bl_label = "rerank"
+	bl_idname = "wm.rerank"
+	bl_description = "Weight the fitness of all individuals again with the current fitness function"
+
+	def execute(self, context):
+		text = operators.rerank()
+		if text:
+			self.report({'WARNING'}, text)
+			return {"CANCELLED"}
+
+		return {"FINISHED"}
+
 class WM_OT_render_animation(Operator):
 	'''
 	Is calling render_animation from the module called operators.
@@ -1947,7 +2017,11 @@ class WM_OT_text(Operator):
 	bl_description = "Generate output at the selected vertex"
 
 	def execute(self, context):
-		operators.text()
+		text = operators.text()
+		if text:
+			self.report({'WARNING'}, text)
+			return {"CANCELLED"}
+
 		return {"FINISHED"}
 
 class WM_OT_selection(Operator):
@@ -2088,6 +2162,32 @@ class WM_OT_reset(Operator):
 		operators.reset()
 		return {"FINISHED"}
 
+class WM_OT_resume(Operator):
+	'''
+	Is calling resume from the module called operators.
+	Check out further info in there.
+	'''
+	bl_label = "resume"
+	bl_idname = "wm.resume"
+	bl_description = "Resume genetic algorithm or gradient descent from the last checkpoint"
+
+	def execute(self, context):
+		operators.resume()
+		return {"FINISHED"}
+
+class WM_OT_clear_cache(Operator):
+	'''
+	Is calling clear_cache from the module called operators.
+	Check out further info in there.
+	'''
+	bl_label = "clear_cache"
+	bl_idname = "wm.clear_cache"
+	bl_description = "Delete the calculated models kept on the disk"
+
+	def execute(self, context):
+		operators.clear_cache()
+		return {"FINISHED"}
+
 class OBJECT_PT_Phaenotyp_pre(Panel):
 	'''
 	Panel for Phaenotyp.
@@ -2393,12 +2493,14 @@ classes = (
 	WM_OT_bf_start,
 	WM_OT_ga_start,
 	WM_OT_gd_start,
+	WM_OT_resume,
 	
 	WM_OT_run_web,
 	WM_OT_stop_jobs,
 	
 	WM_OT_get_boundaries,
 	WM_OT_ranking,
+	WM_OT_rerank,
 	WM_OT_render_animation,
 	WM_OT_text,
 	WM_OT_selection,
@@ -2416,6 +2518,7 @@ classes = (
 	WM_OT_diagram,
 	
 	WM_OT_reset,
+	WM_OT_clear_cache,
 	
 	OBJECT_PT_Phaenotyp_pre,
 	OBJECT_PT_Phaenotyp_setup,
@@ -2467,6 +2570,21 @@ def update_post(scene):
 		if obj:
 			geometry.update_translation()
 	
+@persistent
+def save_pre(dummy):
+	'''
+	Is writing the results to the sidecar directory before saving.
+	'''
+	results.flush()
+
+@persistent
+def load_post(dummy):
+	'''
+	Is closing the results of the previous file.
+	The results of the loaded file are opened with the first access.
+	'''
+	results.close()
+
 @persistent
 def undo(scene):
 	'''
@@ -2499,6 +2617,8 @@ def register():
 	bpy.types.Scene.phaenotyp = PointerProperty(type=phaenotyp_properties)
 	bpy.app.handlers.frame_change_post.append(update_post)
 	bpy.app.handlers.undo_pre.append(undo)
+	bpy.app.handlers.save_pre.append(save_pre)
+	bpy.app.handlers.load_post.append(load_post)
 	
 	# handle lists in panel
 	# based on code by sinestesia and support by Gorgious
@@ -2542,6 +2662,8 @@ def unregister():
 	del bpy.types.Scene.phaenotyp
 	bpy.app.handlers.frame_change_post.remove(update_post)
 	bpy.app.handlers.undo_pre.remove(undo)
+	bpy.app.handlers.save_pre.remove(save_pre)
+	bpy.app.handlers.load_post.remove(load_post)
 	
 	# handle lists in panel
 	# based on code by sinestesia and support by Gorgious
@@ -24,6 +24,13 @@ time_left = 0 # time left based on elapsed time
 
 is_running_jobs = False
 
+shape_keys_cache = {} # basis and deltas of the shape keys during optimization
+prepared = {} # prepared models by frame to be reused if only the sections are changing
+triangles_cache = {} # faces of the structure as triangles
+chromosomes_index = set() # quantized chromosomes of all individuals of the genetic algorithm
+stations = 11 # stations along each member for the current calculation
+fitness_only = False # only the results needed by the fitness are calculated
+
 terminal = ["", "", "", "", "", "", "", "", ""]
 
 def print_data(text):
@@ -79,11 +86,13 @@ def create_data():
 		"loads_v": {},
 		"loads_e": {},
 		"loads_f": {},
+		"loads_f_edges": {},
 		"process": {
 			"scipy_available": False,
 			"version": phaenotyp_version
 			},
 		"done": {},
+		"results": {}, # reference to the results stored next to the file
 		"environment": {},
 		"individuals": {},
 		"panel_state": {
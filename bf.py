@@ -1,7 +1,7 @@
 import bpy
 import bmesh
 import random
-from phaenotyp import basics, geometry, calculation
+from phaenotyp import basics, geometry, calculation, results
 import itertools
 
 def create_indivdual(chromosome, frame):
@@ -150,12 +150,21 @@ def calculate_others():
 		calculation.calculate_frames(start, end)
 	
 	# calculate fitness and set weight for basis
-	for frame in range(start, end):
-		basics.jobs.append([calculation.calculate_fitness, frame])
+	# (all frames at once)
+	basics.jobs.append([calculation.calculate_fitness_batch, list(range(start, end))])
 	
 	basics.jobs.append([basics.print_data, "others calculated"])
 
+	# delete results of all but the best
+	basics.jobs.append([calculation.retain_results])
+
 def finish():
+	# frames calculated afterwards with all stations and results
+	basics.jobs.append([calculation.set_evaluation, False])
+
+	# delete the mesh to compute the individuals
+	basics.jobs.append([calculation.remove_shape_keys_cache])
+
 	# update view
 	basics.jobs.append([basics.view_vertex_colors])
 	
@@ -176,7 +185,11 @@ def start():
 
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
+	results.reset()
 	basics.feas = {}
+	calculation.set_evaluation(True)
+	basics.shape_keys_cache = {}
 	basics.chromosomes = []
 
 	# generate an individual as basis at frame 0
@@ -0,0 +1,212 @@
+import bpy
+import os
+import shutil
+import hashlib
+import pickle
+from numpy import array, load, savez
+from phaenotyp import basics, results
+
+# calculated models stored on the disk to be reused across sessions
+# each entry is keyed by a hash of the prepared model and is
+# containing the results as compact arrays
+
+# the entries are stored next to the blend-file in the sidecar directory
+# of the results and the least recently used ones are deleted
+# if more than phaenotyp.cache_size entries are stored
+
+hits = {} # entries found by lookup as str(frame) -> entry
+misses = {} # hashes of the models calculated by mp as str(frame) -> key
+amounts = {} # entries stored as directory -> amount, counted on the first store
+
+def directory():
+	'''
+	Returns the directory of the cache.
+	:return path: Path of the directory.
+	'''
+	return os.path.join(results.sidecar(), "cache")
+
+def signature():
+	'''
+	Returns everything the results depend on that is not part of the model.
+	:return signature: Signature as str.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+
+	# materials of the quads are used by interweave_results_pn
+	quads = []
+	for id, quad in data["quads"].items():
+		quads.append([quad["acceptable_sigma"], quad["acceptable_sigmav"], list(quad["knick_model"])])
+
+	return str((
+		phaenotyp.calculation_type,
+		phaenotyp.type_of_joints,
+		phaenotyp.result_precision,
+		basics.stations,
+		results.stations(),
+		quads
+		))
+
+def get_key(model, model_signature):
+	'''
+	Returns the hash of the given model.
+	:param model: Model from prepare_fea_pn or prepare_fea_fd.
+	:param model_signature: Signature from signature().
+	:return key: Hash as hex str.
+	'''
+	content = pickle.dumps((model_signature, model), protocol=4)
+	return hashlib.sha1(content).hexdigest()
+
+def lookup(frames):
+	'''
+	Is taking the models available in the cache out of basics.models
+	to be calculated by mp. The entries are kept in hits to be restored by
+	the interweave functions.
+	:param frames: Frames to be calculated as list of int.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+
+	# only entries of this lookup are restored
+	hits.clear()
+	misses.clear()
+
+	if phaenotyp.cache_size == 0:
+		return
+
+	path = directory()
+	model_signature = signature()
+
+	models = basics.models
+	frames = [str(frame) for frame in frames]
+
+	for frame in list(models):
+		if str(frame) not in frames:
+			continue
+
+		key = get_key(models[frame], model_signature)
+		path_entry = os.path.join(path, key + ".npz")
+
+		if os.path.isfile(path_entry):
+			with load(path_entry) as file:
+				hits[str(frame)] = {name: file[name] for name in file.files}
+
+			# mark as recently used
+			os.utime(path_entry)
+
+			del models[frame]
+
+			text = "model of frame " + str(frame) + " taken from cache"
+			basics.print_data(text)
+
+		# results of the fitness-only path are not complete
+		elif not basics.fitness_only:
+			misses[str(frame)] = key
+
+def restore(frame):
+	'''
+	Is passing the cached results of the frame to the store and to <Phaenotyp>.
+	Names of the entry are "store.<type>.<key>" for results of the store,
+	"data.<type>.<key>" for values stored in <Phaenotyp> and others that
+	are used by the interweave function directly.
+	:param frame: Frame as int or str.
+	:return entry: Dict with the arrays or None if not cached.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+
+	entry = hits.pop(str(frame), None)
+	if entry is None:
+		return None
+
+	for name, values in entry.items():
+		parts = name.split(".")
+
+		if parts[0] == "store":
+			results.write(parts[1], parts[2], frame, values)
+
+		elif parts[0] == "data":
+			elements = data[parts[1]]
+			for i, (id, element) in enumerate(elements.items()):
+				element[parts[2]][str(frame)] = float(values[i])
+
+	return entry
+
+def store(frame, entry):
+	'''
+	Is storing the results of a frame calculated by mp.
+	:param frame: Frame as int or str.
+	:param entry: Dict with the names and values as described in restore.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+
+	key = misses.pop(str(frame), None)
+	if key is None or phaenotyp.cache_size == 0:
+		return
+
+	path = directory()
+	os.makedirs(path, exist_ok=True)
+
+	# write to a temporary file first to avoid broken entries
+	path_entry = os.path.join(path, key + ".npz")
+	existing = os.path.isfile(path_entry)
+	path_temp = os.path.join(path, key + "_temp.npz")
+	savez(path_temp, **{name: array(values) for name, values in entry.items()})
+	os.replace(path_temp, path_entry)
+
+	limit(0 if existing else 1)
+
+def limit(added=0):
+	'''
+	Is deleting the least recently used entries if more than
+	phaenotyp.cache_size entries are stored.
+	The entries are counted in memory and the directory is only
+	listed if the count is above the limit.
+	:param added: Amount of entries added since the last call.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+
+	path = directory()
+	if not os.path.isdir(path):
+		amounts.pop(path, None)
+		return
+
+	if path in amounts:
+		amounts[path] += added
+		if amounts[path] <= phaenotyp.cache_size:
+			return
+
+	entries = []
+	for name in os.listdir(path):
+		if name.endswith(".npz") and not name.endswith("_temp.npz"):
+			path_entry = os.path.join(path, name)
+			entries.append([os.path.getmtime(path_entry), path_entry])
+
+	amount = len(entries)
+	amounts[path] = amount
+	if amount <= phaenotyp.cache_size:
+		return
+
+	entries.sort()
+	for mtime, path_entry in entries[:amount - phaenotyp.cache_size]:
+		try:
+			os.remove(path_entry)
+		except OSError:
+			pass
+
+	amounts[path] = phaenotyp.cache_size
+
+def clear():
+	'''
+	Is deleting all entries of the cache.
+	'''
+	global hits, misses
+
+	hits = {}
+	misses = {}
+	amounts.pop(directory(), None)
+
+	shutil.rmtree(directory(), ignore_errors=True)
@@ -6,11 +6,10 @@ import os
 path_addons = os.path.dirname(__file__) # path to the folder of addons
 path_phaenotyp = path_addons + "/phaenotyp"
 sys.path.append(path_addons)
-from PyNite import FEModel3D
 
-from numpy import array, empty, append, poly1d, polyfit, linalg, zeros, intersect1d, arctan, sin, cos
-from phaenotyp import basics, material, geometry
-from math import sqrt, tanh, pi, degrees, radians
+from numpy import array, empty, arange, clip, add, linalg, zeros, intersect1d, arctan, sin, cos, hypot, where, nan, flatnonzero, minimum, maximum, around, degrees, radians
+from phaenotyp import basics, material, geometry, results, cache
+from math import sqrt, tanh, pi
 
 from subprocess import Popen, PIPE
 import pickle
@@ -31,10 +30,372 @@ def check_scipy():
 	except:
 		data["scipy_available"] = False
 
+def get_coordinates(obj, mesh):
+	'''
+	Is transforming all vertices of the mesh to world space at once.
+	The result is applied to the mesh to work for edges and faces also.
+	:param obj: Evaluated object of the structure.
+	:param mesh: Mesh of the evaluated object.
+	:return coordinates: Array of the coordinates in m with shape (vertices, 3).
+	'''
+	vertices = mesh.vertices
+	coordinates = empty(len(vertices)*3)
+	vertices.foreach_get("co", coordinates)
+	coordinates = coordinates.reshape(-1, 3)
+
+	# like suggested here by Gorgious and CodeManX:
+	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
+	mat = array(obj.matrix_world)
+	coordinates = coordinates @ mat[:3, :3].T + mat[:3, 3]
+
+	# apply to all vertices to work for edges and faces also
+	vertices.foreach_set("co", coordinates.ravel())
+
+	return coordinates
+
+def shape_keys_only(data):
+	'''
+	Is checking if the structure is only changed by the chromosome.
+	In this case the mesh can be computed from the shape keys directly
+	without updating the view layer and evaluating the depsgraph.
+	:param data: Data of Phaenotyp.
+	:return: True if no modifiers, animation, parents or translations are involved.
+	'''
+	phaenotyp = bpy.context.scene.phaenotyp
+	obj = data["structure"]
+	shape_keys = obj.data.shape_keys
+
+	if not data.get("individuals"):
+		return False
+
+	if not shape_keys or not shape_keys.use_relative:
+		return False
+
+	if len(obj.modifiers) > 0 or obj.parent:
+		return False
+
+	if obj.animation_data or shape_keys.animation_data:
+		return False
+
+	# translations are changing the mesh in update_geometry_pre
+	translations = [
+		phaenotyp.assimilate_update,
+		phaenotyp.actuator_update,
+		phaenotyp.goal_update,
+		phaenotyp.wool_update,
+		phaenotyp.crown_update
+		]
+	if True in translations:
+		return False
+
+	key_blocks = shape_keys.key_blocks
+	basis = key_blocks[0]
+	for key in key_blocks[1:]:
+		if key.relative_key != basis or key.vertex_group or key.mute:
+			return False
+
+	return True
+
+def get_shape_keys_cache(obj):
+	'''
+	Is storing the basis and the deltas of all shape keys as arrays.
+	The cache is reset with each start of bruteforce, ga and gd.
+	:param obj: Object of the structure.
+	:return cache: Dict with mesh, basis, deltas, slider_min and slider_max.
+	'''
+	cache = basics.shape_keys_cache
+	if cache.get("name") == obj.name_full:
+		return cache
+
+	key_blocks = obj.data.shape_keys.key_blocks
+	amount = len(obj.data.vertices)*3
+
+	basis = empty(amount)
+	key_blocks[0].data.foreach_get("co", basis)
+
+	deltas = empty((len(key_blocks)-1, amount))
+	for i, key in enumerate(key_blocks[1:]):
+		key.data.foreach_get("co", deltas[i])
+		deltas[i] -= basis
+
+	# mesh to apply the coordinates of each frame to
+	# (the mesh of a run that has been stopped is replaced)
+	remove_shape_keys_cache()
+	cache = basics.shape_keys_cache
+	mesh = obj.data.copy()
+	mesh.name = "<Phaenotyp>shape_keys"
+
+	cache["name"] = obj.name_full
+	cache["mesh"] = mesh
+	cache["basis"] = basis
+	cache["deltas"] = deltas
+	cache["slider_min"] = array([key.slider_min for key in key_blocks[1:]])
+	cache["slider_max"] = array([key.slider_max for key in key_blocks[1:]])
+
+	return cache
+
+def remove_shape_keys_cache():
+	'''
+	Is deleting the mesh of the shape keys cache and the cache itself.
+	Is called at the end of bruteforce, ga and gd.
+	'''
+	mesh = bpy.data.meshes.get("<Phaenotyp>shape_keys")
+	if mesh:
+		bpy.data.meshes.remove(mesh)
+
+	basics.shape_keys_cache = {}
+
+def get_mesh(frame):
+	'''
+	Is getting the mesh of the structure for the given frame.
+	All vertices of the mesh are transformed to world space.
+	:param frame: Frame of the individual to apply the chromosome from.
+	:return mesh: Mesh of the structure in world space.
+	:return coordinates: Array of the coordinates in m with shape (vertices, 3).
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	obj = data["structure"]
+	individuals = data.get("individuals")
+
+	# compute the mesh from the chromosome directly
+	if shape_keys_only(data):
+		cache = get_shape_keys_cache(obj)
+		chromosome = array(individuals[str(frame)]["chromosome"])
+		chromosome = clip(chromosome, cache["slider_min"], cache["slider_max"])
+
+		# basis + deltas.T @ chromosome
+		local = cache["basis"] + chromosome @ cache["deltas"]
+		local = local.reshape(-1, 3)
+
+		mat = array(obj.matrix_world)
+		coordinates = local @ mat[:3, :3].T + mat[:3, 3]
+
+		mesh = cache["mesh"]
+		mesh.vertices.foreach_set("co", coordinates.ravel())
+		mesh.update()
+
+		# keep the shape keys of the object in sync with the individual
+		geometry.set_shape_keys(obj.data.shape_keys.key_blocks, individuals[str(frame)]["chromosome"])
+
+		return mesh, coordinates
+
+	# apply chromosome if available
+	if individuals:
+		shape_keys = obj.data.shape_keys.key_blocks
+		chromosome = individuals[str(frame)]["chromosome"]
+		geometry.set_shape_keys(shape_keys, chromosome)
+
+	# get absolute position of vertex (when using shape-keys, animation et cetera)
+	dg = bpy.context.evaluated_depsgraph_get()
+	obj = obj.evaluated_get(dg)
+
+	mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
+	coordinates = get_coordinates(obj, mesh)
+
+	return mesh, coordinates
+
+def get_lengths(coordinates, members):
+	'''
+	Is getting the length of all members at once.
+	:param coordinates: Array of the coordinates in m with shape (vertices, 3).
+	:param members: Members of the structure.
+	:return lengths: Array of the length of each member in m.
+	'''
+	vertex_0_ids = array([member["vertex_0_id"] for member in members.values()], dtype=int)
+	vertex_1_ids = array([member["vertex_1_id"] for member in members.values()], dtype=int)
+
+	v_0 = coordinates[vertex_0_ids]
+	v_1 = coordinates[vertex_1_ids]
+
+	lengths = linalg.norm(v_0 - v_1, axis=1)
+
+	return lengths
+
+def get_fingerprint_geometry(frame):
+	'''
+	Is creating a fingerprint of everything the geometry of the frame depends on.
+	:param frame: Frame to create the fingerprint for.
+	:return fingerprint: Hash as int or None if the geometry can not be reused.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+	obj = data["structure"]
+
+	# translations are changing the mesh with each update
+	translations = [
+		phaenotyp.assimilate_update,
+		phaenotyp.actuator_update,
+		phaenotyp.goal_update,
+		phaenotyp.wool_update,
+		phaenotyp.crown_update
+		]
+	if True in translations:
+		return None
+
+	chromosome = None
+	individuals = data.get("individuals")
+	if individuals:
+		chromosome = list(individuals[str(frame)]["chromosome"])
+
+	shape_keys = []
+	if obj.data.shape_keys:
+		for key in obj.data.shape_keys.key_blocks:
+			shape_keys.append(key.value)
+
+	coordinates = empty(len(obj.data.vertices)*3)
+	obj.data.vertices.foreach_get("co", coordinates)
+
+	matrix = [list(row) for row in obj.matrix_world]
+
+	fingerprint = hash((
+		frame,
+		str(chromosome),
+		str(shape_keys),
+		str(matrix),
+		coordinates.tobytes()
+		))
+
+	return fingerprint
+
+def get_fingerprint_loads():
+	'''
+	Is creating a fingerprint of the loads and boundary conditions.
+	:return fingerprint: Hash as int.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+
+	types = []
+	for id, member in data["members"].items():
+		types.append(member["type"])
+
+	fingerprint = hash((
+		str(data["supports"].to_dict()),
+		str(data["loads_v"].to_dict()),
+		str(data["loads_e"].to_dict()),
+		str(data["loads_f"].to_dict()),
+		str(types),
+		phaenotyp.psf_loads,
+		phaenotyp.type_of_joints
+		))
+
+	return fingerprint
+
+def get_fingerprint_sections(frame):
+	'''
+	Is creating a fingerprint of the sections of members and quads of the frame.
+	:param frame: Frame to create the fingerprint for.
+	:return fingerprint: Hash as int.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+
+	sections = []
+	for id, member in data["members"].items():
+		sections.append(member["Do"][str(frame)])
+		sections.append(member["Di"][str(frame)])
+
+	for id, quad in data["quads"].items():
+		sections.append(quad["thickness"][str(frame)])
+
+	fingerprint = hash((
+		str(sections),
+		phaenotyp.psf_members,
+		phaenotyp.psf_quads
+		))
+
+	return fingerprint
+
+def set_sections_pn(frame, model, lengths, areas):
+	'''
+	Is setting everything to the model that depends on the sections.
+	This is the only part to be updated if only Do, Di or thickness are changing.
+	:param frame: Frame of the model.
+	:param model: Dict with the data to create the FEModel3D of PyNite.
+	:param lengths: Array of the length of each member in m.
+	:param areas: List of the area of each quad in m².
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+	members = data["members"]
+	quads = data["quads"]
+
+	psf_members = phaenotyp.psf_members
+	psf_quads = phaenotyp.psf_quads
+
+	frame_length = 0
+	frame_weight = 0
+
+	sections = []
+	self_weight_members = []
+	for member_index, (id, member) in enumerate(members.items()):
+		sections.append([
+			member["Iy"][str(frame)], member["Iz"][str(frame)],
+			member["J"][str(frame)], member["A"][str(frame)]
+			])
+
+		# add self weight
+		weight_A = member["weight_A"][str(frame)]
+		kN = weight_A * -0.0000981
+
+		# add self weight as distributed load
+		self_weight_members.append(kN*psf_members)
+
+		# calculate lenght of parts (maybe usefull later ...)
+		length = float(lengths[member_index])
+		frame_length += length
+
+		# calculate and add weight to overall weight of structure
+		weight = length * weight_A
+		frame_weight += weight
+
+		# store in member
+		member["weight"][str(frame)] = weight
+		member["length"][str(frame)] = length
+
+	thickness = []
+	self_weight_quads = []
+	for quad_index, (id, quad) in enumerate(quads.items()):
+		rho = quad["rho"]
+
+		# get thickness of frame or first
+		t = quad["thickness"].get(str(frame))
+		thickness.append(t)
+
+		# self weight
+		area = areas[quad_index]
+		weight_A = t * rho
+		weight = weight_A * area * 10000 # in cm
+
+		# area * thickness * density * 0.25 (to distribute to all four faces) - for gravity
+		z = weight * (-0.25)
+		self_weight_quads.append(z * 0.00000981 * psf_quads) # to cm and force
+
+		quad["area"][str(frame)] = area # in m²
+		quad["weight_A"][str(frame)] = t * weight_A
+		quad["weight"][str(frame)] = weight_A * area # in kg
+
+		frame_weight += weight_A * area # in kg
+
+	model["sections"] = array(sections).reshape(-1, 4)
+	model["self_weight_members"] = array(self_weight_members)
+	model["thickness"] = array(thickness)
+	model["self_weight_quads"] = array(self_weight_quads)
+
+	data["frames"][str(frame)]["length"] = frame_length
+	data["frames"][str(frame)]["weight"] = frame_weight
+
 def prepare_fea_pn(frame):
 	'''
 	Is preparing the calculaton of the current frame for for PyNite.
-	:return model: FEModel3D function of PyNite
+	Only the data of the model is collected here. The FEModel3D of PyNite
+	is created from this data by the workers of mp to run in parallel.
+	:return model: Dict with the data to create the FEModel3D of PyNite.
 	'''
 	scene = bpy.context.scene
 	phaenotyp = scene.phaenotyp
@@ -47,17 +408,69 @@ def prepare_fea_pn(frame):
 	loads_v = data["loads_v"]
 	loads_e = data["loads_e"]
 	loads_f = data["loads_f"]
+	loads_f_edges = geometry.face_load_edges()
 
 	bpy.context.scene.frame_current = frame
-	bpy.context.view_layer.update()
+
+	# reuse the model of this frame if geometry and loads did not change
+	# (like between the passes of the sectional optimization)
+	fingerprint_geometry = get_fingerprint_geometry(frame)
+	fingerprint_loads = get_fingerprint_loads()
+
+	prepared = basics.prepared.get(frame)
+	reuse = (
+		prepared is not None
+		and fingerprint_geometry is not None
+		and prepared["geometry"] == fingerprint_geometry
+		and prepared["loads"] == fingerprint_loads
+		)
+
+	# not needed if only the shape keys are changing or the model is reused
+	if not reuse and not shape_keys_only(data):
+		bpy.context.view_layer.update()
 	
 	geometry.update_geometry_pre()
 	
-	model = FEModel3D()
+	fingerprint_sections = get_fingerprint_sections(frame)
+
+	if reuse:
+		basics.timer.start()
+
+		# only the sections need to be updated
+		model = prepared["model"]
+		if prepared["sections"] != fingerprint_sections:
+			set_sections_pn(frame, model, prepared["lengths"], prepared["areas"])
+			prepared["sections"] = fingerprint_sections
+
+		# stations and results the frame is calculated with
+		data["frames"][str(frame)]["stations"] = basics.stations
+		data["frames"][str(frame)]["fitness_only"] = basics.fitness_only
+
+		# get duration
+		text = calculation_type + " preparation for frame " + str(frame) + " reused"
+		text +=  basics.timer.stop()
+		basics.print_data(text)
+
+		basics.models[frame] = model
+		return
+
+	model = {
+		"materials": [], # name, E, G, nu, rho
+		"nodes": [], # name of each node
+		"points": None, # array of the nodes in cm
+		"supports": [], # name and the six conditions
+		"members": [], # name, node_0, node_1, material_name, tension_only, comp_only
+		"sections": None, # array of Iy, Iz, J and A of each member
+		"self_weight_members": None, # array of the distributed self weight of each member
+		"releases": phaenotyp.type_of_joints == "release_moments",
+		"quads": [], # name, v_0, v_1, v_2, v_3, material_name
+		"thickness": None, # array of the thickness of each quad
+		"self_weight_quads": None, # array of the self weight of each quad for each vertex
+		"node_loads": [], # name, direction, P
+		"member_loads": [] # name, direction, w1, w2
+		}
 	basics.timer.start()
 
-	psf_members = phaenotyp.psf_members
-	psf_quads = phaenotyp.psf_quads
 	psf_loads = phaenotyp.psf_loads
 
 	for mat in material.library:
@@ -66,92 +479,44 @@ def prepare_fea_pn(frame):
 		G = mat[3]
 		nu = None # replace later
 		rho = None # replace later
-		model.add_material(name, E, G, nu, rho)
-
-	# apply chromosome if available
-	individuals = data.get("individuals")
-	if individuals:
-		shape_keys = data["structure"].data.shape_keys.key_blocks
-		chromosome = individuals[str(frame)]["chromosome"]
-		geometry.set_shape_keys(shape_keys, chromosome)
-
-	# get absolute position of vertex (when using shape-keys, animation et cetera)
-	dg = bpy.context.evaluated_depsgraph_get()
-	obj = data["structure"].evaluated_get(dg)
+		model["materials"].append([name, E, G, nu, rho])
 
-	mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
+	# apply chromosome if available and get absolute position of all vertices in m
+	mesh, coordinates = get_mesh(frame)
 
 	vertices = mesh.vertices
-	edges = mesh.edges
-	faces = mesh.polygons
 
 	# to be collected:
 	data["frames"][str(frame)] = {}
-	frame_volume = 0
-	frame_area = 0
-	frame_length = 0
-	frame_weight = 0
-	frame_rise = 0
-	frame_span = 0
-	frame_cantilever = 0
 
-	# like suggested here by Gorgious and CodeManX:
-	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-	mat = obj.matrix_world
+	# save position before to morph with deflection afterwards
+	# (the initial positions of members and quads are derived from this)
+	data["frames"][str(frame)]["coordinates"] = coordinates.ravel().tolist()
 
-	# add nodes from vertices
-	for vertex in vertices:
-		vertex_id = vertex.index
-		name = str(vertex_id)
+	# stations and results the frame is calculated with
+	data["frames"][str(frame)]["stations"] = basics.stations
+	data["frames"][str(frame)]["fitness_only"] = basics.fitness_only
 
-		# like suggested here by Gorgious and CodeManX:
-		# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-		v = mat @ vertex.co
+	points = coordinates * 100 # convert to cm for calculation
 
-		# apply to all vertices to work for edges and faces also
-		vertex.co = v
-
-		x = v[0] * 100 # convert to cm for calculation
-		y = v[1] * 100 # convert to cm for calculation
-		z = v[2] * 100 # convert to cm for calculation
-
-		# only create Node if needed for the model
-		create = False
-		for member_id, member in members.items():
-			if vertex_id in [member["vertex_0_id"], member["vertex_1_id"]]:
-				create = True
-				break
-
-		for quad_id, quad in quads.items():
-			if vertex_id in quad["vertices_ids_structure"]:
-				create = True
-				break
-
-		if create:
-			model.add_node(name, x,y,z)
+	# only create Node if needed for the model
+	# (ids of all vertices used by members or quads are collected in set_member and set_quad)
+	nodes_ids = basics.sorted_keys(data["nodes"])
+	model["nodes"] = [str(vertex_id) for vertex_id in nodes_ids]
+	model["points"] = points[nodes_ids]
 
 	# define support
 	for id, support in supports.items():
-		model.def_support(id, support[0], support[1], support[2], support[3], support[4], support[5])
+		model["supports"].append([id, support[0], support[1], support[2], support[3], support[4], support[5]])
+
+	# length of all members
+	lengths = get_lengths(coordinates, members)
 
 	# create members
 	for id, member in members.items():
 		vertex_0_id = member["vertex_0_id"]
 		vertex_1_id = member["vertex_1_id"]
 
-		v_0 = vertices[vertex_0_id].co
-		v_1 = vertices[vertex_1_id].co
-
-		# save initial_positions to mix with deflection
-		initial_positions = []
-		for i in range(11):
-			position = (v_0*(i) + v_1*(10-i))*0.1
-			x = position[0]
-			y = position[1]
-			z = position[2]
-			initial_positions.append([x,y,z])
-		member["initial_positions"][str(frame)] = initial_positions
-
 		node_0 = str(vertex_0_id)
 		node_1 = str(vertex_1_id)
 		material_name = member["material_name"]
@@ -168,39 +533,10 @@ def prepare_fea_pn(frame):
 			tension_only = False
 			comp_only = True
 
-		model.add_member(
-			id, node_0, node_1, material_name,
-			member["Iy"][str(frame)], member["Iz"][str(frame)],
-			member["J"][str(frame)], member["A"][str(frame)],
-			tension_only=tension_only, comp_only=comp_only,
-			)
-
-		# release Moments
-		if phaenotyp.type_of_joints == "release_moments":
-			model.def_releases(id,
-				False, False, False, False, True, True,
-				False, False, False, False, True, True)
-
-		# add self weight
-		weight_A = member["weight_A"][str(frame)]
-		kN = weight_A * -0.0000981
-
-		# add self weight as distributed load
-		model.add_member_dist_load(id, "FZ", kN*psf_members, kN*psf_members)
-
-		# calculate lenght of parts (maybe usefull later ...)
-		length = (v_0 - v_1).length
-		frame_length += length
-
-		# calculate and add weight to overall weight of structure
-		weight = length * weight_A
-		frame_weight += weight
-
-		# store in member
-		member["weight"][str(frame)] = weight
-		member["length"][str(frame)] = length
+		model["members"].append([id, node_0, node_1, material_name, tension_only, comp_only])
 
 	# create quads
+	areas = []
 	for id, quad in quads.items():
 		E = quad["E"]
 		G = quad["G"]
@@ -215,65 +551,40 @@ def prepare_fea_pn(frame):
 			"nu" +  "_" +
 			"rho")
 
-		if material_name not in model.Materials:
-			model.add_material(material_name, E, G, nu, rho)
+		if material_name not in [mat[0] for mat in model["materials"]]:
+			model["materials"].append([material_name, E, G, nu, rho])
 
 		vertex_ids = quad["vertices_ids_structure"]
 
-		# get thickness of frame or first
-		t = quad["thickness"].get(str(frame))
-
 		v_0 = str(vertex_ids[0])
 		v_1 = str(vertex_ids[1])
 		v_2 = str(vertex_ids[2])
 		v_3 = str(vertex_ids[3])
 
-		model.add_quad(id, v_0, v_1, v_2, v_3, t, material_name, kx_mod=1.0, ky_mod=1.0)
-
-		# save position before to morph with deflection afterwards
-		initial_positions = [
-			vertices[vertex_ids[0]].co,
-			vertices[vertex_ids[1]].co,
-			vertices[vertex_ids[2]].co,
-			vertices[vertex_ids[3]].co,
-			]
-		quad["initial_positions"][str(frame)] = initial_positions
+		model["quads"].append([id, v_0, v_1, v_2, v_3, material_name])
 
-		# self weight
+		# area for self weight
 		face = data["structure"].data.polygons[int(id)]
-		area = face.area
-		weight_A = t * rho
-		weight = weight_A * area * 10000 # in cm
-		for vertex_id in quads[id]["vertices_ids_structure"]:
-			vertex_id = str(vertex_id)
-			# area * thickness * density * 0.25 (to distribute to all four faces) - for gravity
-			z = weight * (-0.25)
-			model.add_node_load(vertex_id, 'FZ', z * 0.00000981 * psf_quads) # to cm and force
-
-		quad["area"][str(frame)] = area # in m²
-		quad["weight_A"][str(frame)] = t * weight_A
-		quad["weight"][str(frame)] = weight_A * area # in kg
-
-		frame_weight += weight_A * area # in kg
+		areas.append(face.area)
 
 	# add loads
 	for id, load in loads_v.items():
-		model.add_node_load(id, 'FX', load[0] * psf_loads)
-		model.add_node_load(id, 'FY', load[1] * psf_loads)
-		model.add_node_load(id, 'FZ', load[2] * psf_loads)
+		model["node_loads"].append([id, 'FX', load[0] * psf_loads])
+		model["node_loads"].append([id, 'FY', load[1] * psf_loads])
+		model["node_loads"].append([id, 'FZ', load[2] * psf_loads])
 		
-		model.add_node_load(id, 'MX', load[3] * psf_loads)
-		model.add_node_load(id, 'MY', load[4] * psf_loads)
-		model.add_node_load(id, 'MZ', load[5] * psf_loads)
+		model["node_loads"].append([id, 'MX', load[3] * psf_loads])
+		model["node_loads"].append([id, 'MY', load[4] * psf_loads])
+		model["node_loads"].append([id, 'MZ', load[5] * psf_loads])
 
 	for id, load in loads_e.items():
-		model.add_member_dist_load(id, 'FX', load[0]*0.01 * psf_loads, load[0]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'FY', load[1]*0.01 * psf_loads, load[1]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'FZ', load[2]*0.01 * psf_loads, load[2]*0.01 * psf_loads) # m to cm
+		model["member_loads"].append([id, 'FX', load[0]*0.01 * psf_loads, load[0]*0.01 * psf_loads]) # m to cm
+		model["member_loads"].append([id, 'FY', load[1]*0.01 * psf_loads, load[1]*0.01 * psf_loads]) # m to cm
+		model["member_loads"].append([id, 'FZ', load[2]*0.01 * psf_loads, load[2]*0.01 * psf_loads]) # m to cm
 		
-		model.add_member_dist_load(id, 'Fx', load[3]*0.01 * psf_loads, load[3]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'Fy', load[4]*0.01 * psf_loads, load[4]*0.01 * psf_loads) # m to cm
-		model.add_member_dist_load(id, 'Fz', load[5]*0.01 * psf_loads, load[5]*0.01 * psf_loads) # m to cm
+		model["member_loads"].append([id, 'Fx', load[3]*0.01 * psf_loads, load[3]*0.01 * psf_loads]) # m to cm
+		model["member_loads"].append([id, 'Fy', load[4]*0.01 * psf_loads, load[4]*0.01 * psf_loads]) # m to cm
+		model["member_loads"].append([id, 'Fz', load[5]*0.01 * psf_loads, load[5]*0.01 * psf_loads]) # m to cm
 
 	for id, load in loads_f.items():
 		# apply force to quad if a quad is available
@@ -311,9 +622,9 @@ def prepare_fea_pn(frame):
 				area_load = load_area_z * area
 				z += area_load * 0.25 # divided by four points of each quad
 				
-				model.add_node_load(vertex_id, 'FX', x * psf_loads) # to cm
-				model.add_node_load(vertex_id, 'FY', y * psf_loads) # to cm
-				model.add_node_load(vertex_id, 'FZ', z * psf_loads) # to cm
+				model["node_loads"].append([vertex_id, 'FX', x * psf_loads]) # to cm
+				model["node_loads"].append([vertex_id, 'FY', y * psf_loads]) # to cm
+				model["node_loads"].append([vertex_id, 'FZ', z * psf_loads]) # to cm
 				
 		# apply force to members
 		else:
@@ -356,45 +667,52 @@ def prepare_fea_pn(frame):
 
 			# i is the id within the class (0, 1, 3 and maybe more)
 			# edge_id is the id of the edge in the mesh -> the member
-			for i, edge_key in enumerate(edge_keys):
-				# get name <---------------------------------------- maybe better method?
-				for edge in edges:
-					if edge.vertices[0] in edge_key:
-						if edge.vertices[1] in edge_key:
-							name = str(edge.index)
+			for i, edge_id in enumerate(loads_f_edges[id]):
+				name = str(edge_id)
 
 				# edge_load_normal <--------------------------------- to be tested / checked
 				x = edge_load_normal[i] * normal[0]
 				y = edge_load_normal[i] * normal[1]
 				z = edge_load_normal[i] * normal[2]
 
-				model.add_member_dist_load(name, 'FX', x, x)
-				model.add_member_dist_load(name, 'FY', y, y)
-				model.add_member_dist_load(name, 'FZ', z, z)
+				model["member_loads"].append([name, 'FX', x, x])
+				model["member_loads"].append([name, 'FY', y, y])
+				model["member_loads"].append([name, 'FZ', z, z])
 
 				# edge_load_projected
 				z = edge_load_projected[i]
-				model.add_member_dist_load(name, 'FZ', z, z)
+				model["member_loads"].append([name, 'FZ', z, z])
 
 				# edge_load_area_z
 				z = edge_load_area_z[i]
-				model.add_member_dist_load(name, 'FZ', z, z)
+				model["member_loads"].append([name, 'FZ', z, z])
+
+	# sections, self weight, length and weight
+	set_sections_pn(frame, model, lengths, areas)
 
 	# store frame based data
-	data["frames"][str(frame)]["volume"] = geometry.volume(mesh)
-	data["frames"][str(frame)]["area"] = geometry.area(faces)
-	data["frames"][str(frame)]["length"] = frame_length
-	data["frames"][str(frame)]["weight"] = frame_weight
-	data["frames"][str(frame)]["rise"] = geometry.rise(vertices)
-	data["frames"][str(frame)]["span"] = geometry.span(vertices, supports)
-	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(vertices, supports)
+	supports_ids = [int(id) for id in supports.keys()]
+	triangles = geometry.triangles(mesh)
+	frame_metrics = geometry.metrics(coordinates, triangles, supports_ids)
+	for key, value in frame_metrics.items():
+		data["frames"][str(frame)][key] = value
 
 	# get duration
 	text = calculation_type + " preparation for frame " + str(frame) + " done"
 	text +=  basics.timer.stop()
 	basics.print_data(text)	
 
-	# created a model object of PyNite and add to dict
+	# store to be reused if only the sections are changing
+	basics.prepared[frame] = {
+		"geometry": fingerprint_geometry,
+		"loads": fingerprint_loads,
+		"sections": fingerprint_sections,
+		"model": model,
+		"lengths": lengths,
+		"areas": areas
+		}
+
+	# data of the model of PyNite and add to dict
 	basics.models[frame] = model
 
 def prepare_fea_fd(frame):
@@ -408,7 +726,10 @@ def prepare_fea_fd(frame):
 	data = scene["<Phaenotyp>"]
 
 	bpy.context.scene.frame_current = frame
-	bpy.context.view_layer.update()
+
+	# not needed if only the shape keys are changing
+	if not shape_keys_only(data):
+		bpy.context.view_layer.update()
 	
 	geometry.update_geometry_pre()
 	
@@ -417,60 +738,24 @@ def prepare_fea_fd(frame):
 	psf_members = phaenotyp.psf_members
 	psf_loads = phaenotyp.psf_loads
 
-	# apply chromosome if available
-	individuals = data.get("individuals")
-	if individuals:
-		shape_keys = data["structure"].data.shape_keys.key_blocks
-		chromosome = individuals[str(frame)]["chromosome"]
-		geometry.set_shape_keys(shape_keys, chromosome)
-
-	# get absolute position of vertex (when using shape-keys, animation et cetera)
-	dg = bpy.context.evaluated_depsgraph_get()
-	obj = data["structure"].evaluated_get(dg)
-
-	mesh = obj.to_mesh(preserve_all_data_layers=True, depsgraph=dg)
+	# apply chromosome if available and get absolute position of all vertices in m
+	mesh, coordinates = get_mesh(frame)
 
 	vertices = mesh.vertices
-	edges = mesh.edges
-	faces = mesh.polygons
 
 	# to be collected:
 	data["frames"][str(frame)] = {}
-	frame_volume = 0
-	frame_area = 0
+
+	# save position before to morph with deflection afterwards
+	# (the initial positions of members and quads are derived from this)
+	data["frames"][str(frame)]["coordinates"] = coordinates.ravel().tolist()
 	frame_length = 0
 	frame_weight = 0
-	frame_rise = 0
-	frame_span = 0
-	frame_cantilever = 0
 
 	# to sum up loads
-	forces = []
-	for i in range(len(vertices)):
-		forces.append(array([0.0, 0.0, 0.0]))
-
-	# like suggested here by Gorgious and CodeManX:
-	# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-	mat = obj.matrix_world
+	forces = zeros((len(vertices), 3))
 
-	# add nodes from vertices
-	points = []
-	for vertex in vertices:
-		# like suggested here by Gorgious and CodeManX:
-		# https://blender.stackexchange.com/questions/6155/how-to-convert-coordinates-from-vertex-to-world-space
-		v = mat @ vertex.co
-
-		# apply to all vertices to work for edges and faces also
-		vertex.co = v
-
-		x = v[0] * 100 # convert to cm for calculation
-		y = v[1] * 100 # convert to cm for calculation
-		z = v[2] * 100 # convert to cm for calculation
-
-		pos = [x,y,z]
-		points.append(pos)
-
-	points_array = array(points)
+	points_array = coordinates * 100 # convert to cm for calculation
 
 	# define support
 	fixed = []
@@ -481,71 +766,76 @@ def prepare_fea_fd(frame):
 
 	supports_ids = fixed
 
+	# to look up supports by vertex_id
+	supports_mask = zeros(len(vertices), dtype=bool)
+	supports_mask[supports_ids] = True
+
 	# create members
 	members = data["members"]
 	keys = []
-	lenghtes = []
-	for id, member in members.items():
+	weights_A = []
+
+	# length of all members
+	lenghtes = get_lengths(coordinates, members)
+
+	for member_index, (id, member) in enumerate(members.items()):
 		vertex_0_id = member["vertex_0_id"]
 		vertex_1_id = member["vertex_1_id"]
 
 		key = [vertex_0_id, vertex_1_id]
 		keys.append(key)
 
-		v_0 = vertices[vertex_0_id].co
-		v_1 = vertices[vertex_1_id].co
-
-		# save initial_positions to mix with deflection
-		initial_positions = []
-		for position in [v_0, v_1]:
-			x = position[0]
-			y = position[1]
-			z = position[2]
-			initial_positions.append([x,y,z])
-		member["initial_positions"][str(frame)] = initial_positions
-
 		# add self weight
 		weight_A = member["weight_A"][str(frame)]
-		kN = weight_A * -0.0000981
+		weights_A.append(weight_A)
 
 		# calculate lenght of parts (maybe usefull later ...)
-		length = (v_0 - v_1).length
+		length = float(lenghtes[member_index])
 		frame_length += length
 
 		# calculate and add weight to overall weight of structure
 		weight = length * weight_A
 		frame_weight += weight
 
-		# for calculation
-		lenghtes.append(length)
-
-		# add self weight
-		self_weight = kN * length * 100 * psf_members
-		forces[vertex_0_id] += array([0.0, 0.0, self_weight*0.5])
-		forces[vertex_1_id] += array([0.0, 0.0, self_weight*0.5])
-
 		# store in member
 		member["weight"][str(frame)] = weight
 		member["length"][str(frame)] = length
 
-	edges_array = array(keys)
+	edges_array = array(keys, dtype=int).reshape(-1, 2)
+	vertex_0_ids = edges_array[:, 0]
+	vertex_1_ids = edges_array[:, 1]
+
+	# to get the index of the member in the arrays by its id
+	members_index = {}
+	for member_index, id in enumerate(members.keys()):
+		members_index[id] = member_index
+
+	# add self weight
+	self_weights = array(weights_A) * -0.0000981 * lenghtes * 100 * psf_members
+	add.at(forces[:, 2], vertex_0_ids, self_weights*0.5)
+	add.at(forces[:, 2], vertex_1_ids, self_weights*0.5)
+
+	# collect all loads to add them at once
+	loads_ids = []
+	loads_forces = []
 
 	# add loads
 	loads_v = data["loads_v"]
 	for id, load in loads_v.items():
-		forces[int(id)] += array([load[0]*100*psf_loads, load[1]*100*psf_loads, load[2]*100*psf_loads])
+		loads_ids.append(int(id))
+		loads_forces.append([load[0]*100*psf_loads, load[1]*100*psf_loads, load[2]*100*psf_loads])
 
 	loads_e = data["loads_e"]
 	for id, load in loads_e.items():
-		member = members[id]
-		vertex_0_id = member["vertex_0_id"]
-		vertex_1_id = member["vertex_1_id"]
-		length = lenghtes[int(id)]
+		member_index = members_index[id]
+		length = lenghtes[member_index]
 		f = length * 0.5 * 100 * psf_loads # half of the member, m to cm + psf
-		forces[int(vertex_0_id)] += array([load[0]*f, load[1]*f, load[2]*f])
-		forces[int(vertex_1_id)] += array([load[0]*f, load[1]*f, load[2]*f])
+		for vertex_id in [vertex_0_ids[member_index], vertex_1_ids[member_index]]:
+			loads_ids.append(vertex_id)
+			loads_forces.append([load[0]*f, load[1]*f, load[2]*f])
 
 	loads_f = data["loads_f"]
+	loads_f_edges = geometry.face_load_edges()
 	for id, load in loads_f.items():
 		# int(id), otherwise crashing Speicherzugriffsfehler
 		face = data["structure"].data.polygons[int(id)]
@@ -585,56 +875,45 @@ def prepare_fea_fd(frame):
 
 		# i is the id within the class (0, 1, 3 and maybe more)
 		# edge_id is the id of the edge in the mesh -> the member
-		for i, edge_key in enumerate(edge_keys):
-			for edge in edges:
-				if edge.vertices[0] in edge_key:
-					if edge.vertices[1] in edge_key:
-						id = edge.index
-
+		for i, id in enumerate(loads_f_edges[id]):
 			x = edge_load_normal[i] * normal[0]
 			y = edge_load_normal[i] * normal[1]
 			z = edge_load_normal[i] * normal[2]
 
-			member = members[str(id)]
-			vertex_0_id = member["vertex_0_id"]
-			vertex_1_id = member["vertex_1_id"]
-			length = lenghtes[int(id)]
-			f = length * 0.5 * 100 # half of the member, m to cm
-			forces[int(vertex_0_id)] += array([x*f, y*f, z*f])
-			forces[int(vertex_1_id)] += array([x*f, y*f, z*f])
+			# edge_load_projected and edge_load_area_z
+			z += edge_load_projected[i] + edge_load_area_z[i]
 
-			# edge_load_projected
-			z = edge_load_projected[i]
-			forces[int(vertex_0_id)] += array([0.0, 0.0, z*f])
-			forces[int(vertex_1_id)] += array([0.0, 0.0, z*f])
+			member_index = members_index[str(id)]
+			length = lenghtes[member_index]
+			f = length * 0.5 * 100 # half of the member, m to cm
+			for vertex_id in [vertex_0_ids[member_index], vertex_1_ids[member_index]]:
+				loads_ids.append(vertex_id)
+				loads_forces.append([x*f, y*f, z*f])
 
-			# edge_load_area_z
-			z = edge_load_area_z[i]
-			forces[int(vertex_0_id)] += array([0.0, 0.0, z*f])
-			forces[int(vertex_1_id)] += array([0.0, 0.0, z*f])
+	if len(loads_ids) > 0:
+		add.at(forces, loads_ids, loads_forces)
 
 	# move all forces from the supports to the next load
 	# (is ignored if the both vertices are supports)
-	for id, member in members.items():
-		vertex_0_id = member["vertex_0_id"]
-		vertex_1_id = member["vertex_1_id"]
+	support_0 = supports_mask[vertex_0_ids]
+	support_1 = supports_mask[vertex_1_ids]
 
-		if vertex_0_id in supports_ids:
-			forces[int(vertex_1_id)] += forces[int(vertex_0_id)]
+	from_0 = support_0 & ~support_1
+	from_1 = support_1 & ~support_0
 
-		if vertex_1_id in supports_ids:
-			forces[int(vertex_0_id)] += forces[int(vertex_1_id)]
+	add.at(forces, vertex_1_ids[from_0], forces[vertex_0_ids[from_0]])
+	add.at(forces, vertex_0_ids[from_1], forces[vertex_1_ids[from_1]])
 
-	forces_array = array(forces)
+	forces_array = forces
 
 	# store frame based data
-	data["frames"][str(frame)]["volume"] = geometry.volume(mesh)
-	data["frames"][str(frame)]["area"] = geometry.area(faces)
 	data["frames"][str(frame)]["length"] = frame_length
 	data["frames"][str(frame)]["weight"] = frame_weight
-	data["frames"][str(frame)]["rise"] = geometry.rise(vertices)
-	data["frames"][str(frame)]["span"] = geometry.span(vertices, supports)
-	data["frames"][str(frame)]["cantilever"] = geometry.cantilever(vertices, supports)
+
+	triangles = geometry.triangles(mesh)
+	frame_metrics = geometry.metrics(coordinates, triangles, supports_ids)
+	for key, value in frame_metrics.items():
+		data["frames"][str(frame)][key] = value
 
 	# get duration
 	text = calculation_type + " preparation for frame " + str(frame) + " done"
@@ -651,6 +930,11 @@ def run_mp(models):
 	:param models: Needs a list of models from any prepare_fea as dict with frame as key.
 	:return models: Returns the calculated models as dict with the frame as key.
 	'''
+	# all models are taken from the cache
+	if len(models) == 0:
+		basics.feas = {}
+		return
+
 	# get pathes
 	path_addons = os.path.dirname(__file__) # path to the folder of addons
 	path_script = path_addons + "/mp.py"
@@ -686,13 +970,446 @@ def run_mp(models):
 			nline = line.rstrip()
 			#print(nline.decode("utf8"), end = "\r\n",flush =True) # yield line
 
-	# get models back from mp
-	path_import = directory_blend + "/Phaenotyp-return_mp.p"
-	file = open(path_import, 'rb')
-	imported_models = pickle.load(file)
-	file.close()
+	# get models back from mp
+	path_import = directory_blend + "/Phaenotyp-return_mp.p"
+	file = open(path_import, 'rb')
+	imported_models = pickle.load(file)
+	file.close()
+
+	basics.feas = imported_models
+
+def get_deflections_pn(rotations, nodes_i, lengths, displacements):
+	'''
+	Is calculating the deflected stations of all members at once.
+	Based on VisDeformedMember of PyNite: https://github.com/JWock82/PyNite
+	:param rotations: Direction cosines of the local axes as array with shape (members, 3, 3).
+	:param nodes_i: Position of the i-nodes in cm as array with shape (members, 3).
+	:param lengths: Length of the members in cm as array with shape (members).
+	:param displacements: Local dx, dy and dz at the stations as array with shape (members, stations, 3).
+	:return deflections: Deflected stations in m as array with shape (members, stations, 3).
+	'''
+	scale_factor = 10.0
+	stations = displacements.shape[1]
+
+	# magnified displacements along the local axes
+	local = displacements * scale_factor
+	local[:, :, 0] += lengths[:, None] * arange(stations) / (stations-1)
+
+	# to global coordinates and from cm to m
+	deflections = nodes_i[:, None, :] + local @ rotations
+
+	return deflections * 0.01
+
+def interpolate_stations(values, amount):
+	'''
+	Is interpolating results linear between the stations of the members.
+	:param values: Results as array with shape (members, stations) or (members, stations, 3).
+	:param amount: Number of stations to interpolate to.
+	:return values: Results as array with shape (members, amount) or (members, amount, 3).
+	'''
+	stations = values.shape[1]
+
+	# position of the new stations between the given ones
+	position = arange(amount) * (stations-1) / (amount-1)
+	lower = minimum(position.astype(int), stations-2)
+	ratio = (position - lower).reshape((1, amount) + (1,)*(values.ndim-2))
+
+	return values[:, lower]*(1-ratio) + values[:, lower+1]*ratio
+
+def get_acceptable_sigma_buckling(elements, lamda, slender, acceptable_sigma):
+	'''
+	Returns the acceptable stresses with buckling of members or quads.
+	The curve is evaluated for all slender elements with the same knick_model at once.
+	:param elements: Members or quads from <Phaenotyp>.
+	:param lamda: Slenderness as array with shape (elements).
+	:param slender: Indices of the elements with buckling as array.
+	:param acceptable_sigma: Acceptable stresses without buckling as array with shape (elements).
+	:return acceptable_sigma_buckling: Array with shape (elements).
+	'''
+	acceptable_sigma_buckling = acceptable_sigma.astype(float)
+
+	ids = list(elements.keys())
+	knick_models = [tuple(elements[ids[i]]["knick_model"]) for i in slender]
+	for knick_model in set(knick_models):
+		group = slender[array([kn == knick_model for kn in knick_models])]
+		function_to_run = material.buckling_curve(knick_model)
+		acceptable_sigma_buckling[group] = function_to_run(minimum(lamda[group], 250))
+
+	return acceptable_sigma_buckling
+
+def get_principal_stresses(s_x, s_y, T_xy):
+	'''
+	Returns the principal stresses of one side of all quads.
+	based on:
+	https://www.umwelt-campus.de/fileadmin/Umwelt-Campus/User/TPreussler/Download/Festigkeitslehre/Foliensaetze/01_Spannungszustand.pdf
+	https://technikermathe.de/tm2-hauptnormalspannung-berechnen
+	:param s_x: Stresses in x as array with shape (quads).
+	:param s_y: Stresses in y as array with shape (quads).
+	:param T_xy: Shear stresses as array with shape (quads).
+	:return s_1, s_2, alpha: Principal stresses sorted by the highest difference to zero and angle in degrees.
+	'''
+	difference = s_x - s_y
+
+	# avoid div zero
+	alpha = where(difference == 0, 0, degrees(0.5 * arctan((2 * T_xy) / where(difference == 0, 1, difference))))
+
+	radius = hypot(difference/2, T_xy)
+	s_1 = (s_x + s_y)/2 + radius
+	s_2 = (s_x + s_y)/2 - radius
+	s_xi = (s_x + s_y)/2 + difference/2 * cos(2*radians(alpha)) + T_xy * sin(2*radians(alpha))
+
+	first = abs(s_1) > abs(s_2)
+	s_1, s_2 = where(first, s_1, s_2), where(first, s_2, s_1)
+
+	alpha = where(abs(around(s_1, 2)) == abs(around(s_xi, 2)), alpha + 90, alpha)
+
+	return s_1, s_2, alpha
+
+def get_long_stresses(axial, moment_y, moment_z, A, Wy):
+	'''
+	Is calculating the longitudinal stresses of all members at once.
+	:param axial: Axial forces as array with shape (members, stations).
+	:param moment_y: Moments in y as array with shape (members, stations).
+	:param moment_z: Moments in z as array with shape (members, stations).
+	:param A: Areas as array with shape (members, 1).
+	:param Wy: Moduli as array with shape (members, 1).
+	:return moment_h, long_stress, max_long_stress: Arrays with shape (members, stations) and (members).
+	'''
+	moment_h = hypot(moment_y, moment_z)
+	long_stress = where(axial > 0, axial/A + moment_h/Wy, axial/A - moment_h/Wy)
+
+	# get max stress of the beam
+	# (can be positive or negative)
+	smallest_minus = long_stress.min(axis=1)
+	biggest_plus = long_stress.max(axis=1)
+	max_long_stress = where(abs(smallest_minus) > abs(biggest_plus), smallest_minus, biggest_plus) #  -> is working as fitness
+
+	return moment_h, long_stress, max_long_stress
+
+def get_strain_energies(axial, moment_y, moment_z, L, E, A, Wy, Do):
+	'''
+	Is calculating the strain energies of all members at once.
+	Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
+	:param axial: Axial forces as array with shape (members, stations).
+	:param moment_y: Moments in y as array with shape (members, stations).
+	:param moment_z: Moments in z as array with shape (members, stations).
+	:param L: Lengths as array with shape (members).
+	:param E, A, Wy, Do: Materials and sections as arrays with shape (members, 1).
+	:return normal_energy, moment_energy: Arrays with shape (members, stations-1).
+	'''
+	# get the energie at each station except the last one for each section
+	section = L[:, None]/(axial.shape[1]-1)
+
+	# Berechnung der strain_energy für Normalkraft
+	normalkraft_energie = (axial[:, :-1]**2)*section/(2*E*A)
+
+	# Berechnung der strain_energy für Moment
+	moment_hq = moment_y[:, :-1]**2 + moment_z[:, :-1]**2
+	moment_energie = (moment_hq * section) / (E * Wy * Do)
+
+	return normalkraft_energie, moment_energie
+
+def interweave_quads_pn(frame, model):
+	'''
+	Is integrating the results of all quads of PyNite.
+	All quads are calculated at once as arrays with shape (quads).
+	:param frame: Frame as str.
+	:param model: Model calculated by PyNite.
+	:return entry: Dict with the compact results to be cached.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	quads = data["quads"]
+
+	# compact results to be cached
+	entry = {}
+
+	nodes = model.Nodes
+
+	# read results from PyNite
+	shear = []
+	moment = []
+	membrane = []
+	for id in quads:
+		result = model.Quads[id]
+		shear.append([float(value) for value in result.shear()[0:2]])
+		moment.append([float(value) for value in result.moment()[0:3]])
+		membrane.append([float(value) for value in result.membrane()[0:3]])
+
+	shear = array(shear)
+	moment = array(moment)
+	membrane = array(membrane)
+
+	quad_results = {}
+
+	# to get the initial positions
+	coordinates = geometry.frame_coordinates(frame)
+	vertex_ids = results.vertices("quads")
+
+	# get deflection
+	# (only the vertices of the quads are needed)
+	node_displacements = zeros((len(coordinates), 3))
+	for vertex_id in set(vertex_ids.flatten().tolist()):
+		node = nodes[str(vertex_id)]
+		node_displacements[vertex_id] = [node.DX["Combo 1"], node.DY["Combo 1"], node.DZ["Combo 1"]]
+
+	# add deflection to initial position
+	vertices = coordinates[vertex_ids] # shape (quads, 4, 3)
+	quad_results["deflection"] = vertices + node_displacements[vertex_ids]*0.1
+
+	# get average lengthes to calculate force by unit
+	x_0 = vertices[:, 1] - vertices[:, 0] # first edge x
+	x_1 = vertices[:, 3] - vertices[:, 2] # second edge x
+	y_0 = vertices[:, 2] - vertices[:, 1] # first edge y
+	y_1 = vertices[:, 3] - vertices[:, 0] # second edge y
+
+	# as descripted in quad example
+	length_x = (linalg.norm(x_0, axis=1) + linalg.norm(x_1, axis=1)) * 0.5 * 100 # to convert into cm
+	length_y = (linalg.norm(y_0, axis=1) + linalg.norm(y_1, axis=1)) * 0.5 * 100 # to convert into cm
+
+	# Schnittkräfte in unit-cm
+	shear_x = shear[:, 0] # Querkraft in kN  # für Darstellung
+	shear_y = shear[:, 1] # Querkraft in kN  # für Darstellung
+
+	moment_x = moment[:, 0]  # Moment in kNcm   # für Darstellung
+	moment_y = moment[:, 1]  # Moment in kNcm   # für Darstellung
+	moment_xy = moment[:, 2]  # Drillmoment in kNcm   # für Darstellung
+
+	thickness = array([quad["thickness"][frame] for quad in quads.values()])
+
+	membrane_x = membrane[:, 0] * thickness  # Spannung in kN/cm   # für Darstellung
+	membrane_y = membrane[:, 1] * thickness  # Spannung in kN/cm   # für Darstellung
+	membrane_xy = membrane[:, 2] * thickness  #  Schubspannung in kN/cm   # für Darstellung
+
+	# die Querschnittswerte sind jetzt auf 1 cm Schalenbreite bezogen
+	# area of the section, not the face
+	A = thickness * 1 # Dicke in cm² pro cm Schalenbreite
+
+	# für buckling
+	ir = thickness * 0.28867 # in cm  - Breite kürzt sich weg, es bleibt 1/wurzel aus 12
+	# modulus from the moments of area
+	Wy = (thickness**2)/6  # auf 1 cm Schalenbreite
+
+	# Spannungen in x und y Richrtung an den Oberflächen 1 und 2
+	s_x_1 = membrane_x - moment_x/Wy  # für Darstellung
+	s_x_2 = membrane_x + moment_x/Wy  # für Darstellung
+	s_y_1 = membrane_y - moment_y/Wy  # für Darstellung
+	s_y_2 = membrane_y + moment_y/Wy  # für Darstellung
+	T_xy_1 = membrane_xy -  moment_xy/Wy # am Plattenrand, für Darstellung
+	T_xy_2 = membrane_xy +  moment_xy/Wy # am Plattenrand, für Darstellung
+
+	# Hauptspannungen 1 und 2 an den Oberflächen 1 und 2
+	s_1_1, s_2_1, alpha_1 = get_principal_stresses(s_x_1, s_y_1, T_xy_1)
+	s_1_2, s_2_2, alpha_2 = get_principal_stresses(s_x_2, s_y_2, T_xy_2)
+
+	# Vergleichsspannung an den beiden Oberflächen 1 und 2
+	sigmav1 = (s_x_1**2 + s_y_1**2 - s_x_1*s_y_1 + 3*T_xy_1**2)**0.5
+	sigmav2 = (s_x_2**2 + s_y_2**2 - s_x_2*s_y_2 + 3*T_xy_2**2)**0.5
+
+	# der größere Wert wird für die weitere Optimierung verwendet
+	sigmav = maximum(sigmav1, sigmav2)
+
+	acceptable_sigma = array([quad["acceptable_sigma"] for quad in quads.values()])
+	acceptable_sigmav = array([quad["acceptable_sigmav"] for quad in quads.values()])
+
+	# check overstress and add 1.05 safety factor
+	safety_factor = 1.05
+	overstress = sigmav > safety_factor*acceptable_sigmav
+
+	# buckling in x- und y-Richtung
+	# es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
+	acceptable_sigma_buckling = []
+	for membrane_force, length in [[membrane_x, length_x], [membrane_y, length_y]]:
+		compressed = membrane_force < 0 # nur für Druckstäbe, axial kann nicht flippen?
+		lamda = where(compressed, length*5/ir, nan)
+
+		# für lamda < 20 (kurze Träger) gelten die default-Werte
+		slender = flatnonzero(compressed & (lamda > 20))
+		acceptable_sigma_buckling_direction = get_acceptable_sigma_buckling(quads, lamda, slender, acceptable_sigma)
+
+		overstress[slender] |= lamda[slender] > 250 # Schlankheit zu schlank
+		overstress[slender] |= safety_factor*abs(acceptable_sigma_buckling_direction[slender]) > abs(sigmav[slender]) # Sigma
+
+		acceptable_sigma_buckling.append(acceptable_sigma_buckling_direction)
+
+	# lamda of y-direction is kept (nan if not compressed in y)
+	quad_results["lamda"] = lamda
+
+	# das kleinere ist maßgbend
+	quad_results["acceptable_sigma_buckling"] = minimum(acceptable_sigma_buckling[0], acceptable_sigma_buckling[1])
+
+	overstress |= abs(sigmav) > safety_factor*acceptable_sigma
+
+	# Ausnutzungsgrad
+	utilization = abs(sigmav / quad_results["acceptable_sigma_buckling"])
+
+	# save to dict
+	quad_results["shear_x"] = shear_x
+	quad_results["shear_y"] = shear_y
+
+	quad_results["moment_x"] = moment_x
+	quad_results["moment_y"] = moment_y
+	quad_results["moment_xy"] = moment_xy
+
+	quad_results["membrane_x"] = membrane_x
+	quad_results["membrane_y"] = membrane_y
+	quad_results["membrane_xy"] = membrane_xy
+
+	quad_results["length_x"] = length_x
+	quad_results["length_y"] = length_y
+
+	quad_results["sigmav"] = sigmav
+
+	quad_results["s_x_1"] = s_x_1
+	quad_results["s_x_2"] = s_x_2
+	quad_results["s_y_1"] = s_y_1
+	quad_results["s_y_2"] = s_y_2
+	quad_results["T_xy_1"] = T_xy_1
+	quad_results["T_xy_2"] = T_xy_2
+
+	quad_results["s_1_1"] = s_1_1
+	quad_results["s_2_1"] = s_2_1
+	quad_results["s_1_2"] = s_1_2
+	quad_results["s_2_2"] = s_2_2
+
+	quad_results["alpha_1"] = alpha_1
+	quad_results["alpha_2"] = alpha_2
+
+	quad_results["overstress"] = overstress
+	quad_results["utilization"] = utilization
+
+	for key, values in quad_results.items():
+		results.write("quads", key, frame, values)
+		entry["store.quads." + key] = results.read("quads", key, frame)
+
+	for i, quad in enumerate(quads.values()):
+		quad["ir"][frame] = ir[i]
+		quad["A"][frame] = A[i]
+		quad["Wy"][frame] = Wy[i]
+
+	for key in ["ir", "A", "Wy"]:
+		entry["data.quads." + key] = [quad[key][frame] for quad in quads.values()]
+
+	return entry
+
+# structural fitness calculated from the results
+fitness_inputs = [
+	"deflection_members", "deflection_quads", "average_sigma_members",
+	"average_sigmav_quads", "average_strain_energy"
+	]
+
+def get_fitness_inputs():
+	'''
+	Returns the structural fitness to be calculated from the results.
+	Only the ones with a weight above zero are calculated in the
+	fitness-only path and all of them otherwise.
+	:return inputs: Names of the fitness as list.
+	'''
+	phaenotyp = bpy.context.scene.phaenotyp
+
+	inputs = list(fitness_inputs)
+
+	if basics.fitness_only:
+		inputs = [name for name in inputs if getattr(phaenotyp, "fitness_" + name) > 0]
+
+	return inputs
+
+def interweave_fitness_pn(frame):
+	'''
+	Is integrating only the results of PyNite needed by the fitness.
+	The frame is not marked as done and is calculated again with
+	all results if selected by ranking or reported.
+	:param frame: Frame as str.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	members = data["members"]
+	quads = data["quads"]
+
+	model = basics.feas[frame]
+	inputs = get_fitness_inputs()
 
-	basics.feas = imported_models
+	# stations of this calculation and of the mesh
+	amount = basics.stations
+	mesh_amount = results.stations()
+
+	# results of a calculation before are not valid anymore
+	results.forget("members", results.keys["members_pn"] + results.derived["members"]["keys"], frame)
+	results.forget("quads", results.keys["quads"], frame)
+
+	forces = "average_sigma_members" in inputs or "average_strain_energy" in inputs
+	deflection = "deflection_members" in inputs
+
+	if len(members) > 0 and (forces or deflection):
+		L = []
+		axial = []
+		moment_y = []
+		moment_z = []
+		rotations = []
+		nodes_i = []
+		displacements = []
+
+		for id in members:
+			model_member = model.Members[id]
+
+			length = model_member.L() # Member length
+			positions = [length/(amount-1)*i for i in range(amount)]
+			L.append(length)
+
+			if forces:
+				axial.append([model_member.axial(x) * (-1) for x in positions]) # Druckkraft minus
+				moment_y.append([model_member.moment("My", x) for x in positions])
+				moment_z.append([model_member.moment("Mz", x) for x in positions])
+
+			if deflection:
+				rotations.append(model_member.T()[0:3, 0:3])
+				nodes_i.append([model_member.i_node.X, model_member.i_node.Y, model_member.i_node.Z])
+				displacements.append([[
+					model_member.deflection('dx', x),
+					model_member.deflection('dy', x),
+					model_member.deflection('dz', x)
+					] for x in positions])
+
+		L = array(L)
+
+		if deflection:
+			values = get_deflections_pn(array(rotations), array(nodes_i), L, array(displacements))
+			if amount != mesh_amount:
+				values = interpolate_stations(values, mesh_amount)
+
+			results.write("members", "deflection", frame, values)
+
+		if forces:
+			axial = array(axial)
+			moment_y = array(moment_y)
+			moment_z = array(moment_z)
+
+			# results with less stations are interpolated to the mesh
+			if amount != mesh_amount:
+				axial = interpolate_stations(axial, mesh_amount)
+				moment_y = interpolate_stations(moment_y, mesh_amount)
+				moment_z = interpolate_stations(moment_z, mesh_amount)
+
+			# sections and materials as column to work with all stations
+			A = array([member["A"][frame] for member in members.values()])[:, None]
+			Do = array([member["Do"][frame] for member in members.values()])[:, None]
+			Wy = array([member["Iy"][frame] for member in members.values()])[:, None] / (Do/2)
+			E = array([member["E"] for member in members.values()])[:, None]
+
+			if "average_sigma_members" in inputs:
+				moment_h, long_stress, max_long_stress = get_long_stresses(axial, moment_y, moment_z, A, Wy)
+				results.write("members", "max_sigma", frame, max_long_stress)
+
+			if "average_strain_energy" in inputs:
+				normal_energy, moment_energy = get_strain_energies(axial, moment_y, moment_z, L, E, A, Wy, Do)
+				results.write("members", "strain_energy", frame, normal_energy + moment_energy)
+
+	# the quads are calculated at once anyway
+	if len(quads) > 0 and ("deflection_quads" in inputs or "average_sigmav_quads" in inputs):
+		interweave_quads_pn(frame, model)
+
+	# to be calculated with all results if needed
+	data["done"][frame] = False
 
 def interweave_results_pn(frame):
 	'''
@@ -708,12 +1425,55 @@ def interweave_results_pn(frame):
 	quads = data["quads"]
 	
 	frame = str(frame)
-	model = basics.feas[frame]
 	basics.timer.start()
 
+	# results of models calculated before
+	if cache.restore(frame) is not None:
+		results.forget("members", results.derived["members"]["keys"], frame)
+
+		# get duration
+		text = calculation_type + " involvement for frame " + str(frame) + " taken from cache"
+		text +=  basics.timer.stop()
+		basics.print_data(text)
+
+		data["done"][str(frame)] = True
+
+		# set frame for viz
+		bpy.context.scene.frame_current = int(frame)
+		bpy.context.view_layer.update()
+		return
+
+	# only the results needed by the fitness
+	if basics.fitness_only:
+		interweave_fitness_pn(frame)
+
+		# get duration
+		text = calculation_type + " involvement for fitness of frame " + str(frame) + " done"
+		text +=  basics.timer.stop()
+		basics.print_data(text)
+		return
+
+	model = basics.feas[frame]
+
+	# compact results to be cached
+	entry = {}
+
+	# results of all members in the order of the store
+	frame_results = {key: [] for key in results.keys["members_pn"]}
+
+	# stations of this calculation and of the mesh
+	amount = basics.stations
+	mesh_amount = results.stations()
+
+	# to calculate the deflection of all members at once
+	rotations = []
+	nodes_i = []
+	displacements = []
+
 	for id in members:
 		member = members[id]
 		model_member = model.Members[id]
+		member_results = {}
 
 		L = model_member.L() # Member length
 		T = model_member.T() # Member local transformation matrix
@@ -725,8 +1485,8 @@ def interweave_results_pn(frame):
 		shear_z = []
 		torque = []
 
-		for i in range(11): # get the forces at 11 positions and
-			x = L/10*i
+		for i in range(amount): # get the forces at the stations and
+			x = L/(amount-1)*i
 
 			axial_pos = model_member.axial(x) * (-1) # Druckkraft minus
 			axial.append(axial_pos)
@@ -746,12 +1506,13 @@ def interweave_results_pn(frame):
 			torque_pos = model_member.torque(x)
 			torque.append(torque_pos)
 
-		member["axial"][frame] = axial
-		member["moment_y"][frame] = moment_y
-		member["moment_z"][frame] = moment_z
-		member["shear_y"][frame] = shear_y
-		member["shear_z"][frame] = shear_z
-		member["torque"][frame] = torque
+		member_results["axial"] = axial
+		member_results["moment_y"] = moment_y
+		member_results["moment_z"] = moment_z
+		member_results["shear_y"] = shear_y
+		member_results["shear_z"] = shear_z
+		member_results["torque"] = torque
+		member_results["L"] = L
 
 		# shorten and accessing once
 		A = member["A"][frame]
@@ -760,9 +1521,6 @@ def interweave_results_pn(frame):
 
 		# buckling
 		member["ir"][frame] = sqrt(J/A) # für runde Querschnitte in  cm
-		
-		# bucklng resolution
-		buckling_resolution = member["buckling_resolution"]
 
 		# modulus from the moments of area
 		#(Wy and Wz are the same within a pipe)
@@ -771,525 +1529,50 @@ def interweave_results_pn(frame):
 		# polar modulus of torsion
 		member["WJ"][frame] = J/(Do/2)
 
-		# calculation of the longitudinal stresses
-		long_stress = []
-		for i in range(11): # get the stresses at 11 positions and
-			moment_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-			if axial[i] > 0:
-				s = axial[i]/A + moment_h/member["Wy"][frame]
-			else:
-				s = axial[i]/A - moment_h/member["Wy"][frame]
-			long_stress.append(s)
-
-		# get max stress of the beam
-		# (can be positive or negative)
-		member["long_stress"][frame] = long_stress
-		member["max_long_stress"][frame] = basics.return_max_diff_to_zero(long_stress) #  -> is working as fitness
-
-		# calculation of the shear stresses from shear force
-		# (always positive)
-		tau_shear = []
-		shear_h = []
-		for i in range(11): # get the stresses at 11 positions and
-			# shear_h
-			s_h = sqrt(shear_y[i]**2+shear_z[i]**2)
-			shear_h.append(s_h)
-
-			tau = 1.333 * s_h/A # for pipes
-			tau_shear.append(tau)
-
-		member["shear_h"][frame] = shear_h
-
-		# get max shear stress of shear force of the beam
-		# shear stress is mostly small compared to longitudinal
-		# in common architectural usage and only importand with short beam lenght
-		member["tau_shear"][frame] = tau_shear
-		member["max_tau_shear"][frame] = max(tau_shear)
-
-		# Calculation of the torsion stresses
-		# (always positiv)
-		tau_torsion = []
-		for i in range(11): # get the stresses at 11 positions and
-			tau = abs(torque[i]/member["WJ"][frame])
-			tau_torsion.append(tau)
-
-		# get max torsion stress of the beam
-		member["tau_torsion"][frame] = tau_torsion
-		member["max_tau_torsion"][frame] = max(tau_torsion)
-
-		# torsion stress is mostly small compared to longitudinal
-		# in common architectural usage
-
-		# calculation of the shear stresses form shear force and torsion
-		# (always positiv)
-		sum_tau = []
-		for i in range(11): # get the stresses at 11 positions and
-			tau = tau_shear[i] + tau_torsion[i]
-			sum_tau.append(tau)
-
-		member["sum_tau"][frame] = sum_tau
-		member["max_sum_tau"][frame] = max(sum_tau)
-
-		# combine shear and torque
-		sigmav = []
-		for i in range(11): # get the stresses at 11 positions and
-			sv = sqrt(long_stress[i]**2 + 3*sum_tau[i]**2)
-			sigmav.append(sv)
-
-		member["sigmav"][frame] = sigmav
-		member["max_sigmav"][frame] = max(sigmav)
-		# check out: http://www.bs-wiki.de/mediawiki/index.php?title=Festigkeitsberechnung
-
-		member["sigma"][frame] = member["long_stress"][frame]
-		member["max_sigma"][frame] = member["max_long_stress"][frame]
-
-		# overstress
-		member["overstress"][frame] = False
-
-		# check overstress and add 1.05 savety factor
-		safety_factor = 1.05
-		if abs(member["max_tau_shear"][frame]) > safety_factor*member["acceptable_shear"]:
-			member["overstress"][frame] = True
-
-		if abs(member["max_tau_torsion"][frame]) > safety_factor*member["acceptable_torsion"]:
-			member["overstress"][frame] = True
-
-		if abs(member["max_sigmav"][frame]) > safety_factor*member["acceptable_sigmav"]:
-			member["overstress"][frame] = True
-
-		# buckling
-		if member["axial"][frame][0] < 0: # nur für Druckstäbe, axial kann nicht flippen?
-			member["lamda"][frame] = L*buckling_resolution*0.5/member["ir"][frame] # für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
-			if member["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-				kn = member["knick_model"]
-				function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-				member["acceptable_sigma_buckling"][frame] = function_to_run(member["lamda"][frame])
-				if member["lamda"][frame] > 250: # Schlankheit zu schlank
-					member["acceptable_sigma_buckling"][frame] = function_to_run(250)
-					member["overstress"][frame] = True
-				if safety_factor*abs(member["acceptable_sigma_buckling"][frame]) > abs(member["max_sigma"][frame]): # Sigma
-					member["overstress"][frame] = True
-
-			else:
-				member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-
-		# without buckling
-		else:
-			member["acceptable_sigma_buckling"][frame] = member["acceptable_sigma"]
-			member["lamda"][frame] = None # to avoid missing KeyError
-
-
-		if abs(member["max_sigma"][frame]) > safety_factor*member["acceptable_sigma"]:
-			member["overstress"][frame] = True
-
-		# lever_arm
-		lever_arm = []
-		moment_h = []
-		for i in range(11):
-			# moment_h
-			m_h = sqrt(moment_y[i]**2+moment_z[i]**2)
-			moment_h.append(m_h)
-
-			# to avoid division by zero
-			if member["axial"][frame][i] < 0.1:
-				lv = m_h / 0.1
-			else:
-				lv = m_h / member["axial"][frame][i]
-
-			lv = abs(lv) # absolute highest value within member
-			lever_arm.append(lv)
-
-		member["moment_h"][frame] = moment_h
-		member["lever_arm"][frame] = lever_arm
-		member["max_lever_arm"][frame] = max(lever_arm)
-
-		# Ausnutzungsgrad
-		member["utilization"][frame] = abs(member["max_long_stress"][frame] / member["acceptable_sigma_buckling"][frame])
-
-		# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-		normalkraft_energie=[]
-		moment_energie=[]
-		strain_energy = []
-
-		for i in range(10): # get the energie at 10 positions for 10 section
-			# Berechnung der strain_energy für Normalkraft
-			ne = (axial[i]**2)*(L/10)/(2*member["E"]*A)
-			normalkraft_energie.append(ne)
-
-			# Berechnung der strain_energy für Moment
-			moment_hq = moment_y[i]**2+moment_z[i]**2
-			me = (moment_hq * L/10) / (member["E"] * member["Wy"][frame] * Do)
-			moment_energie.append(me)
-
-			# Summe von Normalkraft und Moment-Verzerrunsenergie
-			value = ne + me
-			strain_energy.append(value)
-
-		member["strain_energy"][frame] = strain_energy
-		member["normal_energy"][frame] = normalkraft_energie
-		member["moment_energy"][frame] = moment_energie
-
-		# deflection
-		deflection = []
-
-		# --> taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
-		scale_factor = 10.0
-
-		cos_x = array([T[0,0:3]]) # Direction cosines of local x-axis
-		cos_y = array([T[1,0:3]]) # Direction cosines of local y-axis
-		cos_z = array([T[2,0:3]]) # Direction cosines of local z-axis
-
-		DY_plot = empty((0, 3))
-		DZ_plot = empty((0, 3))
-
-		for i in range(11):
-			# Calculate the local y-direction displacement
-			dy_tot = model_member.deflection('dy', L/10*i)
-
-			# Calculate the scaled displacement in global coordinates
-			DY_plot = append(DY_plot, dy_tot*cos_y*scale_factor, axis=0)
-
-			# Calculate the local z-direction displacement
-			dz_tot = model_member.deflection('dz', L/10*i)
-
-			# Calculate the scaled displacement in global coordinates
-			DZ_plot = append(DZ_plot, dz_tot*cos_z*scale_factor, axis=0)
-
-		# Calculate the local x-axis displacements at 20 points along the member's length
-		DX_plot = empty((0, 3))
-
-		Xi = model_member.i_node.X
-		Yi = model_member.i_node.Y
-		Zi = model_member.i_node.Z
-
-		for i in range(11):
-			# Displacements in local coordinates
-			dx_tot = [[Xi, Yi, Zi]] + (L/10*i + model_member.deflection('dx', L/10*i)*scale_factor)*cos_x
-
-			# Magnified displacements in global coordinates
-			DX_plot = append(DX_plot, dx_tot, axis=0)
-
-		# Sum the component displacements to obtain overall displacement
-		D_plot = DY_plot + DZ_plot + DX_plot
-
-		# <-- taken from pyNite VisDeformedMember: https://github.com/JWock82/PyNite
-
-		# add to results
-		for i in range(11):
-			x = D_plot[i, 0] * 0.01
-			y = D_plot[i, 1] * 0.01
-			z = D_plot[i, 2] * 0.01
-
-			deflection.append([x,y,z])
-
-		member["deflection"][frame] = deflection
-
-	nodes = model.Nodes
-
-	for id in quads:
-		quad = quads[id]
-
-		# read results from PyNite
-		result = model.Quads[id]
-
-		# only take highest value to zero
-		shear = result.shear()
-		moment = result.moment()
-		membrane = result.membrane()
-
-		# from PyNite
-		Qx = float(shear[0])
-		Qy = float(shear[1])
-
-		Mx = float(moment[0])
-		My = float(moment[1])
-		Mxy = float(moment[2])
-
-		Sx = float(membrane[0])
-		Sy = float(membrane[1])
-		Txy = float(membrane[2])
-
-		#print("Qx:", Qx, "Qy:", Qy, "Mx:", Mx, "My:", My, "Mxy:", Mxy, "Sx:", Sx, "Sy:", Sy, "Txy:", Txy)
-
-		# get deflection
-		node_ids = quad["vertices_ids_structure"]
-		deflection = []
-		for i in range(4):
-			# deflection only
-			x = nodes[str(node_ids[i])].DX["Combo 1"]*0.1
-			y = nodes[str(node_ids[i])].DY["Combo 1"]*0.1
-			z = nodes[str(node_ids[i])].DZ["Combo 1"]*0.1
-
-			# add deflection to initial position
-			initial = quad["initial_positions"][frame][i]
-			x += initial[0]
-			y += initial[1]
-			z += initial[2]
-
-			deflection.append([x,y,z])
-		
-		# get average lengthes to calculate force by unit
-		initial = quad["initial_positions"][frame]
-		v_0 = array(initial[0])
-		v_1 = array(initial[1])
-		v_2 = array(initial[2])
-		v_3 = array(initial[3])
-
-		x_0 = v_1 - v_0 # first edge x
-		x_1 = v_3 - v_2 # second edge x
-		y_0 = v_2 - v_1 # first edge y
-		y_1 = v_3 - v_0 # second edge y
-
-		# as descripted in quad example
-		length_x = (linalg.norm(x_0) + linalg.norm(x_1)) * 0.5 * 100 # to convert into cm
-		length_y = (linalg.norm(y_0) + linalg.norm(y_1)) * 0.5 * 100 # to convert into cm
-
-		# Schnittkräfte in unit-cm
-
-		shear_x = Qx # Querkraft in kN  # für Darstellung
-		shear_y = Qy # Querkraft in kN  # für Darstellung
-
-		moment_x = Mx  # Moment in kNcm   # für Darstellung
-		moment_y = My  # Moment in kNcm   # für Darstellung
-		moment_xy = Mxy  # Drillmoment in kNcm   # für Darstellung
-		
-		thickness = quad["thickness"][frame]
-
-		membrane_x = Sx * thickness  # Spannung in kN/cm   # für Darstellung
-		membrane_y = Sy * thickness  # Spannung in kN/cm   # für Darstellung
-		membrane_xy = Txy * thickness  #  Schubspannung in kN/cm   # für Darstellung
-
-		# die Querschnittswerte sind jetzt auf 1 cm Schalenbreite bezogen
-		# area of the section, not the face
-		A = thickness * 1 # Dicke in cm² pro cm Schalenbreite
-		
-		# J = 1 * (thickness)**3 / 12
-
-		# für buckling
-		ir = thickness * 0.28867 # in cm  - Breite kürzt sich weg, es bleibt 1/wurzel aus 12
-		# ir = sqrt(J/A) # in cm
-		# modulus from the moments of area
-		Wy = (thickness**2)/6  # auf 1 cm Schalenbreite
-		
-		# Spannungen in x und y Richrtung an den Oberflächen 1 und 2
-		'''
-		s_x_1 = membrane_x + moment_x/Wy  # für Darstellung
-		s_x_2 = membrane_x - moment_x/Wy  # für Darstellung
-		s_y_1 = membrane_y + moment_y/Wy  # für Darstellung
-		s_y_2 = membrane_y - moment_y/Wy  # für Darstellung
-		T_xy_1 = membrane_xy +  moment_xy/Wy # am Plattenrand, für Darstellung
-		T_xy_2 = membrane_xy -  moment_xy/Wy # am Plattenrand, für Darstellung
-		'''
-
-		s_x_1 = membrane_x - moment_x/Wy  # für Darstellung
-		s_x_2 = membrane_x + moment_x/Wy  # für Darstellung
-		s_y_1 = membrane_y - moment_y/Wy  # für Darstellung
-		s_y_2 = membrane_y + moment_y/Wy  # für Darstellung
-		T_xy_1 = membrane_xy -  moment_xy/Wy # am Plattenrand, für Darstellung
-		T_xy_2 = membrane_xy +  moment_xy/Wy # am Plattenrand, für Darstellung
-		
-					
-		# Schubspannungen in x und y Richtung  infolge Querkraft in Plattenmitte
-		T_x = 1.5 * shear_x/A   # in Plattenmitte
-		T_y = 1.5 * shear_y/A   # in Plattenmitte
-
-		# Hauptspannungen 1 und 2 an den Oberflächen 1 und 2
-		# based on:
-		# https://www.umwelt-campus.de/fileadmin/Umwelt-Campus/User/TPreussler/Download/Festigkeitslehre/Foliensaetze/01_Spannungszustand.pdf
-		# https://technikermathe.de/tm2-hauptnormalspannung-berechnen
-		# midpoint
-		
-		# first side
-		if s_x_1 - s_y_1 == 0: # avoid div zero
-			alpha = 0
-		else:
-			alpha = degrees(0.5 * arctan((2 * T_xy_1) / (s_x_1 - s_y_1)))
-		
-		s_1 = (s_x_1 + s_y_1)/2 + sqrt(((s_x_1 - s_y_1)/2)**2 + T_xy_1**2)
-		s_2 = (s_x_1 + s_y_1)/2 - sqrt(((s_x_1 - s_y_1)/2)**2 + T_xy_1**2)
-		s_xi = (s_x_1 + s_y_1)/2 + (s_x_1 - s_y_1)/2 * cos(2*radians(alpha)) + T_xy_1 * sin(2*radians(alpha))
-		
-		#if abs(s_1) > abs(s_2):
-		if abs(s_1) > abs(s_2):
-			s_1_1 = s_1
-			s_2_1 = s_2
-		else:
-			s_1_1 = s_2
-			s_2_1 = s_1
-			
-		if abs(round(s_1_1,2)) == abs(round(s_xi,2)):
-			alpha_1 = alpha + 90
-		else:
-			alpha_1 = alpha
-		
-		# second side
-		if s_x_2 - s_y_2 == 0: # avoid div zero
-			alpha = 0
-		else:
-			alpha = degrees(0.5 * arctan((2 * T_xy_2) / (s_x_2 - s_y_2)))
-		
-		s_1 = (s_x_2 + s_y_2)/2 + sqrt(((s_x_2 - s_y_2)/2)**2 + T_xy_2**2)
-		s_2 = (s_x_2 + s_y_2)/2 - sqrt(((s_x_2 - s_y_2)/2)**2 + T_xy_2**2)
-		s_xi = (s_x_2 + s_y_2)/2 + (s_x_2 - s_y_2)/2 * cos(2*radians(alpha)) + T_xy_2 * sin(2*radians(alpha))
-
-		if abs(s_1) > abs(s_2):
-			s_1_2 = s_1
-			s_2_2 = s_2
-		else:
-			s_1_2 = s_2
-			s_2_2 = s_1
-		
-		if abs(round(s_1_2,2)) == abs(round(s_xi,2)):
-			alpha_2 = alpha + 90
-		else:
-			alpha_2 = alpha
-		
-		# long_stress_x = s_x
-		# sigma = s_x
-		# long_stress_y = s_y
-		# sigma_y = s_y
-		# shear_xy = membrane_xy
-		# tau_shear_xy = 1.5 * shear_x/A # for quads
-		# tau_shear_y = 1.5 * shear_y/A # for quads
-		# tau_shear_y = 1.5 * shear_y/A # for quads
-		
-		# Vergleichsspannung an den beiden Oberflächen 1 und 2
-		sigmav1 = sqrt(s_x_1**2 + s_y_1**2 - s_x_1*s_y_1 + 3*T_xy_1**2)
-		sigmav2 = sqrt(s_x_2**2 + s_y_2**2 - s_x_2*s_y_2 + 3*T_xy_2**2)
-		
-		# der größere Wert wird für die weitere Optimierung verwendet
-		if sigmav2 > sigmav1:
-			sigmav = sigmav2
-		else:
-			sigmav = sigmav1
-
-		# Vergleichsspannung in Plattenmitte
-		sigmav_m = sqrt(abs((membrane_x/A)**2 + (membrane_y/A)**2 - (membrane_x/A) * (membrane_y/A) + 3 * T_x * T_y))  # falls notwendig
-		
-		overstress = False
-		# check overstress and add 1.05 safety factor
-		safety_factor = 1.05
-		#if abs(tau_shear) > safety_factor*quad["acceptable_shear"]:
-		#	overstress = True
-
-		if sigmav > safety_factor*quad["acceptable_sigmav"]:
-			overstress = True
-
-		# buckling in x-Richtung
-		if membrane_x < 0: # nur für Druckstäbe, axial kann nicht flippen?
-			quad["lamda"][frame] = length_x*5/ir # es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
-			if quad["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-				kn = quad["knick_model"]
-				function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-				acceptable_sigma_buckling_x = function_to_run(quad["lamda"][frame])
-				if quad["lamda"][frame] > 250: # Schlankheit zu schlank
-					acceptable_sigma_buckling_x = function_to_run(250)
-					overstress = True
-				if safety_factor*abs(acceptable_sigma_buckling_x) > abs(sigmav): # Sigma
-					overstress = True
-
-			else:
-				acceptable_sigma_buckling_x = quad["acceptable_sigma"]
-		# without buckling		
-		else:
-			acceptable_sigma_buckling_x = quad["acceptable_sigma"]
-			quad["lamda"][frame] = None # to avoid missing KeyError
-
-		
-		# buckling in y-Richtung
-		if membrane_y < 0: # nur für Druckstäbe, axial kann nicht flippen?
-			quad["lamda"][frame] = length_y*5/ir # es wird hier von einer Knicklänge von 5 x der Elementlänge vorerst ausgegagen, in cm
-			if quad["lamda"][frame] > 20: # für lamda < 20 (kurze Träger) gelten die default-Werte)
-				kn = quad["knick_model"]
-				function_to_run = poly1d(polyfit(material.kn_lamda, kn, 6))
-				acceptable_sigma_buckling_y = function_to_run(quad["lamda"][frame])
-				if quad["lamda"][frame] > 250: # Schlankheit zu schlank
-					acceptable_sigma_buckling_y = function_to_run(250)
-					overstress = True
-				if safety_factor*abs(acceptable_sigma_buckling_y) > abs(sigmav): # Sigma
-					overstress = True
-
-			else:
-				acceptable_sigma_buckling_y = quad["acceptable_sigma"]
-
-		# without buckling
-		else:
-			acceptable_sigma_buckling_y = quad["acceptable_sigma"]
-			quad["lamda"][frame] = None # to avoid missing KeyError
-		
-		# das kleinere ist maßgbend
-		if acceptable_sigma_buckling_x < acceptable_sigma_buckling_y:
-			quad["acceptable_sigma_buckling"][frame] = acceptable_sigma_buckling_x
-		else:
-			quad["acceptable_sigma_buckling"][frame] = acceptable_sigma_buckling_y 
-
-		if abs(sigmav) > safety_factor*quad["acceptable_sigma"]:
-			overstress = True
-
-		# Ausnutzungsgrad
-		utilization = abs(sigmav / quad["acceptable_sigma_buckling"][frame])
-		
-		# vorerst noch weglassen
-		# Einführung in die Technische Mechanik - Festigkeitslehre, H.Balke, Springer 2010
-		# Berechnung der strain_energy für Normalkraft
-		# normalkraft_energie = (long_stress**2)*(length_x)/(2*quad["E"]*A)
-
-		# Berechnung der strain_energy für Moment
-		# moment_hq = moment_x**2+moment_y**2
-		# moment_energie = (moment_hq * length_x) / (quad["E"] * Wy * thickness)
-
-		# Summe von Normalkraft und Moment-Verzerrunsenergie
-		# strain_energy = normalkraft_energie + moment_energie
-
-		# save to dict
-		quad["shear_x"][frame] = shear_x
-		quad["shear_y"][frame] = shear_y
+		# local displacements at the stations for the deflection
+		rotations.append(T[0:3, 0:3]) # direction cosines of the local axes
+		nodes_i.append([model_member.i_node.X, model_member.i_node.Y, model_member.i_node.Z])
+
+		member_displacements = []
+		for i in range(amount):
+			x = L/(amount-1)*i
+			member_displacements.append([
+				model_member.deflection('dx', x),
+				model_member.deflection('dy', x),
+				model_member.deflection('dz', x)
+				])
+		displacements.append(member_displacements)
+
+		for key, value in member_results.items():
+			frame_results[key].append(value)
+
+	# pass the results of all members to the store at once
+	# stresses, buckling and energies are derived on request
+	if len(members) > 0:
+		frame_results["deflection"] = get_deflections_pn(
+			array(rotations), array(nodes_i),
+			array(frame_results["L"]), array(displacements)
+			)
 
-		quad["moment_x"][frame] = moment_x
-		quad["moment_y"][frame] = moment_y
-		quad["moment_xy"][frame] = moment_xy
+		# results with less stations are interpolated to the mesh
+		if amount != mesh_amount:
+			for key in ["axial", "moment_y", "moment_z", "shear_y", "shear_z", "torque", "deflection"]:
+				frame_results[key] = interpolate_stations(array(frame_results[key]), mesh_amount)
 
-		quad["membrane_x"][frame] = membrane_x
-		quad["membrane_y"][frame] = membrane_y
-		quad["membrane_xy"][frame] = membrane_xy
-		
-		quad["length_x"][frame] = length_x
-		quad["length_y"][frame] = length_y
-
-		quad["deflection"][frame] = deflection
-
-		quad["ir"][frame] = ir
-		quad["A"][frame] = A
-		#quad["J"][frame] = J
-		quad["Wy"][frame] = Wy
-		#quad["moment_h"][frame] = moment_h
-		#quad["long_stress"][frame] = long_stress
-		#quad["shear_h"][frame] = shear_h
-		#quad["tau_shear"][frame] = tau_shear
-		quad["sigmav"][frame] = sigmav
-		#quad["sigma"][frame] = quad["long_stress"][frame]
-		
-		quad["s_x_1"][frame] = s_x_1
-		quad["s_x_2"][frame] = s_x_2
-		quad["s_y_1"][frame] = s_y_1
-		quad["s_y_2"][frame] = s_y_2
-		quad["T_xy_1"][frame] = T_xy_1
-		quad["T_xy_2"][frame] = T_xy_2
+		for key, values in frame_results.items():
+			results.write("members", key, frame, values)
+			entry["store.members." + key] = results.read("members", key, frame)
 
-		quad["s_1_1"][frame] = s_1_1
-		quad["s_2_1"][frame] = s_2_1
-		quad["s_1_2"][frame] = s_1_2
-		quad["s_2_2"][frame] = s_2_2
+		results.forget("members", results.derived["members"]["keys"], frame)
 
-		quad["alpha_1"][frame] = alpha_1
-		quad["alpha_2"][frame] = alpha_2
+		for key in ["ir", "Wy", "WJ"]:
+			entry["data.members." + key] = [member[key][frame] for member in members.values()]
 
-		quad["overstress"][frame] = overstress
-		quad["utilization"][frame] = utilization
+	# pass the results of all quads to the store at once
+	if len(quads) > 0:
+		entry.update(interweave_quads_pn(frame, model))
 
-		#quad["strain_energy"][frame] = strain_energy
-		#quad["normal_energy"][frame] = normalkraft_energie
-		#quad["moment_energy"][frame] = moment_energie
+	cache.store(frame, entry)
 
 	# get duration
 	text = calculation_type + " involvement for frame " + str(frame) + " done"
@@ -1302,6 +1585,137 @@ def interweave_results_pn(frame):
 	bpy.context.scene.frame_current = int(frame)
 	bpy.context.view_layer.update()
 
+def derive_members_pn(frame):
+	'''
+	Is deriving the stresses, buckling, lever arms and energies of all members
+	from the forces stored by interweave_results_pn. Is called by the store
+	the first time one of these results is requested and the results are
+	kept in the store until the frame is calculated again.
+	All members and stations are calculated at once as arrays with shape (members, stations).
+	:param frame: Frame as int or str.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	members = data["members"]
+
+	frame = str(frame)
+
+	# forces of all members and stations in the order of the store
+	axial = results.read("members", "axial", frame)
+	moment_y = results.read("members", "moment_y", frame)
+	moment_z = results.read("members", "moment_z", frame)
+	shear_y = results.read("members", "shear_y", frame)
+	shear_z = results.read("members", "shear_z", frame)
+	torque = results.read("members", "torque", frame)
+	L = results.read("members", "L", frame)
+
+	# sections and materials as column to work with all stations
+	A = array([member["A"][frame] for member in members.values()])[:, None]
+	Do = array([member["Do"][frame] for member in members.values()])[:, None]
+	Wy = array([member["Wy"][frame] for member in members.values()])[:, None]
+	WJ = array([member["WJ"][frame] for member in members.values()])[:, None]
+	ir = array([member["ir"][frame] for member in members.values()])
+	E = array([member["E"] for member in members.values()])[:, None]
+	buckling_resolution = array([member["buckling_resolution"] for member in members.values()])
+
+	acceptable_sigma = array([member["acceptable_sigma"] for member in members.values()])
+	acceptable_shear = array([member["acceptable_shear"] for member in members.values()])
+	acceptable_torsion = array([member["acceptable_torsion"] for member in members.values()])
+	acceptable_sigmav = array([member["acceptable_sigmav"] for member in members.values()])
+
+	member_results = {}
+
+	# calculation of the longitudinal stresses
+	moment_h, long_stress, max_long_stress = get_long_stresses(axial, moment_y, moment_z, A, Wy)
+
+	member_results["moment_h"] = moment_h
+	member_results["long_stress"] = long_stress
+	member_results["max_long_stress"] = max_long_stress
+
+	# calculation of the shear stresses from shear force
+	# (always positive)
+	shear_h = hypot(shear_y, shear_z)
+	tau_shear = 1.333 * shear_h/A # for pipes
+
+	# get max shear stress of shear force of the beam
+	# shear stress is mostly small compared to longitudinal
+	# in common architectural usage and only importand with short beam lenght
+	member_results["shear_h"] = shear_h
+	member_results["tau_shear"] = tau_shear
+	member_results["max_tau_shear"] = tau_shear.max(axis=1)
+
+	# Calculation of the torsion stresses
+	# (always positiv)
+	tau_torsion = abs(torque/WJ)
+
+	# get max torsion stress of the beam
+	# torsion stress is mostly small compared to longitudinal
+	# in common architectural usage
+	member_results["tau_torsion"] = tau_torsion
+	member_results["max_tau_torsion"] = tau_torsion.max(axis=1)
+
+	# calculation of the shear stresses form shear force and torsion
+	# (always positiv)
+	sum_tau = tau_shear + tau_torsion
+	member_results["sum_tau"] = sum_tau
+	member_results["max_sum_tau"] = sum_tau.max(axis=1)
+
+	# combine shear and torque
+	# check out: http://www.bs-wiki.de/mediawiki/index.php?title=Festigkeitsberechnung
+	sigmav = hypot(long_stress, sqrt(3)*sum_tau)
+	member_results["sigmav"] = sigmav
+	member_results["max_sigmav"] = sigmav.max(axis=1)
+
+	member_results["sigma"] = long_stress
+	member_results["max_sigma"] = max_long_stress
+
+	# check overstress and add 1.05 savety factor
+	safety_factor = 1.05
+	overstress = abs(member_results["max_tau_shear"]) > safety_factor*acceptable_shear
+	overstress |= abs(member_results["max_tau_torsion"]) > safety_factor*acceptable_torsion
+	overstress |= abs(member_results["max_sigmav"]) > safety_factor*acceptable_sigmav
+
+	# buckling
+	# nur für Druckstäbe, axial kann nicht flippen?
+	# für eingespannte Stäbe ist die Knicklänge 0.5 der Stablänge L, Stablänge muss in cm sein !
+	# lamda is nan without buckling
+	compressed = axial[:, 0] < 0
+	lamda = where(compressed, L*buckling_resolution*0.5/ir, nan)
+
+	# für lamda < 20 (kurze Träger) gelten die default-Werte
+	slender = flatnonzero(compressed & (lamda > 20))
+	acceptable_sigma_buckling = get_acceptable_sigma_buckling(members, lamda, slender, acceptable_sigma)
+
+	overstress[slender] |= lamda[slender] > 250 # Schlankheit zu schlank
+	overstress[slender] |= safety_factor*abs(acceptable_sigma_buckling[slender]) > abs(max_long_stress[slender]) # Sigma
+
+	overstress |= abs(max_long_stress) > safety_factor*acceptable_sigma
+
+	member_results["overstress"] = overstress
+	member_results["lamda"] = lamda
+	member_results["acceptable_sigma_buckling"] = acceptable_sigma_buckling
+
+	# lever_arm
+	# to avoid division by zero
+	lever_arm = abs(moment_h / where(axial < 0.1, 0.1, axial)) # absolute highest value within member
+	member_results["lever_arm"] = lever_arm
+	member_results["max_lever_arm"] = lever_arm.max(axis=1)
+
+	# Ausnutzungsgrad
+	member_results["utilization"] = abs(max_long_stress / acceptable_sigma_buckling)
+
+	# energies of each section between the stations
+	normalkraft_energie, moment_energie = get_strain_energies(axial, moment_y, moment_z, L, E, A, Wy, Do)
+
+	# Summe von Normalkraft und Moment-Verzerrunsenergie
+	member_results["strain_energy"] = normalkraft_energie + moment_energie
+	member_results["normal_energy"] = normalkraft_energie
+	member_results["moment_energy"] = moment_energie
+
+	# memoize in the store
+	for key, values in member_results.items():
+		results.write("members", key, frame, values)
+
 def interweave_results_fd(frame):
 	'''
 	Function to integrate the results of force distribution.
@@ -1315,8 +1729,18 @@ def interweave_results_fd(frame):
 	calculation_type = phaenotyp.calculation_type
 	
 	frame = str(frame)
-	model = basics.feas[frame]
-	basics.timer.start()		
+	basics.timer.start()
+
+	# forces of models calculated before
+	entry = cache.restore(frame)
+	if entry is not None:
+		model = entry["feas"]
+	else:
+		model = basics.feas[frame]
+		cache.store(frame, {"feas": model})
+
+	# results of all members in the order of the store
+	frame_results = {key: [] for key in results.keys["members_fd"]}
 
 	for id, member in members.items():
 		id = int(id)
@@ -1366,10 +1790,14 @@ def interweave_results_fd(frame):
 
 		utilization = basics.avoid_div_zero(abs(acceptable_sigma), abs(sigma))
 
-		member["axial"][str(frame)] = force
-		member["sigma"][str(frame)] = sigma
-		member["overstress"][str(frame)] = overstress
-		member["utilization"][str(frame)] = utilization
+		frame_results["axial"].append(force)
+		frame_results["sigma"].append(sigma)
+		frame_results["overstress"].append(overstress)
+		frame_results["utilization"].append(utilization)
+
+	# pass the results of all members to the store at once
+	for key, values in frame_results.items():
+		results.write("members", key, frame, values)
 
 	# get duration
 	text = calculation_type + " involvement for frame " + str(frame) + " done"
@@ -1378,6 +1806,29 @@ def interweave_results_fd(frame):
 
 	data["done"][str(frame)] = True
 
+def set_evaluation(optimization):
+	'''
+	Is setting how the next calculations are evaluated.
+	Bruteforce, genetic algorithm and gradient descent can work with less
+	stations and the results are interpolated to the stations of the mesh.
+	With phaenotyp.fitness_only only the results needed by the fitness
+	are calculated if no sectional optimization is used.
+	:param optimization: True if called by bf, ga or gd.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+
+	if optimization:
+		basics.stations = min(phaenotyp.stations_optimization, results.stations())
+
+		# the sectional optimization needs all results
+		sectional = phaenotyp.optimization_pn != "none" or phaenotyp.optimization_quads != "none"
+		pynite = phaenotyp.calculation_type not in ["geometrical", "force_distribution"]
+		basics.fitness_only = phaenotyp.fitness_only and pynite and not sectional
+	else:
+		basics.stations = results.stations()
+		basics.fitness_only = False
+
 def calculate_frames(start, end):
 	scene = bpy.context.scene
 	phaenotyp = scene.phaenotyp
@@ -1399,6 +1850,9 @@ def calculate_frames(start, end):
 	# create list of models in basics.models
 	for frame in range(start, end):
 		basics.jobs.append([prepare_fea, frame])
+
+	# take models calculated before from the cache
+	basics.jobs.append([cache.lookup, list(range(start, end))])
 	
 	# run mp and get results
 	basics.jobs.append([run_mp, basics.models])
@@ -1407,6 +1861,63 @@ def calculate_frames(start, end):
 	for frame in range(start, end):
 		basics.jobs.append([interweave_results, frame])
 
+def reset_models():
+	'''
+	Is deleting the models of the frames calculated before.
+	The dicts are cleared in place as they are passed to queued jobs already.
+	'''
+	basics.models.clear()
+	basics.prepared.clear()
+	basics.feas.clear()
+
+def complete_frames(frames):
+	'''
+	Is calculating the frames again with all stations and results
+	if calculated by the fitness-only path or with less stations
+	or if restored from a checkpoint without the coordinates.
+	:param frames: Frames as list of int.
+	:return frames: Frames calculated again as list of int.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+
+	if phaenotyp.calculation_type in ["geometrical", "force_distribution"]:
+		return []
+
+	incomplete = []
+	for frame in sorted(frames):
+		frame_data = data["frames"].get(str(frame))
+		if not frame_data:
+			continue
+
+		done = data["done"].get(str(frame))
+		fitness_only = frame_data.get("fitness_only") and not done
+		coarse = done and frame_data.get("stations", results.stations()) < results.stations()
+		restored = done and frame_data.get("restored")
+		if fitness_only or coarse or restored:
+			incomplete.append(frame)
+
+	if len(incomplete) > 0:
+		set_evaluation(False)
+
+		# only the models of these frames are calculated
+		basics.models = {}
+		basics.prepared = {}
+		basics.feas = {}
+
+		# calculate consecutive frames together
+		start = incomplete[0]
+		for position, frame in enumerate(incomplete):
+			last = position == len(incomplete)-1
+			if last or incomplete[position+1] != frame+1:
+				calculate_frames(start, frame+1)
+				if not last:
+					start = incomplete[position+1]
+					basics.jobs.append([reset_models])
+
+	return incomplete
+
 def approximate_sectional():
 	'''
 	Is adapting the diameters of force distribution step by step.
@@ -1420,7 +1931,7 @@ def approximate_sectional():
 	frame = bpy.context.scene.frame_current
 
 	for id, member in members.items():
-		if member["overstress"][str(frame)] == True:
+		if results.read_element("members", "overstress", frame, id) == True:
 			member["Do"][str(frame)] = member["Do"][str(frame)] * 1.05
 			member["Di"][str(frame)] = member["Di"][str(frame)] * 1.05
 
@@ -1447,7 +1958,7 @@ def simple_sectional():
 	frame = bpy.context.scene.frame_current
 
 	for id, member in members.items():
-		if abs(member["max_long_stress"][str(frame)]/member["acceptable_sigma_buckling"][str(frame)]) > 1:
+		if abs(results.read_element("members", "max_long_stress", frame, id)/results.read_element("members", "acceptable_sigma_buckling", frame, id)) > 1:
 			member["Do"][str(frame)] = member["Do"][str(frame)] * 1.2
 			member["Di"][str(frame)] = member["Di"][str(frame)] * 1.2
 
@@ -1473,7 +1984,7 @@ def utilization_sectional():
 	frame = bpy.context.scene.frame_current
 
 	for id, member in members.items():
-		ang = member["utilization"][str(frame)]
+		ang = results.read_element("members", "utilization", frame, id)
 
 		# bei Fachwerkstäben
 		#faktor_d = sqrt(abs(ang))
@@ -1506,11 +2017,11 @@ def complex_sectional():
 		#treshhold bei Prüfung!
 		# without buckling (Zugstab)
 
-		if abs(member["max_long_stress"][str(frame)]/member["acceptable_sigma_buckling"][str(frame)]) > 1:
-			faktor_a = 1+(abs(member["max_long_stress"][str(frame)])/member["acceptable_sigma_buckling"][str(frame)]-1)*0.36
+		if abs(results.read_element("members", "max_long_stress", frame, id)/results.read_element("members", "acceptable_sigma_buckling", frame, id)) > 1:
+			faktor_a = 1+(abs(results.read_element("members", "max_long_stress", frame, id))/results.read_element("members", "acceptable_sigma_buckling", frame, id)-1)*0.36
 
 		else:
-			faktor_a = 0.5 + 0.6*(tanh((abs(member["max_long_stress"][str(frame)])/member["acceptable_sigma_buckling"][str(frame)] -0.5)*2.4))
+			faktor_a = 0.5 + 0.6*(tanh((abs(results.read_element("members", "max_long_stress", frame, id))/results.read_element("members", "acceptable_sigma_buckling", frame, id) -0.5)*2.4))
 
 		# bei Fachwerkstäben
 		#faktor_d = sqrt(abs(faktor_a))
@@ -1539,7 +2050,7 @@ def quads_approximate_sectional():
 	frame = bpy.context.scene.frame_current
 
 	for id, quad in quads.items():
-		if quad["overstress"][str(frame)]:
+		if results.read_element("quads", "overstress", frame, id):
 			quad["thickness"][str(frame)] = quad["thickness"][str(frame)] * 1.1
 		
 		else:
@@ -1556,7 +2067,7 @@ def quads_utilization_sectional():
 	frame = bpy.context.scene.frame_current
 
 	for id, quad in quads.items():
-		ang = quad["utilization"][str(frame)]
+		ang = results.read_element("quads", "utilization", frame, id)
 		faktor_d = (abs(ang))**(1/3) # taken from members
 		quad["thickness"][str(frame)] = quad["thickness"][str(frame)] * faktor_d
 		
@@ -1589,7 +2100,7 @@ def decimate_topology():
 
 	# create factors for nodes from members
 	for id, member in members.items():
-		factor = member["utilization"][str(frame)]
+		factor = results.read_element("members", "utilization", frame, id)
 		# first node
 		vertex_0_id = member["vertex_0_id"]
 		weights[vertex_0_id].append(factor)
@@ -1638,15 +2149,19 @@ def copy_d_t_from_prev(frame):
 	for id, member in members.items():
 		member["Do"][str(frame)] = member["Do"][str(frame-1)]
 		member["Di"][str(frame)] = member["Di"][str(frame-1)]
-		
-		member["overstress"][str(frame)] = member["overstress"][str(frame-1)]
-		member["utilization"][str(frame)] = member["utilization"][str(frame-1)]
-		member["max_long_stress"][str(frame)] = member["max_long_stress"][str(frame-1)]
-		member["acceptable_sigma_buckling"][str(frame)] = member["acceptable_sigma_buckling"][str(frame-1)]
 
 	for id, quad in quads.items():
 		quad["thickness"][str(frame)] = quad["thickness"][str(frame-1)]
-		quad["overstress"][str(frame)] = quad["overstress"][str(frame-1)]
+
+	# copy the results needed by the sectional optimization
+	if len(members) > 0:
+		keys = ["overstress", "utilization"]
+		if scene.phaenotyp.calculation_type != "force_distribution":
+			keys += ["max_long_stress", "acceptable_sigma_buckling"]
+		results.copy("members", keys, frame-1, frame)
+
+	if len(quads) > 0:
+		results.copy("quads", ["overstress"], frame-1, frame)
 		
 def sectional_optimization(frame):
 	'''
@@ -1710,267 +2225,245 @@ def sectional_optimization(frame):
 	text = "sectional_optimization for " + str(frame) + " done"
 	basics.print_data(text)
 
-def set_basis_fitness():
+def evict_frame(frame):
+	'''
+	Is deleting the results of the given frame to save memory.
+	The chromosome and the fitness of the individual are kept.
+	:param frame: Frame to delete the results from.
+	'''
 	scene = bpy.context.scene
 	data = scene["<Phaenotyp>"]
-	individuals = data["individuals"]
-	individuals["0"]["fitness"]["weighted"] = 1
 
-def calculate_fitness(frame):
+	results.evict(frame)
+
+	# delete the coordinates but keep volume, area ...
+	frame_data = data["frames"].get(str(frame))
+	if frame_data and "coordinates" in frame_data:
+		del frame_data["coordinates"]
+
+	# delete temp data (stored by int or str depending on the calculation_type)
+	for key in [frame, str(frame)]:
+		basics.models.pop(key, None)
+		basics.feas.pop(key, None)
+		basics.prepared.pop(key, None)
+
+	# frame needs to be calculated again to be shown
+	data["done"][str(frame)] = False
+
+def retain_results():
 	'''
-	Is calculating the fitness fo the given frame.
-	:param frame: Frame to work with
+	Is keeping the results of the best individuals and of the basis only.
+	The amount is taken from phaenotyp.retention_size (0 to keep all).
 	'''
 	scene = bpy.context.scene
 	phaenotyp = scene.phaenotyp
 	data = scene["<Phaenotyp>"]
-	obj = data["structure"]
-	members = data["members"]
-	quads = data["quads"]
-	
-	bpy.context.scene.frame_current = frame
-
-	environment = data["environment"]
 	individuals = data["individuals"]
 
-	# calculate fitness
-	individual = individuals[str(frame)]
+	retention_size = phaenotyp.retention_size
+	if retention_size == 0:
+		return
+
+	# sort by fitness like in ranking
+	list_result = []
+	for name, individual in individuals.items():
+		weighted = individual["fitness"].get("weighted")
+		if name != "0" and weighted is not None:
+			list_result.append([name, weighted])
 
-	# volume
-	volume = data["frames"][str(frame)]["volume"]
-	fitness_volume = volume
+	sorted_list = sorted(list_result, key = lambda x: x[1])
 
-	# area
-	area = data["frames"][str(frame)]["area"]
-	fitness_area = area
+	# evict all others that are still available
+	for name, weighted in sorted_list[retention_size:]:
+		if data["done"].get(name):
+			evict_frame(int(name))
 
-	# weight
-	weight = data["frames"][str(frame)]["weight"]
-	fitness_weight = weight
+	text = "results kept for " + str(min(retention_size, len(sorted_list))) + " individuals and basis"
+	basics.print_data(text)
+
+def set_basis_fitness():
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	individuals = data["individuals"]
+	individuals["0"]["fitness"]["weighted"] = 1
 
-	# rise
-	rise = data["frames"][str(frame)]["rise"]
-	fitness_rise = rise
+def divide_or_zero(a, b):
+	'''
+	Like basics.avoid_div_zero for arrays.
+	:param a: Array or float.
+	:param b: Array or float.
+	:return: Array with the results or 0 in case of division by zero.
+	'''
+	b = array(b, dtype=float)
+	return where(b == 0, 0.0, a / where(b == 0, 1.0, b))
 
-	# span
-	span = data["frames"][str(frame)]["span"]
-	fitness_span = span
+def get_weighted_fitness(fitness, basis_fitness):
+	'''
+	Is weighting the fitness of several individuals at once.
+	The values of weighted at basis is 1, all other individuals are weighted to this value.
+	:param fitness: Dict with the fitness as arrays with shape (individuals).
+	:param basis_fitness: Fitness of the basis individual.
+	:return weighted: Array with shape (individuals).
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
 
-	# cantilever
-	cantilever = data["frames"][str(frame)]["cantilever"]
-	fitness_cantilever = cantilever
+	# fitness with weight and with invert if available
+	names = [
+		["volume", True], ["area", True], ["weight", True],
+		["rise", True], ["span", True], ["cantilever", True]
+		]
 
 	if phaenotyp.calculation_type != "geometrical":
+		names += [["deflection_members", True], ["average_sigma_members", False]]
+
 		if phaenotyp.calculation_type != "force_distribution":
-			# deflection for members
-			forces = []
-			for id, member in members.items():
-				v_0 = member["initial_positions"][str(frame)]
-				v_1 = member["deflection"][str(frame)]
+			names += [["deflection_quads", True], ["average_sigmav_quads", False], ["average_strain_energy", False]]
 
-				v_0 = array(v_0)
-				v_1 = array(v_1)
-				
-				# mulitply with 0.5  because two vertices per member
-				dist = (linalg.norm(v_1) + linalg.norm(v_0)) * 0.5
+	weighted = zeros(len(fitness["volume"]))
+	for name, invertable in names:
+		factor = getattr(phaenotyp, "fitness_" + name)
 
-				forces.append(dist)
+		# flipped values
+		if invertable and getattr(phaenotyp, "fitness_" + name + "_invert"):
+			weighted += divide_or_zero(1, fitness[name]) * basis_fitness[name] * factor
+		else:
+			weighted += divide_or_zero(1, basis_fitness[name]) * fitness[name] * factor
+
+	# if all sliders are set to one, the weight is 6 (with 6 fitness sliders)
+	weight = phaenotyp.fitness_volume
+	weight += phaenotyp.fitness_area
+	weight += phaenotyp.fitness_weight
+	weight += phaenotyp.fitness_rise
+	weight += phaenotyp.fitness_span
+	weight += phaenotyp.fitness_cantilever
+	if phaenotyp.calculation_type != "geometrical":
+		weight += phaenotyp.fitness_deflection_members
+		weight += phaenotyp.fitness_deflection_quads
+		weight += phaenotyp.fitness_average_sigma_members
+		if phaenotyp.calculation_type != "force_distribution":
+			weight += phaenotyp.fitness_average_sigmav_quads
+			weight += phaenotyp.fitness_average_strain_energy
 
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
+	# the overall weighted-value is always 1 for the basis individual
+	return divide_or_zero(weighted, weight)
 
-			fitness_deflection_members = basics.avoid_div_zero(sum_forces, len(forces))
-			
-			# deflection for quads
-			forces = []
-			for id, quad in quads.items():
-				for i in range(4):
-					v_0 = quad["initial_positions"][str(frame)][i]
-					v_1 = quad["deflection"][str(frame)][i]
-
-					v_0 = array(v_0)
-					v_1 = array(v_1)
-					
-					# mulitply with 0.25  because four vertices per quad
-					dist = (linalg.norm(v_1) + linalg.norm(v_0)) * 0.25
-
-					forces.append(dist)
-			
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
-
-			fitness_deflection_quads = basics.avoid_div_zero(sum_forces, len(forces))
+def calculate_fitness_batch(frames):
+	'''
+	Is calculating the fitness of the given frames at once.
+	The results of all frames are read as arrays with shape (frames, members)
+	or (frames, quads) and each fitness is calculated for all frames together.
+	:param frames: Frames as list of int.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+	members = data["members"]
+	quads = data["quads"]
 
-			# average_sigma members
-			forces = []
-			for id, member in members.items():
-				force = member["max_sigma"][str(frame)]
-				forces.append(force)
-			
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
+	individuals = data["individuals"]
 
-			fitness_average_sigma_members = basics.avoid_div_zero(sum_forces, len(forces))
+	frames = list(frames)
+	frames_data = [data["frames"][str(frame)] for frame in frames]
 
-			# average_sigmav quads
-			forces = []
-			for id, quad in quads.items():
-				force = quad["sigmav"][str(frame)]
-				forces.append(force)
-			
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
-
-			fitness_average_sigmav_quads = basics.avoid_div_zero(sum_forces, len(forces))
-			
-		else:
-			# average_sigma for force_distribution -> max_sigma = sigma
-			forces = []
-			for id, member in members.items():
-				force = member["sigma"][str(frame)]
-				forces.append(force)
+	# only the fitness with a weight above zero in the fitness-only path
+	inputs = get_fitness_inputs()
 
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
+	# geometrical fitness
+	fitness = {}
+	for name in ["volume", "area", "weight", "rise", "span", "cantilever"]:
+		fitness[name] = array([frame_data[name] for frame_data in frames_data], dtype=float)
 
-			fitness_average_sigma_members = sum_forces / len(forces)
+	if phaenotyp.calculation_type != "geometrical":
+		empty_fitness = zeros(len(frames))
 
 		if phaenotyp.calculation_type != "force_distribution":
-			# average_strain_energy
-			forces = []
-			for id, member in members.items():
-				values = []
-				for value in member["strain_energy"][str(frame)]:
-					values.append(value)
-				force = basics.return_max_diff_to_zero(values)
-				forces.append(force)
-
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
-			
-			if len(forces) > 0:
-				fitness_average_strain_energy = sum_forces / len(forces)
-			else:
-				fitness_average_strain_energy = 0
-
-		'''
-		if environment["fitness_function"] == "lever_arm_model":
-			forces = []
-			for id, member in members.items():
-				force = member["max_lever_arm"][str(frame)]
-				forces.append(force)
+			# to get the initial positions with shape (frames, vertices, 3)
+			coordinates = array([geometry.frame_coordinates(frame) for frame in frames])
 
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
+			# deflection for members
+			if len(members) > 0 and "deflection_members" in inputs:
+				vertex_ids = results.vertices("members")
+				v_1 = results.read_frames("members", "deflection", frames)
 
-			fitness = sum_forces *(-1)
+				# vertices as first axis to get the stations with shape (members, frames, stations, 3)
+				v_0 = geometry.stations(coordinates.transpose(1, 0, 2), vertex_ids[:, 0], vertex_ids[:, 1], v_1.shape[2])
 
-		if environment["fitness_function"] == "lever_arm_bending":
-			forces = []
-			for id, member in members.items():
-				force = member["max_lever_arm"][str(frame)]
-				forces.append(force)
+				# mulitply with 0.5  because two vertices per member
+				forces = (linalg.norm(v_1, axis=(2,3)) + linalg.norm(v_0, axis=(2,3)).T) * 0.5
+				fitness["deflection_members"] = abs(forces).sum(axis=1) / len(members)
+			else:
+				fitness["deflection_members"] = empty_fitness
 
-			sum_forces = 0
-			for force in forces:
-				sum_forces = sum_forces + abs(force)
+			# deflection for quads
+			if len(quads) > 0 and "deflection_quads" in inputs:
+				v_0 = coordinates[:, results.vertices("quads")]
+				v_1 = results.read_frames("quads", "deflection", frames)
 
-			fitness = sum_forces
-		'''
+				# mulitply with 0.25  because four vertices per quad
+				forces = (linalg.norm(v_1, axis=3) + linalg.norm(v_0, axis=3)) * 0.25
+				fitness["deflection_quads"] = abs(forces).sum(axis=(1,2)) / (len(quads)*4)
+			else:
+				fitness["deflection_quads"] = empty_fitness
 
-	# pass to individual
-	individual["fitness"]["volume"] = fitness_volume
-	individual["fitness"]["area"] = fitness_area
-	individual["fitness"]["weight"] = fitness_weight
-	individual["fitness"]["rise"] = fitness_rise
-	individual["fitness"]["span"] = fitness_span
-	individual["fitness"]["cantilever"] = fitness_cantilever
-	if phaenotyp.calculation_type != "geometrical":
-		individual["fitness"]["deflection_members"] = fitness_deflection_members
-		individual["fitness"]["average_sigma_members"] = fitness_average_sigma_members
-		if phaenotyp.calculation_type != "force_distribution":
-			individual["fitness"]["deflection_quads"] = fitness_deflection_quads
-			individual["fitness"]["average_sigmav_quads"] = fitness_average_sigmav_quads
-			individual["fitness"]["average_strain_energy"] = fitness_average_strain_energy
+			# average_sigma members
+			if len(members) > 0 and "average_sigma_members" in inputs:
+				forces = results.read_frames("members", "max_sigma", frames)
+				fitness["average_sigma_members"] = abs(forces).sum(axis=1) / len(members)
+			else:
+				fitness["average_sigma_members"] = empty_fitness
 
-	if frame != 0:
-		# get from basis
-		basis_fitness = individuals["0"]["fitness"]
+			# average_sigmav quads
+			if len(quads) > 0 and "average_sigmav_quads" in inputs:
+				forces = results.read_frames("quads", "sigmav", frames)
+				fitness["average_sigmav_quads"] = abs(forces).sum(axis=1) / len(quads)
+			else:
+				fitness["average_sigmav_quads"] = empty_fitness
 
-		# flipped values
-		if phaenotyp.fitness_volume_invert:
-			weighted = basics.avoid_div_zero(1, fitness_volume) * basis_fitness["volume"] * phaenotyp.fitness_volume
-		# the values of weighted at basis is 1, all other frames are weighted to this value
-		else:
-			weighted = basics.avoid_div_zero(1, basis_fitness["volume"]) * fitness_volume * phaenotyp.fitness_volume
+			# average_strain_energy
+			# the value with the highest difference to zero of each member
+			if len(members) > 0 and "average_strain_energy" in inputs:
+				forces = abs(results.read_frames("members", "strain_energy", frames)).max(axis=2)
+				fitness["average_strain_energy"] = forces.sum(axis=1) / len(members)
+			else:
+				fitness["average_strain_energy"] = empty_fitness
 
-		if phaenotyp.fitness_area_invert:
-			weighted += basics.avoid_div_zero(1, fitness_area) * basis_fitness["area"] * phaenotyp.fitness_area
 		else:
-			weighted += basics.avoid_div_zero(1, basis_fitness["area"]) * fitness_area * phaenotyp.fitness_area
+			# average_sigma for force_distribution -> max_sigma = sigma
+			forces = results.read_frames("members", "sigma", frames)
+			fitness["average_sigma_members"] = abs(forces).sum(axis=1) / len(members)
 
-		if phaenotyp.fitness_weight_invert:
-			weighted += basics.avoid_div_zero(1, fitness_weight) * basis_fitness["weight"] * phaenotyp.fitness_weight
-		else:
-			weighted += basics.avoid_div_zero(1, basis_fitness["weight"]) * fitness_weight * phaenotyp.fitness_weight
+			# deflection is not available with force_distribution
+			fitness["deflection_members"] = empty_fitness
 
-		if phaenotyp.fitness_rise_invert:
-			weighted += basics.avoid_div_zero(1, fitness_rise) * basis_fitness["rise"] * phaenotyp.fitness_rise
-		else:
-			weighted += basics.avoid_div_zero(1, basis_fitness["rise"]) * fitness_rise * phaenotyp.fitness_rise
+	# pass to individuals in one pass
+	for position, frame in enumerate(frames):
+		individual = individuals[str(frame)]
+		for name, values in fitness.items():
+			individual["fitness"][name] = float(values[position])
 
-		if phaenotyp.fitness_span_invert:
-			weighted += basics.avoid_div_zero(1, fitness_span) * basis_fitness["span"] * phaenotyp.fitness_span
-		else:
-			weighted += basics.avoid_div_zero(1, basis_fitness["span"]) * fitness_span * phaenotyp.fitness_span
+		# to know which fitness is missing if weighted again
+		if basics.fitness_only:
+			individual["fitness_inputs"] = inputs
 
-		if phaenotyp.fitness_cantilever_invert:
-			weighted += basics.avoid_div_zero(1, fitness_cantilever) * basis_fitness["cantilever"] * phaenotyp.fitness_cantilever
-		else:
-			weighted += basics.avoid_div_zero(1, basis_fitness["cantilever"]) * fitness_cantilever * phaenotyp.fitness_cantilever
+	# the basis is weighted with 1 by set_basis_fitness
+	others = [position for position, frame in enumerate(frames) if frame != 0]
+	if len(others) > 0:
+		basis_fitness = individuals["0"]["fitness"]
+		weighted = get_weighted_fitness({name: values[others] for name, values in fitness.items()}, basis_fitness)
+		for position, value in zip(others, weighted):
+			individuals[str(frames[position])]["fitness"]["weighted"] = float(value)
 
-		if phaenotyp.calculation_type != "geometrical":
-			if phaenotyp.fitness_deflection_members_invert:
-				weighted += basics.avoid_div_zero(1, fitness_deflection_members) * basis_fitness["deflection_members"] * phaenotyp.fitness_deflection_members
-			else:
-				weighted += basics.avoid_div_zero(1, basis_fitness["deflection_members"]) * fitness_deflection_members * phaenotyp.fitness_deflection_members
-
-			weighted += basics.avoid_div_zero(1, basis_fitness["average_sigma_members"]) * fitness_average_sigma_members * phaenotyp.fitness_average_sigma_members
-			
-			if phaenotyp.calculation_type != "force_distribution":
-				if phaenotyp.fitness_deflection_quads_invert:
-					weighted += basics.avoid_div_zero(1, fitness_deflection_quads) * basis_fitness["deflection_quads"] * phaenotyp.fitness_deflection_quads
-				else:
-					weighted += basics.avoid_div_zero(1, basis_fitness["deflection_quads"]) * fitness_deflection_quads * phaenotyp.fitness_deflection_quads
-					
-				weighted += basics.avoid_div_zero(1, basis_fitness["average_sigmav_quads"]) * fitness_average_sigmav_quads * phaenotyp.fitness_average_sigmav_quads
-				weighted += basics.avoid_div_zero(1, basis_fitness["average_strain_energy"]) * fitness_average_strain_energy * phaenotyp.fitness_average_strain_energy
-
-
-		# if all sliders are set to one, the weight is 6 (with 6 fitness sliders)
-		weight = phaenotyp.fitness_volume
-		weight += phaenotyp.fitness_area
-		weight += phaenotyp.fitness_weight
-		weight += phaenotyp.fitness_rise
-		weight += phaenotyp.fitness_span
-		weight += phaenotyp.fitness_cantilever
-		if phaenotyp.calculation_type != "geometrical":
-			weight += phaenotyp.fitness_deflection_members
-			weight += phaenotyp.fitness_deflection_quads
-			weight += phaenotyp.fitness_average_sigma_members
-			if phaenotyp.calculation_type != "force_distribution":
-				weight += phaenotyp.fitness_average_sigmav_quads
-				weight += phaenotyp.fitness_average_strain_energy
-
-		# the overall weighted-value is always 1 for the basis individual
-		individual["fitness"]["weighted"] = basics.avoid_div_zero(weighted, weight)
-	
-	text = "calculate fitness for frame " + str(frame) + " done"
+	text = "calculate fitness for " + str(len(frames)) + " frames done"
 	basics.print_data(text)
+
+def calculate_fitness(frame):
+	'''
+	Is calculating the fitness fo the given frame.
+	:param frame: Frame to work with
+	'''
+	bpy.context.scene.frame_current = frame
+	calculate_fitness_batch([frame])
+
+# stresses of members are derived from the forces on request
+results.derived["members"]["function"] = derive_members_pn
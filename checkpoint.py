@@ -0,0 +1,132 @@
+import bpy
+import os
+import json
+from phaenotyp import basics, results
+
+# state of genetic algorithm and gradient descent stored on the disk
+# at the end of each generation or iteration to resume after a crash
+# or after the jobs have been stopped
+
+# the results of the frames are kept in the store of the run
+# and only the reference to the run is part of the checkpoint
+
+def path():
+	'''
+	Returns the path of the checkpoint.
+	:return path: Path of the file.
+	'''
+	return os.path.join(results.sidecar(), "checkpoint.json")
+
+def available():
+	'''
+	Checks if a checkpoint is available for the blend-file.
+	:return available: True if available.
+	'''
+	return os.path.isfile(path())
+
+def optimization_type():
+	'''
+	Returns the type of the optimization stored in the checkpoint.
+	:return optimization_type: "ga" or "gd".
+	'''
+	with open(path()) as file:
+		return json.load(file)["optimization_type"]
+
+def remove():
+	'''
+	Is deleting the checkpoint if a new optimization is started.
+	'''
+	try:
+		os.remove(path())
+	except OSError:
+		pass
+
+def to_dict(value):
+	'''
+	Converts ID properties to dicts and lists to be stored as json.
+	:param value: Value as stored in <Phaenotyp>.
+	:return value: Value as dict, list, float, int or str.
+	'''
+	if hasattr(value, "to_dict"):
+		return value.to_dict()
+
+	return results.to_list(value)
+
+def save(optimization_type):
+	'''
+	Is storing the state of the optimization to the disk.
+	:param optimization_type: "ga" or "gd".
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+
+	# results of the store need to be on the disk too
+	results.flush()
+
+	# the coordinates are not stored to keep the checkpoint small
+	# (the frames are calculated again if selected)
+	frames = {}
+	for name, frame_data in to_dict(data["frames"]).items():
+		frames[name] = {key: value for key, value in frame_data.items() if key != "coordinates"}
+
+	state = {
+		"optimization_type": optimization_type,
+		"environment": to_dict(data["environment"]),
+		"individuals": to_dict(data["individuals"]),
+		"frames": frames,
+		"done": to_dict(data["done"]),
+		"results": to_dict(data["results"])
+		}
+
+	# temporary state of gradient descent
+	if optimization_type == "gd":
+		state["gd"] = {
+			"chromosome_current": list(basics.chromosome_current),
+			"slope": list(basics.slope),
+			"fitness": basics.fitness,
+			"delta": basics.delta,
+			"learning_rate": basics.learning_rate,
+			"iteration": basics.iteration,
+			"max_iteration": basics.max_iteration,
+			"abort": basics.abort
+			}
+
+	# write to a temporary file first to avoid broken checkpoints
+	path_checkpoint = path()
+	os.makedirs(os.path.dirname(path_checkpoint), exist_ok=True)
+	path_temp = path_checkpoint + ".temp"
+	with open(path_temp, "w") as file:
+		json.dump(state, file)
+	os.replace(path_temp, path_checkpoint)
+
+	text = "checkpoint saved with " + str(len(data["individuals"])) + " individuals"
+	basics.print_data(text)
+
+def load():
+	'''
+	Is restoring the state of the optimization from the disk.
+	:return state: Dict with the state as stored by save.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+
+	with open(path()) as file:
+		state = json.load(file)
+
+	# results are kept in the store but the frames without coordinates
+	# need to be calculated again to be shown
+	for name, frame_data in state["frames"].items():
+		if state["done"].get(name):
+			frame_data["restored"] = True
+
+	for key in ["environment", "individuals", "frames", "done", "results"]:
+		data[key] = state[key]
+
+	# open the store of the checkpoint
+	results.close()
+
+	if "gd" in state:
+		for key, value in state["gd"].items():
+			setattr(basics, key, value)
+
+	return state
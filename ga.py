@@ -1,7 +1,7 @@
 import bpy
 import bmesh
 import random
-from phaenotyp import basics, geometry, calculation
+from phaenotyp import basics, geometry, calculation, results, checkpoint
 
 def create_indivdual(chromosome, parent_1, parent_2):
 	"""
@@ -34,6 +34,30 @@ def create_indivdual(chromosome, parent_1, parent_2):
 
 	individuals[str(frame)] = individual
 
+	# keep index in sync to find duplicates
+	basics.chromosomes_index.add(chromosome_key(chromosome))
+
+def chromosome_key(chromosome):
+	"""
+	Returns the chromosome as tuple to be used in basics.chromosomes_index.
+	The genes are rounded to ignore differences of floating point precision.
+	:param chromosome: The chromosome is a list of floats from 0 to 1.
+	:return key: Tuple of the rounded genes.
+	"""
+	return tuple(round(gene, 6) for gene in chromosome)
+
+def index_chromosomes():
+	"""
+	Is creating the index of the chromosomes of all individuals.
+	"""
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	individuals = data["individuals"]
+
+	basics.chromosomes_index = set()
+	for name, individual in individuals.items():
+		basics.chromosomes_index.add(chromosome_key(individual["chromosome"]))
+
 def generate_basis():
 	"""
 	Creates the basis individual for the genetic algorithm.
@@ -47,7 +71,6 @@ def generate_basis():
 	members = data["members"]
 
 	environment = data["environment"]
-	individuals = data["individuals"]
 
 	# create chromosome all set to 0
 	chromosome = []
@@ -95,7 +118,6 @@ def mate_chromosomes(chromosome_1, chromosome_2):
 	phaenotyp = scene.phaenotyp
 	data = scene["<Phaenotyp>"]
 	environment = data["environment"]
-	individuals = data["individuals"]
 
 	if phaenotyp.mate_type == "direct":
 		# chromosome for offspring
@@ -151,7 +173,6 @@ def create_initial_individuals(frames):
 	members = data["members"]
 
 	environment = data["environment"]
-	individuals = data["individuals"]
 	
 	start, end = frames
 	
@@ -167,19 +188,17 @@ def create_initial_individuals(frames):
 				chromosome.append(gene)
 			
 			# check if existing
-			for id, individual in individuals.items():
-				if individual["chromosome"].to_list() == chromosome:
-					if i < 100:
-						text = "chromosome" + str(chromosome) + " allready exists. I try again ..."
-						basics.print_data(text)
-					else:
-						basics.print_data("No new chromosome after retrying for 100 times. Maybe you want to run bruteforce?")
-						
-					new_chromosome_found = False
-					break
-					
+			if chromosome_key(chromosome) in basics.chromosomes_index:
+				if i < 100:
+					text = "chromosome" + str(chromosome) + " allready exists. I try again ..."
+					basics.print_data(text)
 				else:
-					new_chromosome_found = True
+					basics.print_data("No new chromosome after retrying for 100 times. Maybe you want to run bruteforce?")
+
+				new_chromosome_found = False
+
+			else:
+				new_chromosome_found = True
 			
 			# break if a new chromosome was found
 			if new_chromosome_found == True:
@@ -218,8 +237,8 @@ def calculate_individuals(frames):
 		calculation.calculate_frames(start, end)
 	
 	# calculate fitness
-	for frame in range(start, end):
-		basics.jobs.append([calculation.calculate_fitness, frame])
+	# (all frames at once)
+	basics.jobs.append([calculation.calculate_fitness_batch, list(range(start, end))])
 
 def populate_initial_generation():
 	'''
@@ -380,19 +399,17 @@ def create_new_individuals(frames):
 			chromosome = mate_chromosomes(parent_1["chromosome"], parent_2["chromosome"])
 			
 			# check if existing
-			for id, individual in individuals.items():
-				if individual["chromosome"].to_list() == chromosome:
-					if i < 100:
-						text = "chromosome" + str(chromosome) + " allready exists. I try again ..."
-						basics.print_data(text)
-					else:
-						basics.print_data("No new chromosome after retrying for 100 times. Maybe you want to run bruteforce?")
-						
-					new_chromosome_found = False
-					break
-					
+			if chromosome_key(chromosome) in basics.chromosomes_index:
+				if i < 100:
+					text = "chromosome" + str(chromosome) + " allready exists. I try again ..."
+					basics.print_data(text)
 				else:
-					new_chromosome_found = True
+					basics.print_data("No new chromosome after retrying for 100 times. Maybe you want to run bruteforce?")
+
+				new_chromosome_found = False
+
+			else:
+				new_chromosome_found = True
 			
 			# break if a new chromosome was found
 			if new_chromosome_found == True:
@@ -468,6 +485,12 @@ def populate_new_generation(frames):
 				basics.print_data(text)
 
 def finish():
+	# frames calculated afterwards with all stations and results
+	basics.jobs.append([calculation.set_evaluation, False])
+
+	# delete the mesh to compute the individuals
+	basics.jobs.append([calculation.remove_shape_keys_cache])
+
 	# update view
 	basics.jobs.append([basics.view_vertex_colors])
 	
@@ -491,6 +514,7 @@ def start():
 	data["environment"]["generation_id"] = 0
 	data["environment"]["genes"] = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
 	data["individuals"] = {}
+	basics.chromosomes_index = set()
 
 	# shorten
 	generation_size = data["environment"]["generation_size"]
@@ -498,11 +522,15 @@ def start():
 	generation_amount = data["environment"]["generation_amount"]
 	new_generation_size = data["environment"]["new_generation_size"]
 	generation_id = data["environment"]["generation_id"]
-	individuals = data["individuals"]
 
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
+	results.reset()
+	checkpoint.remove()
 	basics.feas = {}
+	calculation.set_evaluation(True)
+	basics.shape_keys_cache = {}
 
 	# generate an individual as basis at frame 0
 	# this individual has choromosome with all genes equals 0
@@ -523,8 +551,28 @@ def start():
 	basics.jobs.append([create_initial_individuals, [start, end]])
 	calculate_individuals([start, end])
 	basics.jobs.append([populate_initial_generation])
+	basics.jobs.append([calculation.retain_results])
+	basics.jobs.append([checkpoint.save, "ga"])
 
 	# create all other generations
+	create_generations(end, generation_amount)
+	
+	# geometry post and viz
+	basics.jobs.append([finish])
+	
+	# run jobs
+	bpy.ops.wm.phaenotyp_jobs()
+
+def create_generations(end, generation_amount):
+	'''
+	Is adding the jobs to create and calculate the given amount of generations.
+	:param end: Frame after the last individual.
+	:param generation_amount: Amount of generations to create.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	new_generation_size = data["environment"]["new_generation_size"]
+
 	# 2 indiviuals are taken from previous group (standard value is 10)
 	# 10 indiviuals are paired (standard ist 50 %)
 	for i in range(generation_amount):
@@ -540,9 +588,46 @@ def start():
 		basics.jobs.append([create_new_individuals, [start, end]])
 		calculate_individuals([start, end])
 		basics.jobs.append([populate_new_generation, [start, end]])
-	
+
+		# delete results of all but the best
+		basics.jobs.append([calculation.retain_results])
+
+		# store state to resume from
+		basics.jobs.append([checkpoint.save, "ga"])
+
+def resume():
+	'''
+	Is resuming the genetic algorithm from the last checkpoint.
+	The remaining generations are created and calculated again.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+
+	# create temp dictionaries
+	basics.models = {}
+	basics.prepared = {}
+	basics.feas = {}
+	calculation.set_evaluation(True)
+	basics.shape_keys_cache = {}
+
+	checkpoint.load()
+	index_chromosomes()
+
+	environment = data["environment"]
+	individuals = data["individuals"]
+
+	# continue after the last individual of the checkpoint
+	end = max(int(name) for name in individuals.keys()) + 1
+	generation_amount = environment["generation_amount"] - environment["generation_id"]
+
+	text = "resume genetic algorithm at generation " + str(environment["generation_id"])
+	basics.print_data(text)
+
+	bpy.context.scene.frame_end = end
+	create_generations(end, generation_amount)
+
 	# geometry post and viz
 	basics.jobs.append([finish])
-	
+
 	# run jobs
 	bpy.ops.wm.phaenotyp_jobs()
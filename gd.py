@@ -1,5 +1,5 @@
 import bpy
-from phaenotyp import basics, operators, geometry, calculation
+from phaenotyp import basics, operators, geometry, calculation, results, checkpoint
 import numpy as np
 
 def create_indivdual(chromosome, frame):
@@ -214,8 +214,8 @@ def make_step_mp(frames):
 		calculation.calculate_frames(start, end)
 	
 	# calculate fitness
-	for frame in range(start, end):
-		basics.jobs.append([calculation.calculate_fitness, frame])
+	# (all frames at once)
+	basics.jobs.append([calculation.calculate_fitness_batch, list(range(start, end))])
 	
 def get_next_step(frames):
 	scene = bpy.context.scene
@@ -291,6 +291,12 @@ def get_next_step(frames):
 		bpy.context.scene.frame_end = frame
 
 def finish():
+	# frames calculated afterwards with all stations and results
+	basics.jobs.append([calculation.set_evaluation, False])
+
+	# delete the mesh to compute the individuals
+	basics.jobs.append([calculation.remove_shape_keys_cache])
+
 	# update view
 	basics.jobs.append([basics.view_vertex_colors])
 	
@@ -322,7 +328,12 @@ def start():
 
 	# create temp variables and dictionaries
 	basics.models = {}
+	basics.prepared = {}
+	results.reset()
+	checkpoint.remove()
 	basics.feas = {}
+	calculation.set_evaluation(True)
+	basics.shape_keys_cache = {}
 	
 	basics.delta = delta
 	basics.learning_rate = learning_rate
@@ -334,10 +345,27 @@ def start():
 	generate_basis()
 	calculate_basis()
 	
+	# make all iterations
+	create_iterations(frame, max_iteration)
+	
+	# run jobs
+	bpy.ops.wm.phaenotyp_jobs()
+
+def create_iterations(frame, amount):
+	'''
+	Is adding the jobs to make the given amount of iterations and the last step.
+	:param frame: Last frame that is used allready.
+	:param amount: Amount of iterations.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+	obj = data["structure"]
+	shape_keys = obj.data.shape_keys.key_blocks
+
 	size = len(shape_keys)-1
 	
 	#while iteration < maxiteration:
-	for i in range(max_iteration):
+	for i in range(amount):
 		# update frame
 		frame += 1
 		
@@ -357,6 +385,9 @@ def start():
 		basics.jobs.append([create_variations, frame])
 		make_step_mp([frame+1, frame+size+1])
 		basics.jobs.append([get_next_step, [frame+1, frame+size+1]])
+
+		# store state to resume from
+		basics.jobs.append([checkpoint.save, "gd"])
 		
 		frame += size
 
@@ -371,6 +402,35 @@ def start():
 	
 	# geometry post and viz
 	basics.jobs.append([finish])
-	
+
+def resume():
+	'''
+	Is resuming the gradient descent from the last checkpoint.
+	The remaining iterations are made and calculated again.
+	'''
+	scene = bpy.context.scene
+	data = scene["<Phaenotyp>"]
+
+	# create temp variables and dictionaries
+	basics.models = {}
+	basics.prepared = {}
+	basics.feas = {}
+	calculation.set_evaluation(True)
+	basics.shape_keys_cache = {}
+
+	# chromosome, slope and settings are passed to basics
+	checkpoint.load()
+
+	individuals = data["individuals"]
+
+	# continue after the last variation of the checkpoint
+	frame = max(int(name) for name in individuals.keys())
+	amount = basics.max_iteration - basics.iteration
+
+	text = "resume gradient descent at iteration " + str(basics.iteration)
+	basics.print_data(text)
+
+	create_iterations(frame, amount)
+
 	# run jobs
 	bpy.ops.wm.phaenotyp_jobs()
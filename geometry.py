@@ -1,8 +1,8 @@
 import bpy
-import bmesh
 from math import sqrt, radians, pi
-from phaenotyp import basics, operators, material
+from phaenotyp import basics, operators, material, results
 from mathutils import Color, Vector, Matrix
+from numpy import array, empty, zeros, arange, repeat, cumsum, cross, stack, linalg, inf
 c = Color()
 
 # variable to pass all stuff that needs to be fixed
@@ -186,18 +186,6 @@ def delete_selected_faces():
 	#support_ids = selected_faces[0].vertices
 	bpy.ops.mesh.delete(type='EDGE_FACE')
 
-def volume(mesh):
-	'''
-	Volume of the structure via bmesh at current frame.
-	:param mesh: Mesh of the structure as basis.
-	:return frame_volume: Volume as float.
-	'''
-	bm = bmesh.new()
-	bm.from_mesh(mesh)
-	frame_volume = bm.calc_volume()
-
-	return frame_volume
-
 def area(faces):
 	'''
 	Area of the frame as overall sum of faces. Users can delete faces to
@@ -263,87 +251,195 @@ def perimeter(edge_keys, vertices):
 
 	return distances, perimeter
 
-def rise(vertices):
+def edge_ids(mesh):
 	'''
-	Rise of the structure as fitness. The function is iterating through
-	all vertices and returns the distance between the highest and lowest
-	point.
-	:param vertices: Vertices of the given structure.
-	:return frame_rise: Rise as float
+	Get the id of each edge by the sorted ids of its vertices.
+	:param mesh: Mesh of the structure.
+	:return edge_ids: Dict with the edge_key as key and the id of the edge as value.
 	'''
-	highest = 0
-	lowest = 0
+	edge_ids = {}
+	for edge_id, edge_key in enumerate(mesh.edge_keys):
+		edge_ids[edge_key] = edge_id
 
-	for vertex in vertices:
-		z = vertex.co[2]
+	return edge_ids
+
+def face_load_edges():
+	'''
+	Get the ids of the edges of each face with load.
+	The ids are created again for files saved before they were stored.
+	:return loads_f_edges: Dict with the id of the face as key and the ids of its edges as value.
+	'''
+	data = bpy.context.scene["<Phaenotyp>"]
+
+	if data.get("loads_f_edges") is None:
+		mesh = data["structure"].data
+		ids = edge_ids(mesh)
 
-		# find highest
-		if z > highest:
-			highest = z
+		loads_f_edges = {}
+		for id in data["loads_f"].keys():
+			loads_f_edges[id] = [ids[key] for key in mesh.polygons[int(id)].edge_keys]
 
-		# find lowest
-		if z < lowest:
-			lowest = z
+		data["loads_f_edges"] = loads_f_edges
 
-	frame_rise = highest-lowest
-	return frame_rise
+	return data["loads_f_edges"]
 
-def span(vertices, supports):
+def triangles(mesh):
 	'''
-	Span of the structure as fitness. The function is iterating through
-	all vertices and returns the highest distance between all supports.
-	:param vertices: Vertices of the given structure.
-	:param supports: Supports of the given structure.
-	:return frame_span: Span as float
+	Get all faces of the mesh as triangles (as fan from the first vertex of each face).
+	The triangles are cached as long as the vertices of the faces are not changing.
+	:param mesh: Mesh of the structure.
+	:return triangles: Array of vertex-ids with shape (triangles, 3).
 	'''
-	highest = 0
+	data = bpy.context.scene["<Phaenotyp>"]
+	polygons = mesh.polygons
+	loops = mesh.loops
 
-	for current in supports:
-		for other in supports:
-			if current != other:
-				current_co = vertices[int(current)].co
-				other_co = vertices[int(other)].co
+	loop_start = empty(len(polygons), dtype="i")
+	loop_total = empty(len(polygons), dtype="i")
+	loops_vertices = empty(len(loops), dtype="i")
 
-				dist_v = other_co - current_co
-				dist = dist_v.length
+	polygons.foreach_get("loop_start", loop_start)
+	polygons.foreach_get("loop_total", loop_total)
+	loops.foreach_get("vertex_index", loops_vertices)
 
-				# find highest
-				if dist > highest:
-					highest = dist
+	# keyed by the vertex indices of all faces
+	key = (data["scene_id"], loop_start.tobytes(), loop_total.tobytes(), loops_vertices.tobytes())
+	cache = basics.triangles_cache
+	if cache.get("key") == key:
+		return cache["triangles"]
 
-	frame_span = highest
-	return frame_span
+	# each face with n vertices has n-2 triangles
+	amount = loop_total - 2
+	first = repeat(loop_start, amount)
+	offset = arange(amount.sum()) - repeat(cumsum(amount) - amount, amount)
+	second = first + offset + 1
+	third = second + 1
+
+	triangles = loops_vertices[stack([first, second, third], axis=1)]
+
+	cache["key"] = key
+	cache["triangles"] = triangles
+
+	return triangles
+
+def metrics(coordinates, triangles, supports_ids):
+	'''
+	Volume, area, rise, span and cantilever of the frame in one pass.
+	:param coordinates: Array of the coordinates in m with shape (vertices, 3).
+	:param triangles: Array of vertex-ids with shape (triangles, 3).
+	:param supports_ids: Ids of the vertices with supports as list of int.
+	:return frame_metrics: Dict with volume, area, rise, span and cantilever as float.
+	'''
+	frame_metrics = {}
+
+	# volume and area of all triangles
+	a = coordinates[triangles[:, 0]]
+	b = coordinates[triangles[:, 1]]
+	c = coordinates[triangles[:, 2]]
+
+	# like calc_volume of bmesh (signed volume of tetrahedra to the origin)
+	frame_metrics["volume"] = float(abs((a * cross(b, c)).sum()) / 6)
+	frame_metrics["area"] = float(linalg.norm(cross(b - a, c - a), axis=1).sum() * 0.5)
+
+	# distance between the highest and lowest point
+	highest = 0
+	lowest = 0
+	if len(coordinates) > 0:
+		highest = max(coordinates[:, 2].max(), 0)
+		lowest = min(coordinates[:, 2].min(), 0)
+	frame_metrics["rise"] = float(highest - lowest)
+
+	# highest distance between all supports
+	supports_co = coordinates[supports_ids]
+	frame_span = 0
+	if len(supports_co) > 1:
+		distances = supports_co[:, None, :] - supports_co[None, :, :]
+		frame_span = linalg.norm(distances, axis=2).max()
+	frame_metrics["span"] = float(frame_span)
 
-def cantilever(vertices, supports):
 	# get cantilever of frame
 	# (lowest distance from all vertices to all supports)
 	highest = 0
+	if len(supports_co) > 0 and len(coordinates) > 0:
+		# distances of all vertices to all supports with shape (vertices, supports)
+		distances = linalg.norm(coordinates[:, None, :] - supports_co[None, :, :], axis=2)
 
-	for vertex in vertices:
-		to_closest_support = float('inf')
-		for support in supports:
-			vertex_co = vertex.co
-			support_co = vertices[int(support)].co
+		# the closest support that is not at the vertex itself
+		distances[distances == 0] = inf
+		highest = distances.min(axis=1).max()
 
-			if vertex_co != support_co:
-				dist_v = support_co - vertex_co
-				dist = dist_v.length
+	# return 0 if there is only one support
+	if highest == float('inf'):
+		highest = 0
+
+	frame_metrics["cantilever"] = float(highest)
+
+	return frame_metrics
 
-				# find highest
-				if dist < to_closest_support:
-					to_closest_support = dist
+def frame_coordinates(frame):
+	'''
+	Get the coordinates of all vertices of the structure stored in prepare_fea.
+	:param frame: Frame to get the coordinates from.
+	:return coordinates: Array of the coordinates in m with shape (vertices, 3) or None if not available.
+	'''
+	data = bpy.context.scene["<Phaenotyp>"]
+	frame_data = data["frames"].get(str(frame))
+	if not frame_data or "coordinates" not in frame_data:
+		return legacy_coordinates(frame)
 
-		# find highest
-		if to_closest_support > highest:
-			highest = to_closest_support
+	coordinates = array(frame_data["coordinates"].to_list()).reshape(-1, 3)
 
-	frame_cantilever = highest
+	return coordinates
 
-	# return 0 if there is only one support
-	if frame_cantilever == float('inf'):
-		frame_cantilever = 0
+def legacy_coordinates(frame):
+	'''
+	Get the coordinates of the vertices from the initial positions of the
+	members and quads stored by older versions.
+	:param frame: Frame to get the coordinates from.
+	:return coordinates: Array of the coordinates in m with shape (vertices, 3) or None if not available.
+	'''
+	data = bpy.context.scene["<Phaenotyp>"]
+	coordinates = zeros((len(data["structure"].data.vertices), 3))
+	available = False
+
+	# the first position is at vertex_1 and the last one at vertex_0
+	for member in data["members"].values():
+		positions = member.get("initial_positions", {}).get(str(frame))
+		if positions:
+			coordinates[member["vertex_1_id"]] = positions[0]
+			coordinates[member["vertex_0_id"]] = positions[len(positions)-1]
+			available = True
+
+	for quad in data["quads"].values():
+		positions = quad.get("initial_positions", {}).get(str(frame))
+		if positions:
+			for vertex_id, position in zip(quad["vertices_ids_structure"], positions):
+				coordinates[vertex_id] = position
+			available = True
+
+	if not available:
+		return None
+
+	return coordinates
+
+def stations(coordinates, vertex_0_id, vertex_1_id, amount=11):
+	'''
+	Get the initial positions along a member from the coordinates of its vertices.
+	Works for the ids of a single member and for arrays of ids of many members.
+	:param coordinates: Array of the coordinates in m with shape (vertices, 3).
+	:param vertex_0_id: Id of the first vertex as int or array.
+	:param vertex_1_id: Id of the second vertex as int or array.
+	:param amount: Number of stations along the member.
+	:return positions: Array with shape (amount, 3) or (members, amount, 3).
+	'''
+	v_0 = coordinates[vertex_0_id]
+	v_1 = coordinates[vertex_1_id]
+
+	# position i is (v_0*(i) + v_1*(last-i))/last
+	ratio = arange(amount) / (amount-1)
+	positions = v_1[..., None, :] + (v_0 - v_1)[..., None, :] * ratio[:, None]
 
-	return frame_cantilever
+	return positions
 
 def set_shape_keys(shape_keys, chromosome):
 	for id, key in enumerate(shape_keys):
@@ -529,9 +625,14 @@ def create_members(structure_obj, members):
 
 	len_verts = 0
 
+	# the stations are fixed with the mesh
+	# results with less stations are interpolated
+	amount = phaenotyp.stations
+	data["stations"] = amount
+
 	for id, member in members.items():
 		if phaenotyp.calculation_type != "force_distribution":
-			member["mesh_vertex_ids"] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+			member["mesh_vertex_ids"] = [0] * amount
 		else:
 			member["mesh_vertex_ids"] = [0, 0]
 
@@ -547,8 +648,9 @@ def create_members(structure_obj, members):
 
 		# create vertices
 		if phaenotyp.calculation_type != "force_distribution":
-			for i in range(11):
-				pos = (vertex_0_co*(i) + vertex_1_co*(10-i))*0.1
+			last = amount-1
+			for i in range(amount):
+				pos = (vertex_0_co*(i) + vertex_1_co*(last-i))/last
 
 				v = Vector(pos)
 				verts.append(v)
@@ -556,19 +658,11 @@ def create_members(structure_obj, members):
 				member["mesh_vertex_ids"][i] = len_verts+i
 
 			# add edges
-			edges.append([0 + len_verts, 1 + len_verts])
-			edges.append([1 + len_verts, 2 + len_verts])
-			edges.append([2 + len_verts, 3 + len_verts])
-			edges.append([3 + len_verts, 4 + len_verts])
-			edges.append([4 + len_verts, 5 + len_verts])
-			edges.append([5 + len_verts, 6 + len_verts])
-			edges.append([6 + len_verts, 7 + len_verts])
-			edges.append([7 + len_verts, 8 + len_verts])
-			edges.append([8 + len_verts, 9 + len_verts])
-			edges.append([9 + len_verts, 10 + len_verts])
+			for i in range(last):
+				edges.append([i + len_verts, i+1 + len_verts])
 
 			# update counter
-			len_verts += 11
+			len_verts += amount
 
 		else:
 			v_0 = Vector(vertex_0_co)
@@ -1168,6 +1262,13 @@ def update_geometry_post():
 	structure_obj_vertices = data["structure"]
 	frame = bpy.context.scene.frame_current
 	
+	# to get the initial positions
+	coordinates = frame_coordinates(frame)
+
+	# results of this frame are not available anymore
+	if coordinates is None:
+		return
+
 	# if members
 	mesh_for_viz = bpy.data.objects.get("<Phaenotyp>members_" + str(scene_id))
 	if mesh_for_viz:
@@ -1186,7 +1287,16 @@ def update_geometry_post():
 		viz_stressline_scale = phaenotyp.viz_stressline_scale
 		viz_stressline_length = phaenotyp.viz_stressline_length
 		
-		for id, member in members.items():
+		# results of all members for this frame
+		if phaenotyp.calculation_type != "force_distribution":
+			deflections = results.read("members", "deflection", frame)
+			forces = results.read("members", phaenotyp.forces_pn, frame)
+		else:
+			forces = results.read("members", phaenotyp.forces_fd, frame)
+		overstresses = results.read("members", "overstress", frame)
+
+		# the members are in the same order like in the store
+		for index, (id, member) in enumerate(members.items()):
 			id = int(id)
 
 			mesh_vertex_ids = member["mesh_vertex_ids"]
@@ -1199,34 +1309,39 @@ def update_geometry_post():
 			if radius_group:
 				radius_group.add(vertex_ids, radius, 'REPLACE')
 
+			overstress = overstresses[index]
+
 			if phaenotyp.calculation_type != "force_distribution":
 				# get forcetyp and force
-				result = member[phaenotyp.forces_pn]
-
-				for i in range(11):
-					position = member["deflection"][str(frame)][i]
-					x = position[0]*(1-viz_deflection) + member["initial_positions"][str(frame)][10-i][0]*viz_deflection
-					y = position[1]*(1-viz_deflection) + member["initial_positions"][str(frame)][10-i][1]*viz_deflection
-					z = position[2]*(1-viz_deflection) + member["initial_positions"][str(frame)][10-i][2]*viz_deflection
+				result = forces[index]
+				deflection = deflections[index]
+
+				amount = len(mesh_vertex_ids)
+				last = amount-1
+				initial_positions = stations(coordinates, member["vertex_0_id"], member["vertex_1_id"], amount)
+
+				for i in range(amount):
+					position = deflection[i]
+					x = position[0]*(1-viz_deflection) + initial_positions[last-i][0]*viz_deflection
+					y = position[1]*(1-viz_deflection) + initial_positions[last-i][1]*viz_deflection
+					z = position[2]*(1-viz_deflection) + initial_positions[last-i][2]*viz_deflection
 					vertices[mesh_vertex_ids[i]].co = (x,y,z)
 					
-					overstress = member["overstress"][str(frame)]
-					
 					# if utilization in viz
 					if phaenotyp.forces_pn == "utilization":
-						force = result[str(frame)] - 1
+						force = result - 1
 						c = rainbow(force, overstress, viz_boundaries_members, viz_scale)
 
-					# for 11 entries
+					# for entries at each station
 					else:
-						# for all forces with 10 entries
-						# 10th value is the same like 11th entrie
+						# for all forces with an entry less
+						# the last value is the same like the last station
 						# it should be ok for the viz only
 						# report is showing all entries
-						if len(result[str(frame)]) < 11 and i == 10:
-							force = result[str(frame)][9]
+						if len(result) < amount and i == last:
+							force = result[last-1]
 						else:
-							force = result[str(frame)][i]
+							force = result[i]
 						
 						color = rainbow(force, overstress, viz_boundaries_members, viz_scale)
 
@@ -1235,17 +1350,20 @@ def update_geometry_post():
 			# for force disbribution
 			else:
 				# get forcetyp and force
-				result = member[phaenotyp.forces_fd]
+				force = forces[index]
+
+				initial_positions = [
+					coordinates[member["vertex_0_id"]],
+					coordinates[member["vertex_1_id"]]
+					]
 
 				for i in range(2):
 					# apply transformation
-					x = member["initial_positions"][str(frame)][i][0]
-					y = member["initial_positions"][str(frame)][i][1]
-					z = member["initial_positions"][str(frame)][i][2]
+					x = initial_positions[i][0]
+					y = initial_positions[i][1]
+					z = initial_positions[i][2]
 					vertices[mesh_vertex_ids[i]].co = (x,y,z)
 
-					force = result[str(frame)]
-					overstress = member["overstress"][str(frame)]
 					color = rainbow(force, overstress, viz_boundaries_members, viz_scale)
 					attribute.data[mesh_vertex_ids[i]].color = color
 
@@ -1273,14 +1391,19 @@ def update_geometry_post():
 		# list of thickness for with each connected quad
 		thickness = [[] for i in range(len(vertices))]
 		
-		for id, quad in quads.items():
+		# results of all quads for this frame
+		forces_1 = results.read("quads", str(phaenotyp.forces_quads) + "_1", frame)
+		forces_2 = results.read("quads", str(phaenotyp.forces_quads) + "_2", frame)
+		deflections = results.read("quads", "deflection", frame)
+		overstresses = results.read("quads", "overstress", frame)
+
+		# the quads are in the same order like in the store
+		for index, (id, quad) in enumerate(quads.items()):
 			id = int(id)
 			
 			# get selected forcetyp and force
-			result_1 = quad[str(phaenotyp.forces_quads) + "_1"]
-			result_2 = quad[str(phaenotyp.forces_quads) + "_2"]
-			force_1 = result_1[str(frame)]
-			force_2 = result_2[str(frame)]
+			force_1 = forces_1[index]
+			force_2 = forces_2[index]
 			
 			# append forces to nodes to create average afterwards
 			keys = quad["vertices_ids_viz"]
@@ -1289,10 +1412,11 @@ def update_geometry_post():
 				nodes_2[key].append(force_2)
 
 			for i in range(4):
-				position = quad["deflection"][str(frame)][i]
-				x = position[0]*(1-viz_deflection) + quad["initial_positions"][str(frame)][i][0]*viz_deflection
-				y = position[1]*(1-viz_deflection) + quad["initial_positions"][str(frame)][i][1]*viz_deflection
-				z = position[2]*(1-viz_deflection) + quad["initial_positions"][str(frame)][i][2]*viz_deflection
+				position = deflections[index][i]
+				initial_position = coordinates[quad["vertices_ids_structure"][i]]
+				x = position[0]*(1-viz_deflection) + initial_position[0]*viz_deflection
+				y = position[1]*(1-viz_deflection) + initial_position[1]*viz_deflection
+				z = position[2]*(1-viz_deflection) + initial_position[2]*viz_deflection
 				
 				# get node of the corresponding vertex id of the viz mesh
 				node_id = quad["vertices_ids_viz"][i]
@@ -1301,7 +1425,7 @@ def update_geometry_post():
 				t = quad["thickness"][str(frame)] * 0.01
 				thickness[node_id].append(t)
 			
-			if quad["overstress"][str(frame)]:
+			if overstresses[index]:
 				for key in keys:
 					overstressed.append(key)
 		
@@ -1361,12 +1485,19 @@ def update_geometry_post():
 		viz_stressline_scale = phaenotyp.viz_stressline_scale * 0.01
 		radius_group = stress_viz.vertex_groups.get("radius")
 		
-		for id, quad in quads.items():
+		alphas_1 = results.read("quads", "alpha_1", frame)
+		alphas_2 = results.read("quads", "alpha_2", frame)
+		s_1_1s = results.read("quads", "s_1_1", frame)
+		s_2_1s = results.read("quads", "s_2_1", frame)
+		s_1_2s = results.read("quads", "s_1_2", frame)
+		s_2_2s = results.read("quads", "s_2_2", frame)
+
+		for index, (id, quad) in enumerate(quads.items()):
 			face = quads_faces[quad["face_id_viz"]]
 			normal = face.normal
 			center = face.center
 			thickness = quad["thickness"][str(frame)] * 0.01
-			overstress = quad["overstress"][str(frame)]
+			overstress = overstresses[index]
 			
 			v_0 = quad["vertices_ids_viz"][0]
 			v_1 = quad["vertices_ids_viz"][1]
@@ -1385,15 +1516,15 @@ def update_geometry_post():
 			t = e_1 - e_0
 			t = t*viz_stressline_length/200
 			
-			a_1_1 = quad["alpha_1"][str(frame)]
+			a_1_1 = alphas_1[index]
 			a_2_1 = a_1_1 + 90
-			a_1_2 = quad["alpha_2"][str(frame)]
+			a_1_2 = alphas_2[index]
 			a_2_2 = a_1_1 + 90
 			
-			s_1_1 = quad["s_1_1"][str(frame)]
-			s_2_1 = quad["s_2_1"][str(frame)]
-			s_1_2 = quad["s_1_2"][str(frame)]
-			s_2_2 = quad["s_2_2"][str(frame)]
+			s_1_1 = s_1_1s[index]
+			s_2_1 = s_2_1s[index]
+			s_1_2 = s_1_2s[index]
+			s_2_2 = s_2_2s[index]
 			
 			o_1_1 = 0
 			o_2_1 = 0
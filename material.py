@@ -2,6 +2,7 @@ import warnings # to ignore poly1d or polyfit warnings
 warnings.filterwarnings('ignore')
 
 from math import pi, sqrt
+from numpy import poly1d, polyfit
 
 # Material properties:
 # https://www.johannes-strommer.com/formeln/flaechentraegheitsmoment-widerstandsmoment/
@@ -219,3 +220,26 @@ dropdown_profiles = []
 for profile in profiles:
 	dropdown_entry = (profile[0], profile[1], "")
 	dropdown_profiles.append(dropdown_entry)
+
+# fitted buckling curves by knick_model
+# the fit is the same for all members and quads with the same knick_model
+buckling_curves = {}
+
+def buckling_curve(knick_model):
+	'''
+	Returns the polynomial fitted to the buckling curve.
+	The fit is done once for each knick_model and kept afterwards.
+	:param knick_model: Acceptable stresses at the values of kn_lamda.
+	:return function: poly1d to be evaluated with lamda as float or array.
+	'''
+	key = tuple(knick_model)
+	function = buckling_curves.get(key)
+	if function is None:
+		function = poly1d(polyfit(kn_lamda, key, 6))
+		buckling_curves[key] = function
+
+	return function
+
+# fit the curves of the library once
+for mat in library + library_quads:
+	buckling_curve(mat[-1])
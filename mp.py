@@ -46,8 +46,58 @@ def import_models():
 
 	return imported_models
 
+# create the FEModel3D from the data collected in prepare_fea_pn
+def create_model_pn(model_data):
+	model = FEModel3D()
+
+	for name, E, G, nu, rho in model_data["materials"]:
+		model.add_material(name, E, G, nu, rho)
+
+	for name, point in zip(model_data["nodes"], model_data["points"]):
+		x, y, z = point
+		model.add_node(name, x, y, z)
+
+	for support in model_data["supports"]:
+		model.def_support(*support)
+
+	members = zip(model_data["members"], model_data["sections"], model_data["self_weight_members"])
+	for member, section, self_weight in members:
+		id, node_0, node_1, material_name, tension_only, comp_only = member
+		Iy, Iz, J, A = section
+		model.add_member(
+			id, node_0, node_1, material_name,
+			Iy, Iz, J, A,
+			tension_only=tension_only, comp_only=comp_only,
+			)
+
+		# release Moments
+		if model_data["releases"]:
+			model.def_releases(id,
+				False, False, False, False, True, True,
+				False, False, False, False, True, True)
+
+		# add self weight as distributed load
+		model.add_member_dist_load(id, "FZ", self_weight, self_weight)
+
+	quads = zip(model_data["quads"], model_data["thickness"], model_data["self_weight_quads"])
+	for quad, t, self_weight in quads:
+		id, v_0, v_1, v_2, v_3, material_name = quad
+		model.add_quad(id, v_0, v_1, v_2, v_3, t, material_name, kx_mod=1.0, ky_mod=1.0)
+
+		# self weight distributed to all four vertices
+		for vertex_id in [v_0, v_1, v_2, v_3]:
+			model.add_node_load(vertex_id, 'FZ', self_weight)
+
+	for name, direction, P in model_data["node_loads"]:
+		model.add_node_load(name, direction, P)
+
+	for name, direction, w1, w2 in model_data["member_loads"]:
+		model.add_member_dist_load(name, direction, w1, w2)
+
+	return model
+
 # run one single fea and save result into feas (multiprocessing manager dict)
-def run_fea_pn(scipy_available, calculation_type, feas, model, frame):
+def run_fea_pn(scipy_available, calculation_type, feas, model_data, frame):
 	# the variables model, and frame are passed to mp
 	# this variables can not be returned with multiprocessing
 	# instead of this a dict with multiprocessing.Manager is created
@@ -58,6 +108,9 @@ def run_fea_pn(scipy_available, calculation_type, feas, model, frame):
 	# start time
 	start_time = time()
 	
+	# the model is created here to run in parallel too
+	model = create_model_pn(model_data)
+
 	if scipy_available == "True":
 		if calculation_type == "first_order":
 			model.analyze(check_statics=False, sparse=True)
@@ -6,7 +6,7 @@ from math import radians
 import os
 import webbrowser
 
-from phaenotyp import basics, material, geometry, calculation, bf, ga, gd, panel, report, nn
+from phaenotyp import basics, material, geometry, calculation, bf, ga, gd, panel, report, nn, results, cache, checkpoint
 
 def curve_to_mesh_straight():
 	bpy.ops.object.mode_set(mode='OBJECT')
@@ -968,6 +968,9 @@ def set_member():
 
 	bpy.ops.object.mode_set(mode="OBJECT")
 
+	# the order of the members is changing
+	results.reset()
+
 	# create new member for PyNite
 	if phaenotyp.calculation_type != "force_distribution":
 		for edge in obj.data.edges:
@@ -1059,7 +1062,6 @@ def set_member():
 				member["lamda"] = {}
 				member["lever_arm"] = {}
 				member["max_lever_arm"] = {}
-				member["initial_positions"] = {}
 				member["deflection"] = {}
 				member["overstress"] = {}
 				member["utilization"] = {}
@@ -1130,7 +1132,6 @@ def set_member():
 				member["axial"] = {}
 				member["sigma"] = {}
 
-				member["initial_positions"] = {}
 				member["deflection"] = {}
 				member["overstress"] = {}
 				member["utilization"] = {}
@@ -1176,6 +1177,9 @@ def set_quad():
 
 	bpy.ops.object.mode_set(mode="OBJECT")
 
+	# the order of the quads is changing
+	results.reset()
+
 	# this operator is only working for PyNite
 	# it is only called in this calculation_type
 	for face in obj.data.polygons:		
@@ -1223,7 +1227,6 @@ def set_quad():
 			quad["membrane_y"] = {}
 			quad["membrane_xy"] = {}
 
-			quad["initial_positions"] = {}
 			quad["deflection"] = {}
 			quad["overstress"] = {}
 			quad["utilization"] = {}
@@ -1426,6 +1429,10 @@ def set_load():
 						data["loads_e"].pop(str(id))
 
 	if phaenotyp.load_type == "faces":
+		# get edges by edge_key only once
+		edge_ids = geometry.edge_ids(obj.data)
+		loads_f_edges = geometry.face_load_edges()
+
 		# check if quad is available
 		possible = True
 		for face in obj.data.polygons:
@@ -1443,20 +1450,10 @@ def set_load():
 				if face.select:
 					edge_keys = face.edge_keys
 					for key in edge_keys:
-						for edge in obj.data.edges:
-							v_0 = edge.vertices[0]
-							v_1 = edge.vertices[1]
-							if key[0] == v_0 and key[1] == v_1:
-								id = edge.index
-								if str(id) not in members:
-									possible = False
-									break
-							
-							if key[1] == v_0 and key[0] == v_1:
-								id = edge.index
-								if str(id) not in members:
-									possible = False
-									break
+						id = edge_ids[key]
+						if str(id) not in members:
+							possible = False
+							break
 									
 		
 		# needs to be possible for fd
@@ -1480,6 +1477,10 @@ def set_load():
 
 					data["loads_f"][str(id)] = load
 
+					# store the ids of the edges of this face
+					# (to apply the load to the members without searching)
+					loads_f_edges[str(id)] = [edge_ids[key] for key in face.edge_keys]
+
 					# delete load if user is deleting the load
 					# (set all conditions to False and apply)
 					force = False
@@ -1489,6 +1490,7 @@ def set_load():
 
 					if not force:
 						data["loads_f"].pop(str(id))
+						loads_f_edges.pop(str(id))
 
 	# delete text of loads
 	basics.delete_obj_if_name_contains("<Phaenotyp>load_" + str(scene_id))
@@ -1972,7 +1974,9 @@ def calculate_single_frame():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 
 	# calculate frames
 	calculation.calculate_frames(frame, frame+1)
@@ -1999,7 +2003,9 @@ def calculate_animation():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# show wireframe to see progress
 	basics.view_wireframe()
@@ -2070,7 +2076,9 @@ def optimize_approximate():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.approximate_sectional])
@@ -2101,7 +2109,9 @@ def optimize_simple():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.simple_sectional])
@@ -2132,7 +2142,9 @@ def optimize_utilization():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.utilization_sectional])
@@ -2163,7 +2175,9 @@ def optimize_complex():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.complex_sectional])
@@ -2191,7 +2205,9 @@ def quads_approximate_sectional():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.quads_approximate_sectional])
@@ -2222,7 +2238,9 @@ def quads_utilization_sectional():
 	
 	# create temp dictionaries
 	basics.models = {}
+	basics.prepared = {}
 	basics.feas = {}
+	calculation.set_evaluation(False)
 	
 	# calculate new section
 	basics.jobs.append([calculation.quads_utilization_sectional])
@@ -2269,6 +2287,17 @@ def gd_start():
 	basics.view_wireframe()
 	
 	gd.start()
+
+def resume():
+	basics.print_data("Resume optimization from checkpoint")
+
+	# show wireframe to see progress
+	basics.view_wireframe()
+
+	if checkpoint.optimization_type() == "ga":
+		ga.resume()
+	else:
+		gd.resume()
 	
 def get_boundaries():
 	basics.print_data("get boundaries")
@@ -2289,39 +2318,16 @@ def get_boundaries():
 	# get forces of members
 	if phaenotyp.calculation_type != "force_distribution":
 		force_type = phaenotyp.forces_pn
-					
-		for frame in range(start, end):
-			for id in members:
-				member = members[id]
-				results = member[force_type].get(str(frame))
-				if results:
-					# if utilization in viz
-					if force_type == "utilization":
-						if results > highest:
-							highest = results
-						if results < lowest:
-							lowest = results
-							
-					# for more than one entrie
-					else:
-						for result in results:
-							if result > highest:
-								highest = result
-							if result < lowest:
-								lowest = result
-	
 	else:
 		force_type = phaenotyp.forces_fd
-		for frame in range(start, end):
-			for id in members:
-				member = members[id]
-				results = member[force_type].get(str(frame))
-				if results:
-					if results > highest:
-						highest = results
-					if results < lowest:
-						lowest = results
-								
+
+	if len(members) > 0:
+		for frame in results.frames("members", force_type):
+			if start <= frame < end:
+				forces = results.read("members", force_type, frame)
+				highest = max(highest, float(forces.max()))
+				lowest = min(lowest, float(forces.min()))
+
 	max_diff = basics.return_max_diff_to_zero([lowest, highest])
 	if abs(max_diff) < 0.001:
 		max_diff = 0.001 # to avoid diff zero
@@ -2332,24 +2338,13 @@ def get_boundaries():
 	highest = 0
 	
 	force_type = phaenotyp.forces_quads
-	for frame in range(start, end):
-		for id in quads:
-			quad = quads[id]
-			result_1 = quad[force_type + "_1"]
-			results = result_1.get(str(frame))
-			if results:			
-				if results > highest:
-					highest = results
-				if results < lowest:
-					lowest = results
-
-				result_2 = quad[force_type + "_2"]
-				results = result_1.get(str(frame))
-				
-				if results > highest:
-					highest = results
-				if results < lowest:
-					lowest = results
+	if len(quads) > 0:
+		for frame in results.frames("quads", force_type + "_1"):
+			if start <= frame < end:
+				for side in ["_1", "_2"]:
+					forces = results.read("quads", force_type + side, frame)
+					highest = max(highest, float(forces.max()))
+					lowest = min(lowest, float(forces.min()))
 											
 	max_diff = basics.return_max_diff_to_zero([lowest, highest])
 	if abs(max_diff) < 0.001:
@@ -2416,6 +2411,81 @@ def ranking():
 
 	bpy.context.scene.frame_current = frame_to_switch_to
 
+	# results of the fitness-only path or with less stations are calculated again
+	if calculation.complete_frames([frame_to_switch_to]):
+		basics.print_data("calculate individual again with all results")
+		bpy.ops.wm.phaenotyp_jobs()
+
+	# results deleted by retention or restored without coordinates are calculated again
+	elif not data["done"].get(str(frame_to_switch_to)) or data["frames"].get(str(frame_to_switch_to), {}).get("restored"):
+		if phaenotyp.retention_recompute and phaenotyp.calculation_type != "geometrical":
+			basics.print_data("calculate individual again")
+			calculation.set_evaluation(False)
+			basics.models = {}
+			basics.prepared = {}
+			basics.feas = {}
+			calculation.calculate_frames(frame_to_switch_to, frame_to_switch_to+1)
+			bpy.ops.wm.phaenotyp_jobs()
+
+def rerank():
+	'''
+	Is weighting the fitness of all individuals again with the current
+	fitness sliders from the stored fitness without calculating them again.
+	The ranking, the diagram and the reports of the individuals are updated.
+	:return text: Warning if not possible or None.
+	'''
+	scene = bpy.context.scene
+	phaenotyp = scene.phaenotyp
+	data = scene["<Phaenotyp>"]
+	scene_id = data["scene_id"]
+	individuals = data["individuals"]
+
+	# fitness with a weight of zero is not calculated in the fitness-only path
+	weighted_inputs = [name for name in calculation.fitness_inputs if getattr(phaenotyp, "fitness_" + name) > 0]
+	for individual in individuals.values():
+		calculated = individual.get("fitness_inputs")
+		if calculated is not None:
+			missing = [name for name in weighted_inputs if name not in calculated]
+			if len(missing) > 0:
+				text = "Not calculated in the fitness-only path: " + ", ".join(missing) + ". Please start again."
+				basics.print_data(text)
+				return text
+
+	basics.print_data("weight fitness of all individuals again")
+
+	basis_fitness = individuals["0"]["fitness"]
+	names = [name for name in individuals.keys() if name != "0"]
+
+	# stored fitness of all individuals as arrays
+	fitness = {}
+	for key in basis_fitness.keys():
+		if key != "weighted":
+			fitness[key] = np.array([individuals[name]["fitness"].get(key, 0.0) for name in names], dtype=float)
+
+	weighted = calculation.get_weighted_fitness(fitness, basis_fitness)
+	for name, value in zip(names, weighted):
+		individuals[name]["fitness"]["weighted"] = float(value)
+
+	calculation.set_basis_fitness()
+
+	# update diagram if created
+	if bpy.data.objects.get("<Phaenotyp>diagram_" + str(scene_id)):
+		geometry.create_diagram(None, bpy.context)
+
+	# update reports of the individuals if created
+	directory = os.path.dirname(bpy.data.filepath)
+	directory_chromosomes = os.path.join(directory, "Phaenotyp-chromosomes")
+	if os.path.isdir(directory_chromosomes):
+		report.report_chromosomes(directory_chromosomes + "/")
+
+	directory_tree = os.path.join(directory, "Phaenotyp-tree")
+	if os.path.isdir(directory_tree) and data["environment"].get("generations"):
+		report.report_tree(directory_tree + "/")
+
+	# go to the selected ranking again
+	if phaenotyp.ranking < len(individuals):
+		ranking()
+
 def render_single_frame(id_entry):
 	scene = bpy.context.scene
 	data = scene["<Phaenotyp>"]
@@ -2513,6 +2583,11 @@ def text():
 	quads = data["quads"]
 	frame = bpy.context.scene.frame_current
 
+	# results of the fitness-only path, deleted by retention
+	# or restored from a checkpoint without coordinates
+	if not data["done"].get(str(frame)) or data["frames"].get(str(frame), {}).get("restored"):
+		return "No results available at frame " + str(frame) + ", calculate the frame first"
+
 	basics.print_data("Generate output at the selected point")
 	data["texts"] = []
 	selected_objects = bpy.context.selected_objects
@@ -2530,7 +2605,7 @@ def text():
 				# get member
 				for id, member in members.items():
 					if phaenotyp.calculation_type != "force_distribution":
-						for position in range(11):
+						for position in range(len(member["mesh_vertex_ids"])):
 							if member["mesh_vertex_ids"][position] == vertex_id:
 								data_temp = []
 								# get member id
@@ -2551,49 +2626,52 @@ def text():
 								data_temp.append(text)
 
 								# results
-								text = "axial: " + str(round(member["axial"][str(frame)][position], 3)) + " kN"
+								text = "axial: " + str(round(results.read_element("members", "axial", frame, id)[position], 3)) + " kN"
 								data_temp.append(text)
-								text = "moment_y: " + str(round(member["moment_y"][str(frame)][position], 3)) + " kNcm"
+								text = "moment_y: " + str(round(results.read_element("members", "moment_y", frame, id)[position], 3)) + " kNcm"
 								data_temp.append(text)
-								text = "moment_z: " + str(round(member["moment_z"][str(frame)][position], 3)) + " kNcm"
+								text = "moment_z: " + str(round(results.read_element("members", "moment_z", frame, id)[position], 3)) + " kNcm"
 								data_temp.append(text)
-								text = "moment_h: " + str(round(member["moment_h"][str(frame)][position], 3)) + " kNcm"
+								text = "moment_h: " + str(round(results.read_element("members", "moment_h", frame, id)[position], 3)) + " kNcm"
 								data_temp.append(text)
-								text = "shear_y: " + str(round(member["shear_y"][str(frame)][position], 3)) + " kN"
+								text = "shear_y: " + str(round(results.read_element("members", "shear_y", frame, id)[position], 3)) + " kN"
 								data_temp.append(text)
-								text = "shear_z: " + str(round(member["shear_z"][str(frame)][position], 3)) + " kN"
+								text = "shear_z: " + str(round(results.read_element("members", "shear_z", frame, id)[position], 3)) + " kN"
 								data_temp.append(text)
-								text = "shear_h: " + str(round(member["shear_h"][str(frame)][position], 3)) + " kN"
+								text = "shear_h: " + str(round(results.read_element("members", "shear_h", frame, id)[position], 3)) + " kN"
 								data_temp.append(text)
-								text = "torque: " + str(round(member["torque"][str(frame)][position], 3)) + " kNcm"
+								text = "torque: " + str(round(results.read_element("members", "torque", frame, id)[position], 3)) + " kNcm"
 								data_temp.append(text)
 
-								text = "tau_shear: " + str(round(member["tau_shear"][str(frame)][position], 3)) + " kN/cm²"
+								text = "tau_shear: " + str(round(results.read_element("members", "tau_shear", frame, id)[position], 3)) + " kN/cm²"
 								data_temp.append(text)
-								text = "tau_torsion: " + str(round(member["tau_torsion"][str(frame)][position], 3)) + " kN/cm²"
+								text = "tau_torsion: " + str(round(results.read_element("members", "tau_torsion", frame, id)[position], 3)) + " kN/cm²"
 								data_temp.append(text)
-								text = "sum_tau: " + str(round(member["sum_tau"][str(frame)][position], 3)) + " kN/cm²"
+								text = "sum_tau: " + str(round(results.read_element("members", "sum_tau", frame, id)[position], 3)) + " kN/cm²"
 								data_temp.append(text)
-								text = "sigmav: " + str(round(member["sigmav"][str(frame)][position], 3)) + " kN/cm²"
+								text = "sigmav: " + str(round(results.read_element("members", "sigmav", frame, id)[position], 3)) + " kN/cm²"
 								data_temp.append(text)
-								text = "sigma: " + str(round(member["sigma"][str(frame)][position], 3)) + " kN/cm²"
+								text = "sigma: " + str(round(results.read_element("members", "sigma", frame, id)[position], 3)) + " kN/cm²"
 								data_temp.append(text)
 
-								text = "utilization: " + str(round(member["utilization"][str(frame)], 3))
+								text = "utilization: " + str(round(results.read_element("members", "utilization", frame, id), 3))
 								data_temp.append(text)
 
-								text = "overstress: " + str(member["overstress"][str(frame)])
+								text = "overstress: " + str(results.read_element("members", "overstress", frame, id))
 								data_temp.append(text)
 								
-								def_pos = member["initial_positions"][str(frame)][position][0] - member["deflection"][str(frame)][position][0]
+								coordinates = geometry.frame_coordinates(frame)
+								initial_positions = geometry.stations(coordinates, member["vertex_0_id"], member["vertex_1_id"], len(member["mesh_vertex_ids"]))
+
+								def_pos = initial_positions[position][0] - results.read_element("members", "deflection", frame, id)[position][0]
 								text = "deflection x: " + str(round(def_pos, 3))
 								data_temp.append(text)
 								
-								def_pos = member["initial_positions"][str(frame)][position][1] - member["deflection"][str(frame)][position][1]
+								def_pos = initial_positions[position][1] - results.read_element("members", "deflection", frame, id)[position][1]
 								text = "deflection y: " + str(round(def_pos, 3))
 								data_temp.append(text)
 								
-								def_pos = member["initial_positions"][str(frame)][position][2] - member["deflection"][str(frame)][position][2]
+								def_pos = initial_positions[position][2] - results.read_element("members", "deflection", frame, id)[position][2]
 								text = "deflection z: " + str(round(def_pos, 3))
 								data_temp.append(text)
 
@@ -2617,16 +2695,16 @@ def text():
 								data_temp.append(text)
 
 								# results
-								text = "axial: " + str(round(member["axial"][str(frame)], 3)) + " kN"
+								text = "axial: " + str(round(results.read_element("members", "axial", frame, id), 3)) + " kN"
 								data_temp.append(text)
 
-								text = "sigma: " + str(round(member["sigma"][str(frame)], 3)) + " kN/cm²"
+								text = "sigma: " + str(round(results.read_element("members", "sigma", frame, id), 3)) + " kN/cm²"
 								data_temp.append(text)
 
-								text = "utilization: " + str(round(member["utilization"][str(frame)], 3))
+								text = "utilization: " + str(round(results.read_element("members", "utilization", frame, id), 3))
 								data_temp.append(text)
 
-								text = "overstress: " + str(member["overstress"][str(frame)])
+								text = "overstress: " + str(results.read_element("members", "overstress", frame, id))
 								data_temp.append(text)
 
 								data["texts"] = data_temp
@@ -2661,53 +2739,53 @@ def text():
 						#weight, area
 												
 						# get results
-						text = "membrane_xy: " + str(round(quad["membrane_xy"][str(frame)], 3))
+						text = "membrane_xy: " + str(round(results.read_element("quads", "membrane_xy", frame, id), 3))
 						data_temp.append(text)
-						text = "membrane_x: " + str(round(quad["membrane_x"][str(frame)], 3))
+						text = "membrane_x: " + str(round(results.read_element("quads", "membrane_x", frame, id), 3))
 						data_temp.append(text)
-						text = "membrane_y: " + str(round(quad["membrane_y"][str(frame)], 3))
+						text = "membrane_y: " + str(round(results.read_element("quads", "membrane_y", frame, id), 3))
 						data_temp.append(text)
 
-						text = "moment_xy: " + str(round(quad["moment_xy"][str(frame)], 3))
+						text = "moment_xy: " + str(round(results.read_element("quads", "moment_xy", frame, id), 3))
 						data_temp.append(text)
-						text = "moment_x: " + str(round(quad["moment_x"][str(frame)], 3))
+						text = "moment_x: " + str(round(results.read_element("quads", "moment_x", frame, id), 3))
 						data_temp.append(text)
-						text = "moment_y: " + str(round(quad["moment_y"][str(frame)], 3))
+						text = "moment_y: " + str(round(results.read_element("quads", "moment_y", frame, id), 3))
 						data_temp.append(text)
 
-						text = "shear_x: " + str(round(quad["shear_x"][str(frame)], 3))
+						text = "shear_x: " + str(round(results.read_element("quads", "shear_x", frame, id), 3))
 						data_temp.append(text)
-						text = "shear_y: " + str(round(quad["shear_y"][str(frame)], 3))
+						text = "shear_y: " + str(round(results.read_element("quads", "shear_y", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "T_xy_1: " + str(round(quad["T_xy_1"][str(frame)], 3))
+						text = "T_xy_1: " + str(round(results.read_element("quads", "T_xy_1", frame, id), 3))
 						data_temp.append(text)
-						text = "T_xy_2: " + str(round(quad["T_xy_2"][str(frame)], 3))
+						text = "T_xy_2: " + str(round(results.read_element("quads", "T_xy_2", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "s_x_1: " + str(round(quad["s_x_1"][str(frame)], 3))
+						text = "s_x_1: " + str(round(results.read_element("quads", "s_x_1", frame, id), 3))
 						data_temp.append(text)
-						text = "s_x_2: " + str(round(quad["s_x_2"][str(frame)], 3))
+						text = "s_x_2: " + str(round(results.read_element("quads", "s_x_2", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "s_y_1: " + str(round(quad["s_y_1"][str(frame)], 3))
+						text = "s_y_1: " + str(round(results.read_element("quads", "s_y_1", frame, id), 3))
 						data_temp.append(text)
-						text = "s_y_2: " + str(round(quad["s_y_2"][str(frame)], 3))
+						text = "s_y_2: " + str(round(results.read_element("quads", "s_y_2", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "s_1_1: " + str(round(quad["s_1_1"][str(frame)], 3))
+						text = "s_1_1: " + str(round(results.read_element("quads", "s_1_1", frame, id), 3))
 						data_temp.append(text)
-						text = "s_2_1: " + str(round(quad["s_2_1"][str(frame)], 3))
+						text = "s_2_1: " + str(round(results.read_element("quads", "s_2_1", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "s_1_2: " + str(round(quad["s_1_2"][str(frame)], 3))
+						text = "s_1_2: " + str(round(results.read_element("quads", "s_1_2", frame, id), 3))
 						data_temp.append(text)
-						text = "s_2_2: " + str(round(quad["s_2_2"][str(frame)], 3))
+						text = "s_2_2: " + str(round(results.read_element("quads", "s_2_2", frame, id), 3))
 						data_temp.append(text)
 						
-						text = "alpha_1: " + str(round(quad["alpha_1"][str(frame)], 3))
+						text = "alpha_1: " + str(round(results.read_element("quads", "alpha_1", frame, id), 3))
 						data_temp.append(text)
-						text = "alpha_2: " + str(round(quad["alpha_2"][str(frame)], 3))
+						text = "alpha_2: " + str(round(results.read_element("quads", "alpha_2", frame, id), 3))
 						data_temp.append(text)
 						
 						data["texts"] = data_temp
@@ -2759,6 +2837,10 @@ def selection():
 	bpy.ops.mesh.select_all(action='DESELECT')
 	bpy.ops.object.mode_set(mode="OBJECT")
 	
+	# results are taken from the store, Do, Di, thickness ... from data
+	result_keys = results.keys["members_pn"] + results.keys["members_fd"] + results.keys["quads"]
+	result_keys += results.derived["members"]["keys"]
+
 	# for members
 	if phaenotyp.selection_type == "member": # for members
 		# iterate edges
@@ -2795,7 +2877,10 @@ def selection():
 				# is this edge a member?
 				member = members.get(str(id))
 				if member:
-					value = member[key][str(frame)]
+					if key in result_keys:
+						value = results.read_element("members", key, frame, id)
+					else:
+						value = member[key][str(frame)]
 
 					if compare == "Equal":
 						if value_min <= value <= value_max:
@@ -2851,7 +2936,10 @@ def selection():
 				# is this face a quad?
 				quad = quads.get(str(id))
 				if quad:
-					value = quad[key][str(frame)]
+					if key in result_keys:
+						value = results.read_element("quads", key, frame, id)
+					else:
+						value = quad[key][str(frame)]
 
 					if compare == "Equal":
 						if value_min <= value <= value_max:
@@ -2886,6 +2974,12 @@ def report_members():
 	frame = bpy.context.scene.frame_current
 
 
+	# individual of the fitness-only path is calculated first
+	if calculation.complete_frames([frame]):
+		basics.jobs.append([report_members])
+		bpy.ops.wm.phaenotyp_jobs()
+		return
+
 	# create folder
 	filepath = bpy.data.filepath
 	directory = os.path.dirname(filepath)
@@ -2899,7 +2993,7 @@ def report_members():
 
 	report.copy_sorttable(directory)
 
-	sorted_frames = basics.sorted_keys(members[list(members)[0]]["axial"])
+	sorted_frames = results.frames("members", "axial")
 	start = sorted_frames[0] # first frame (if user is changing start frame)
 	end = sorted_frames[len(sorted_frames)-1]
 
@@ -2919,6 +3013,12 @@ def report_frames():
 	frame = bpy.context.scene.frame_current
 
 
+	# individuals of the fitness-only path are calculated first
+	if calculation.complete_frames([int(name) for name in data["frames"].keys()]):
+		basics.jobs.append([report_frames])
+		bpy.ops.wm.phaenotyp_jobs()
+		return
+
 	# create folder
 	filepath = bpy.data.filepath
 	directory = os.path.dirname(filepath)
@@ -2932,7 +3032,7 @@ def report_frames():
 
 	report.copy_sorttable(directory)
 
-	sorted_frames = basics.sorted_keys(members[list(members)[0]]["axial"])
+	sorted_frames = results.frames("members", "axial")
 	start = sorted_frames[0] # first frame (if user is changing start frame)
 	end = sorted_frames[len(sorted_frames)-1]
 
@@ -2952,6 +3052,12 @@ def report_quads():
 	frame = bpy.context.scene.frame_current
 
 
+	# individuals of the fitness-only path are calculated first
+	if calculation.complete_frames([int(name) for name in data["frames"].keys()]):
+		basics.jobs.append([report_quads])
+		bpy.ops.wm.phaenotyp_jobs()
+		return
+
 	# create folder
 	filepath = bpy.data.filepath
 	directory = os.path.dirname(filepath)
@@ -2965,7 +3071,7 @@ def report_quads():
 
 	report.copy_sorttable(directory)
 
-	sorted_frames = basics.sorted_keys(quads[list(quads)[0]]["membrane_xy"])
+	sorted_frames = results.frames("quads", "membrane_xy")
 	start = sorted_frames[0] # first frame (if user is changing start frame)
 	end = sorted_frames[len(sorted_frames)-1]
 
@@ -2985,6 +3091,12 @@ def report_combined():
 	frame = bpy.context.scene.frame_current
 
 
+	# individuals of the fitness-only path are calculated first
+	if calculation.complete_frames([int(name) for name in data["frames"].keys()]):
+		basics.jobs.append([report_combined])
+		bpy.ops.wm.phaenotyp_jobs()
+		return
+
 	# create folder
 	filepath = bpy.data.filepath
 	directory = os.path.dirname(filepath)
@@ -2998,7 +3110,7 @@ def report_combined():
 
 	report.copy_sorttable(directory)
 
-	sorted_frames = basics.sorted_keys(members[list(members)[0]]["axial"])
+	sorted_frames = results.frames("members", "axial")
 	start = sorted_frames[0] # first frame (if user is changing start frame)
 	end = sorted_frames[len(sorted_frames)-1]
 
@@ -3111,6 +3223,9 @@ def reset():
 	except:
 		pass
 	
+	# delete results of the run
+	results.reset()
+
 	# create / recreate data
 	basics.create_data()
 	
@@ -3120,3 +3235,11 @@ def reset():
 	# change props
 	phaenotyp.calculation_type = "-"
 	phaenotyp.type_of_joints = "-"
+
+def clear_cache():
+	'''
+	Is deleting the calculated models kept on the disk.
+	The results of the current run are not affected.
+	'''
+	basics.print_data("clear cache")
+	cache.clear()
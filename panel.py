@@ -1,5 +1,5 @@
 import bpy, time
-from phaenotyp import basics, material, progress
+from phaenotyp import basics, material, progress, checkpoint
 
 # handle lists in panel
 # based on code by sinestesia and support by Gorgious
@@ -261,6 +261,12 @@ def calculation_type(layout):
 					data["panel_grayed"]["calculation_type"] = True
 					box_calculation_type.enabled = False
 
+			# storage of the results
+			if calculation_type not in ["geometrical", "force_distribution", "-"]:
+				box_precision = layout.box()
+				box_precision.label(text = "Results for visualization:")
+				box_precision.prop(phaenotyp, "result_precision", text="")
+
 
 def supports(layout):
 	'''
@@ -331,6 +337,8 @@ def members(layout):
 			box_members.prop(phaenotyp, "Di", text="Diameter inside")
 			if calculation_type != "force_distribution":
 				box_members.prop(phaenotyp, "buckling_resolution", text="Buckling resolution")
+				box_members.prop(phaenotyp, "stations", text="Stations")
+				box_members.prop(phaenotyp, "stations_optimization", text="Stations in optimization")
 
 			# current setting passed from gui
 			# (because a property can not be set in gui)
@@ -901,6 +909,13 @@ def bruteforce(layout):
 						name = keyblock.name
 						box_shape_keys.label(text=name)
 
+					box_retention = layout.box()
+					box_retention.label(text="Results:")
+					box_retention.prop(phaenotyp, "retention_size", text="Keep results of best individuals")
+					box_retention.prop(phaenotyp, "retention_recompute", text="Calculate others if selected")
+					if phaenotyp.calculation_type not in ["geometrical", "force_distribution"]:
+						box_retention.prop(phaenotyp, "fitness_only", text="Calculate fitness only")
+
 					# check generation_size and elitism
 					box_start = layout.box()
 					box_start.label(text="Bruteforce:")
@@ -917,6 +932,9 @@ def bruteforce(layout):
 							# show
 							box_select.operator("wm.ranking", text="Generate")
 
+						# after changing the fitness function
+						box_select.operator("wm.rerank", text="Weight fitness again")
+
 						box_rendering = layout.box()
 						box_rendering.label(text="Render sorted indiviuals:")
 						box_rendering.operator("wm.render_animation", text="Generate")
@@ -1030,6 +1048,13 @@ def genetic_algorithm(layout):
 						name = keyblock.name
 						box_shape_keys.label(text=name)
 
+					box_retention = layout.box()
+					box_retention.label(text="Results:")
+					box_retention.prop(phaenotyp, "retention_size", text="Keep results of best individuals")
+					box_retention.prop(phaenotyp, "retention_recompute", text="Calculate others if selected")
+					if phaenotyp.calculation_type not in ["geometrical", "force_distribution"]:
+						box_retention.prop(phaenotyp, "fitness_only", text="Calculate fitness only")
+
 					# check generation_size and elitism
 					box_start = layout.box()
 					box_start.label(text="Genetic algorithm:")
@@ -1038,6 +1063,10 @@ def genetic_algorithm(layout):
 					else:
 						box_start.label(text="Elitism should be smaller than 50% of generation size.")
 
+					# continue after crash or stop
+					if checkpoint.available() and not basics.is_running_jobs:
+						box_start.operator("wm.resume", text="Resume from checkpoint")
+
 					if len(data["individuals"]) > 0 and not bpy.context.screen.is_animation_playing:
 						box_select = layout.box()
 						box_select.label(text="Select individual by fitness:")
@@ -1049,6 +1078,9 @@ def genetic_algorithm(layout):
 							# show
 							box_select.operator("wm.ranking", text="Generate")
 
+						# after changing the fitness function
+						box_select.operator("wm.rerank", text="Weight fitness again")
+
 						box_rendering = layout.box()
 						box_rendering.label(text="Render sorted indiviuals:")
 						box_rendering.operator("wm.render_animation", text="Generate")
@@ -1212,10 +1244,19 @@ def gradient_descent(layout):
 						name = keyblock.name
 						box_shape_keys.label(text=name)
 					
+					if phaenotyp.calculation_type not in ["geometrical", "force_distribution"]:
+						box_results = layout.box()
+						box_results.label(text="Results:")
+						box_results.prop(phaenotyp, "fitness_only", text="Calculate fitness only")
+
 					box_gd_start = layout.box()
 					box_gd_start.label(text="Genetic descent:")
 					box_gd_start.operator("wm.gd_start", text="Start")
 
+					# continue after crash or stop
+					if checkpoint.available() and not basics.is_running_jobs:
+						box_gd_start.operator("wm.resume", text="Resume from checkpoint")
+
 def visualization(layout):
 	'''
 	Panel for visualization.
@@ -1595,3 +1636,9 @@ def reset(layout):
 	# reset data
 	box_reset = layout.box()
 	box_reset.operator("wm.reset", icon="TRASH", text="")
+
+	# cache of calculated models
+	box_cache = layout.box()
+	box_cache.label(text="Cache:")
+	box_cache.prop(phaenotyp, "cache_size", text="Models to keep")
+	box_cache.operator("wm.clear_cache", text="Clear cache")
@@ -1,8 +1,9 @@
 import bpy
-from phaenotyp import basics
+from phaenotyp import basics, results
 import shutil
 import os.path
 from mathutils import Color, Vector
+from numpy import where
 c = Color()
 
 class svg_individuals:
@@ -331,18 +332,22 @@ def fill_matrix_members(matrix, result_type, frame, length):
 	data = scene["<Phaenotyp>"]
 	members = data["members"]
 
+	# results of all members for this frame
+	results_forces = results.read("members", result_type, frame)
+	results_overstress = results.read("members", "overstress", frame)
+
 	highest = 0
 	lowest = 0
-	for member_id, member in members.items():
-		forces = member[result_type][str(frame)]
+	for index_in_list, member_id in enumerate(members.keys()):
+		forces = results_forces[index_in_list]
+		overstress = bool(results_overstress[index_in_list])
 
 		if length > 1:
 			for pos_id, force in enumerate(forces):
 				# force, overstress and utilization
-				overstress = member["overstress"][str(frame)]
+				force = float(force)
 				utilization = False # utilization is always one value
 				
-				index_in_list = list(members).index(member_id)
 				matrix[index_in_list][int(pos_id)] = [force, overstress, utilization]
 
 				# find highest
@@ -354,9 +359,8 @@ def fill_matrix_members(matrix, result_type, frame, length):
 					lowest = force
 
 		else:
-			force = forces # only one
+			force = float(forces) # only one
 			# force, overstress and utilization
-			overstress = member["overstress"][str(frame)]
 			if result_type == "utilization":
 				utilization = True
 			else:
@@ -381,31 +385,37 @@ def fill_matrix_frames(matrix, result_type, length):
 
 	highest = 0
 	lowest = 0
-	for member_id, member in members.items():
-		# get sorted frames
-		sorted_frames = basics.sorted_keys(member[result_type])
-
-		# matrix_frame is the index of the matrix
-		# the matrix starts with 0
-		# the frame_id of the member can start anywhere
-		# if the user is changing the start of the animation
-		for matrix_frame, frame_id in enumerate(sorted_frames):
-			force = member[result_type][str(frame_id)]
-			if length > 1:
-				force_list = []
-				for force_pos in force:
-					force_list.append(force_pos)
-
-				force = basics.return_max_diff_to_zero(force_list)
+	if len(members) == 0:
+		return matrix, highest, lowest
+
+	# get sorted frames
+	sorted_frames = results.frames("members", result_type)
+
+	# matrix_frame is the index of the matrix
+	# the matrix starts with 0
+	# the frame_id of the member can start anywhere
+	# if the user is changing the start of the animation
+	for matrix_frame, frame_id in enumerate(sorted_frames):
+		# results of all members for this frame
+		forces = results.read("members", result_type, frame_id)
+		if length > 1:
+			# value with the highest difference to zero
+			highest_plus = forces.max(axis=1)
+			smallest_minus = forces.min(axis=1)
+			forces = where(abs(smallest_minus) > abs(highest_plus), smallest_minus, highest_plus)
+
+		overstresses = results.read("members", "overstress", frame_id)
+
+		for index_in_list in range(len(members)):
+			force = float(forces[index_in_list])
 
 			# force, overstress and utilization
-			overstress = member["overstress"][str(frame_id)]
+			overstress = bool(overstresses[index_in_list])
 			if result_type == "utilization":
 				utilization = True
 			else:
 				utilization = False
 			
-			index_in_list = list(members).index(member_id)
 			matrix[index_in_list][int(matrix_frame)] = [force, overstress, utilization]
 
 			# find highest
@@ -426,31 +436,37 @@ def fill_matrix_quads(matrix, result_type, length):
 
 	highest = 0
 	lowest = 0
-	for quad_id, quad in quads.items():
-		# get sorted frames
-		sorted_frames = basics.sorted_keys(quad[result_type])
-
-		# matrix_frame is the index of the matrix
-		# the matrix starts with 0
-		# the frame_id of the member can start anywhere
-		# if the user is changing the start of the animation
-		for matrix_quad, frame_id in enumerate(sorted_frames):
-			force = quad[result_type][str(frame_id)]
-			if length > 1:
-				force_list = []
-				for force_pos in force:
-					force_list.append(force_pos)
-
-				force = basics.return_max_diff_to_zero(force_list)
+	if len(quads) == 0:
+		return matrix, highest, lowest
+
+	# get sorted frames
+	sorted_frames = results.frames("quads", result_type)
+
+	# matrix_frame is the index of the matrix
+	# the matrix starts with 0
+	# the frame_id of the member can start anywhere
+	# if the user is changing the start of the animation
+	for matrix_quad, frame_id in enumerate(sorted_frames):
+		# results of all quads for this frame
+		forces = results.read("quads", result_type, frame_id)
+		if length > 1:
+			# value with the highest difference to zero
+			highest_plus = forces.max(axis=1)
+			smallest_minus = forces.min(axis=1)
+			forces = where(abs(smallest_minus) > abs(highest_plus), smallest_minus, highest_plus)
+
+		overstresses = results.read("quads", "overstress", frame_id)
+
+		for index_in_list in range(len(quads)):
+			force = float(forces[index_in_list])
 
 			# force, overstress and utilization
-			overstress = quad["overstress"][str(frame_id)]
+			overstress = bool(overstresses[index_in_list])
 			if result_type == "utilization":
 				utilization = True
 			else:
 				utilization = False
 			
-			index_in_list = list(quads).index(quad_id)
 			matrix[index_in_list][int(matrix_quad)] = [force, overstress, utilization]
 
 			# find highest
@@ -1168,20 +1184,23 @@ def report_members(directory, frame):
 
 	force_types = {}
 
+	# stations along each member
+	amount = results.stations()
+
 	# force type with length of entry
-	force_types["axial"] = [11, "kN"]
-	force_types["moment_y"] = [11, "kNcm"]
-	force_types["moment_z"] = [11, "kNcm"]
-	force_types["moment_h"] = [11, "kNcm"]
-	force_types["shear_y"] = [11, "kN"]
-	force_types["shear_z"] = [11, "kN"]
-	force_types["shear_h"] = [11, "kN"]
-	force_types["torque"] = [11, "kNcm"]
-	force_types["sigma"] = [11, "kN/cm²"]
-
-	force_types["normal_energy"] = [10, "kNcm"]
-	force_types["moment_energy"] = [10, "kNcm"]
-	force_types["strain_energy"] = [10, "kNcm"]
+	force_types["axial"] = [amount, "kN"]
+	force_types["moment_y"] = [amount, "kNcm"]
+	force_types["moment_z"] = [amount, "kNcm"]
+	force_types["moment_h"] = [amount, "kNcm"]
+	force_types["shear_y"] = [amount, "kN"]
+	force_types["shear_z"] = [amount, "kN"]
+	force_types["shear_h"] = [amount, "kN"]
+	force_types["torque"] = [amount, "kNcm"]
+	force_types["sigma"] = [amount, "kN/cm²"]
+
+	force_types["normal_energy"] = [amount-1, "kNcm"]
+	force_types["moment_energy"] = [amount-1, "kNcm"]
+	force_types["strain_energy"] = [amount-1, "kNcm"]
 
 	for force_type, entries in force_types.items():
 		length = entries[0]
@@ -1191,7 +1210,7 @@ def report_members(directory, frame):
 		filename = directory + str(force_type) + ".html"
 		file = open(filename, 'w')
 		len_members = (len(members))
-		frames_len = len(members[list(members)[0]][force_type]) # len of entries from first existing member
+		frames_len = len(results.frames("members", force_type)) # amount of frames with results
 
 		# create matrix with length of col and row
 		result_matrix = create_matrix(length, len_members)
@@ -1245,7 +1264,7 @@ def report_frames(directory, start, end):
 		filename = directory + str(force_type) + ".html"
 		file = open(filename, 'w')
 		len_members = (len(members))
-		frames_len = len(members[list(members)[0]][force_type]) # Was wenn start wo anders?
+		frames_len = len(results.frames("members", force_type)) # Was wenn start wo anders?
 
 		# create matrix with length of col and row
 		result_matrix = create_matrix(frames_len, len_members)
@@ -1324,7 +1343,7 @@ def report_quads(directory, start, end):
 		filename = directory + str(force_type) + ".html"
 		file = open(filename, 'w')
 		len_quads = (len(quads))
-		frames_len = len(quads[list(quads)[0]][force_type]) # Was wenn start wo anders?
+		frames_len = len(results.frames("quads", force_type)) # Was wenn start wo anders?
 
 		# create matrix with length of col and row
 		result_matrix = create_matrix(frames_len, len_quads)
@@ -1370,7 +1389,7 @@ def report_combined(directory, start, end):
 		filename = directory + str(force_type) + ".html"
 		file = open(filename, 'w')
 		len_members = (len(members))
-		frames_len = len(members[list(members)[0]][force_type]) # Was wenn start wo anders?
+		frames_len = len(results.frames("members", force_type)) # Was wenn start wo anders?
 
 		# create matrix with length of col and row
 		result_matrix = create_matrix(frames_len, len_members)
@@ -0,0 +1,500 @@
+import bpy
+import os
+import shutil
+import tempfile
+import uuid
+from numpy import array, float32, lib
+
+# results of members and quads with one array per key
+# the first axis of each array is the row of the frame
+# the second axis is the position of the member or quad in data
+
+# the arrays are stored as memory-mapped files in a sidecar directory
+# next to the blend-file and the blend-file is only storing the path
+# the rows are split into chunks to grow without copying and
+# to page only the needed frames from the disk
+
+keys = {
+	"members_pn": [
+		"axial", "moment_y", "moment_z", "shear_y", "shear_z", "torque",
+		"deflection", "L"
+		],
+	"members_fd": ["axial", "sigma", "overstress", "utilization"],
+	"quads": [
+		"shear_x", "shear_y", "moment_x", "moment_y", "moment_xy",
+		"membrane_x", "membrane_y", "membrane_xy", "length_x", "length_y",
+		"deflection", "sigmav", "s_x_1", "s_x_2", "s_y_1", "s_y_2", "T_xy_1", "T_xy_2",
+		"s_1_1", "s_2_1", "s_1_2", "s_2_2", "alpha_1", "alpha_2",
+		"overstress", "utilization", "lamda", "acceptable_sigma_buckling"
+		]
+	}
+
+# results derived from the stored results on request
+# the function is registered by calculation and is writing all keys at once
+# the keys are derived only if the source is available for the frame
+derived = {
+	"members": {
+		"keys": [
+			"moment_h", "shear_h", "long_stress", "max_long_stress", "tau_shear", "max_tau_shear",
+			"tau_torsion", "max_tau_torsion", "sum_tau", "max_sum_tau",
+			"sigmav", "max_sigmav", "sigma", "max_sigma",
+			"overstress", "lamda", "acceptable_sigma_buckling",
+			"lever_arm", "max_lever_arm", "utilization",
+			"strain_energy", "normal_energy", "moment_energy"
+			],
+		"source": "L",
+		"function": None
+		}
+	}
+
+boolean_keys = ["overstress"]
+
+# results only used for visualization and reports
+# stored as float32 if result_precision is set to compact
+# results used by the fitness, the sectional optimization and
+# to derive other results are always stored as float64
+compact_keys = {
+	"members": [
+		"moment_h", "shear_h", "long_stress", "tau_shear", "tau_torsion", "sum_tau",
+		"sigmav", "lever_arm", "normal_energy", "moment_energy"
+		],
+	"quads": [
+		"s_x_1", "s_x_2", "s_y_1", "s_y_2", "T_xy_1", "T_xy_2",
+		"s_1_1", "s_2_1", "s_1_2", "s_2_2", "alpha_1", "alpha_2"
+		]
+	}
+
+chunk_size = 64 # rows per file
+
+directory = None # sidecar directory of the current run
+rows = {} # row of each frame as str(frame)
+columns = {} # position of each member or quad by id for "members" and "quads"
+vertex_ids = {} # ids of the vertices of each member or quad for "members" and "quads"
+chunks = {"members": {}, "quads": {}} # key -> {chunk: memmap of the results}
+masks = {"members": {}, "quads": {}} # key -> {chunk: memmap of written rows}
+
+def close():
+	'''
+	Is closing the store without deleting the files.
+	Needs to be called if another blend-file is loaded.
+	'''
+	global directory, rows, columns, vertex_ids, chunks, masks
+
+	flush()
+
+	directory = None
+	rows = {}
+	columns = {}
+	vertex_ids = {}
+	chunks = {"members": {}, "quads": {}}
+	masks = {"members": {}, "quads": {}}
+
+def reset():
+	'''
+	Is deleting all results of the store and the files of the run.
+	Needs to be called if the members or quads are changed.
+	'''
+	scene = bpy.context.scene
+	data = scene.get("<Phaenotyp>")
+
+	path = directory
+	if path is None and data and data.get("results"):
+		path = data["results"]["path"]
+
+	close()
+
+	if path and os.path.isdir(path):
+		shutil.rmtree(path, ignore_errors=True)
+
+	if data:
+		data["results"] = {}
+
+def flush():
+	'''
+	Is writing all changed results to the disk.
+	'''
+	for type in chunks:
+		for stored in [chunks[type], masks[type]]:
+			for key_chunks in stored.values():
+				for values in key_chunks.values():
+					values.flush()
+
+def sidecar():
+	'''
+	Returns the directory to store the runs in.
+	The directory is next to the blend-file or in the temp-directory
+	if the file is not saved yet.
+	:return path: Path of the directory.
+	'''
+	filepath = bpy.data.filepath
+	if filepath:
+		name = os.path.splitext(os.path.basename(filepath))[0]
+		return os.path.join(os.path.dirname(filepath), name + "_phaenotyp")
+
+	return os.path.join(tempfile.gettempdir(), "phaenotyp")
+
+def open_run():
+	'''
+	Returns the directory of the current run.
+	Is opening the run referenced in the blend-file or creating a new one.
+	:return directory: Path of the directory.
+	'''
+	global directory
+
+	if directory is not None:
+		return directory
+
+	data = bpy.context.scene["<Phaenotyp>"]
+	reference = data.get("results")
+
+	# run of the blend-file
+	if reference and os.path.isdir(reference["path"]):
+		directory = reference["path"]
+
+		path = os.path.join(directory, "rows.txt")
+		if os.path.isfile(path):
+			with open(path) as file:
+				for line in file:
+					frame = line.strip()
+					if frame:
+						rows[frame] = len(rows)
+
+	# create new run
+	else:
+		run = uuid.uuid4().hex
+		directory = os.path.join(sidecar(), run)
+		os.makedirs(directory, exist_ok=True)
+
+		data["results"] = {
+			"run": run,
+			"path": directory,
+			"frames": 0
+			}
+
+	return directory
+
+def row(frame):
+	'''
+	Returns the row of the given frame and creates a new one if needed.
+	:param frame: Frame as int or str.
+	:return row: Index of the frame in the arrays.
+	'''
+	frame = str(frame)
+	path = open_run()
+
+	if frame not in rows:
+		rows[frame] = len(rows)
+
+		with open(os.path.join(path, "rows.txt"), "a") as file:
+			file.write(frame + "\n")
+
+		# summary in the blend-file
+		bpy.context.scene["<Phaenotyp>"]["results"]["frames"] = len(rows)
+
+	return rows[frame]
+
+def chunk(type, key, index, shape=None, dtype=None):
+	'''
+	Returns the memory-mapped chunk of a key.
+	Is opening the file if existing or creating it if shape and dtype are given.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param index: Index of the chunk.
+	:param shape: Shape of one row to create the chunk.
+	:param dtype: Type of the values to create the chunk.
+	:return values, mask: Memmaps of the values and of the written rows or None.
+	'''
+	key_chunks = chunks[type].setdefault(key, {})
+	key_masks = masks[type].setdefault(key, {})
+
+	if index not in key_chunks:
+		path = os.path.join(open_run(), type, key)
+		path_values = os.path.join(path, str(index) + ".npy")
+		path_mask = os.path.join(path, str(index) + "_written.npy")
+
+		if os.path.isfile(path_values):
+			key_chunks[index] = lib.format.open_memmap(path_values, mode="r+")
+			key_masks[index] = lib.format.open_memmap(path_mask, mode="r+")
+
+		elif shape is not None:
+			os.makedirs(path, exist_ok=True)
+			key_chunks[index] = lib.format.open_memmap(path_values, mode="w+", dtype=dtype, shape=(chunk_size,) + shape)
+			key_masks[index] = lib.format.open_memmap(path_mask, mode="w+", dtype=bool, shape=(chunk_size,))
+
+		else:
+			return None, None
+
+	return key_chunks[index], key_masks[index]
+
+def column(type, id):
+	'''
+	Returns the position of the member or quad in the arrays.
+	:param type: "members" or "quads".
+	:param id: Id of the member or quad as int or str.
+	:return column: Index of the element in the arrays.
+	'''
+	if type not in columns:
+		data = bpy.context.scene["<Phaenotyp>"]
+		columns[type] = {id: i for i, id in enumerate(data[type].keys())}
+
+	return columns[type][str(id)]
+
+def vertices(type):
+	'''
+	Returns the ids of the vertices in the order of the arrays.
+	:param type: "members" or "quads".
+	:return vertex_ids: Array with shape (members, 2) or (quads, 4).
+	'''
+	if type not in vertex_ids:
+		data = bpy.context.scene["<Phaenotyp>"]
+		if type == "members":
+			ids = [[member["vertex_0_id"], member["vertex_1_id"]] for member in data["members"].values()]
+		else:
+			ids = [list(quad["vertices_ids_structure"]) for quad in data["quads"].values()]
+
+		vertex_ids[type] = array(ids, dtype=int)
+
+	return vertex_ids[type]
+
+def stations():
+	'''
+	Returns the number of stations along each member of the mesh.
+	Results are stored with this number of stations.
+	:return stations: Number of stations as int.
+	'''
+	data = bpy.context.scene["<Phaenotyp>"]
+	return data.get("stations", 11)
+
+def to_list(value):
+	'''
+	Converts (nested) ID properties to lists.
+	:param value: Value as stored in <Phaenotyp>.
+	:return value: Value as float, bool or list.
+	'''
+	if hasattr(value, "to_list"):
+		return value.to_list()
+
+	if isinstance(value, (list, tuple)):
+		return [to_list(entry) for entry in value]
+
+	return value
+
+def write(type, key, frame, values):
+	'''
+	Writes the results of all members or quads of one frame.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param frame: Frame as int or str.
+	:param values: Values in the order of data["members"] or data["quads"].
+	'''
+	if key in boolean_keys:
+		values = array(values, dtype=bool)
+	elif key in compact_keys[type] and bpy.context.scene.phaenotyp.result_precision == "compact":
+		values = array(values, dtype=float32) # None is stored as nan
+	else:
+		values = array(values, dtype=float) # None is stored as nan
+
+	index, offset = divmod(row(frame), chunk_size)
+
+	stored, mask = chunk(type, key, index, values.shape, values.dtype)
+	if stored.shape[1:] != values.shape:
+		text = "shape of " + type + "." + key + " for frame " + str(frame) + " is "
+		text += str(values.shape) + " instead of " + str(stored.shape[1:])
+		raise ValueError(text)
+
+	# values are converted to the precision of the stored chunk
+	# if result_precision is changed during a run
+	stored[offset] = values
+	mask[offset] = True
+
+def collect(type, keys, frame):
+	'''
+	Is filling the store with the results of <Phaenotyp> for the given frame.
+	Is used for files with results stored in the blend-file.
+	:param type: "members" or "quads".
+	:param keys: Keys of the results to be collected.
+	:param frame: Frame as int or str.
+	'''
+	data = bpy.context.scene["<Phaenotyp>"]
+	elements = data.get(type)
+	if not elements:
+		return
+
+	frame = str(frame)
+	for key in keys:
+		# only if the frame is stored by an older version
+		stored = [element.get(key) for element in elements.values()]
+		if any(not stored_key or frame not in stored_key for stored_key in stored):
+			continue
+
+		values = [to_list(stored_key[frame]) for stored_key in stored]
+		write(type, key, frame, values)
+
+def copy(type, keys, source, target):
+	'''
+	Is copying the results of one frame to another.
+	:param type: "members" or "quads".
+	:param keys: Keys of the results to be copied.
+	:param source: Frame to copy from as int or str.
+	:param target: Frame to copy to as int or str.
+	'''
+	for key in keys:
+		write(type, key, target, read(type, key, source))
+
+def forget(type, keys, frame):
+	'''
+	Is marking the results of the frame as not available without deleting the files.
+	Is used to derive the results again if the frame is calculated again.
+	:param type: "members" or "quads".
+	:param keys: Keys of the results to be forgotten.
+	:param frame: Frame as int or str.
+	'''
+	open_run()
+	frame_row = rows.get(str(frame))
+	if frame_row is None:
+		return
+
+	index, offset = divmod(frame_row, chunk_size)
+	for key in keys:
+		stored, mask = chunk(type, key, index)
+		if mask is not None:
+			mask[offset] = False
+
+def derivable(type, key, frame):
+	'''
+	Checks if the results of the frame can be derived from the store.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "sigma".
+	:param frame: Frame as int or str.
+	:return derivable: True if derivable.
+	'''
+	entry = derived.get(type)
+	if entry is None or entry["function"] is None or key not in entry["keys"]:
+		return False
+
+	return available(type, entry["source"], frame)
+
+def available(type, key, frame):
+	'''
+	Checks if the results of the frame are in the store.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param frame: Frame as int or str.
+	:return available: True if available.
+	'''
+	open_run()
+	frame_row = rows.get(str(frame))
+	if frame_row is None:
+		return False
+
+	index, offset = divmod(frame_row, chunk_size)
+	stored, mask = chunk(type, key, index)
+	if mask is None:
+		return False
+
+	return bool(mask[offset])
+
+def read(type, key, frame):
+	'''
+	Returns the results of all members or quads of one frame.
+	The values are paged from the disk if not in memory.
+	Derived results are calculated on the first request.
+	Results stored in the blend-file by older versions are taken over.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param frame: Frame as int or str.
+	:return values: Array with one entry per member or quad.
+	'''
+	if not available(type, key, frame):
+		if derivable(type, key, frame):
+			derived[type]["function"](frame)
+		else:
+			collect(type, [key], frame)
+
+		# no members or quads available
+		if not available(type, key, frame):
+			return array([])
+
+	index, offset = divmod(rows[str(frame)], chunk_size)
+	stored, mask = chunk(type, key, index)
+
+	return stored[offset]
+
+def read_frames(type, key, frames):
+	'''
+	Returns the results of all members or quads of several frames at once.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param frames: Frames as list of int or str.
+	:return values: Array with shape (frames, members or quads, ...).
+	'''
+	return array([read(type, key, frame) for frame in frames])
+
+def read_element(type, key, frame, id):
+	'''
+	Returns the result of one member or quad.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:param frame: Frame as int or str.
+	:param id: Id of the member or quad as int or str.
+	:return value: Result of the member or quad.
+	'''
+	return read(type, key, frame)[column(type, id)]
+
+def frames(type, key):
+	'''
+	Returns the frames with results of the given key.
+	:param type: "members" or "quads".
+	:param key: Key of the result like "axial".
+	:return frames: Sorted frames as int.
+	'''
+	found = set()
+	for frame in list(rows):
+		if available(type, key, frame) or derivable(type, key, frame):
+			found.add(int(frame))
+
+	# results stored in the blend-file by older versions
+	data = bpy.context.scene["<Phaenotyp>"]
+	elements = data.get(type)
+	if elements:
+		first = elements[list(elements)[0]]
+		if key in first:
+			found.update(map(int, first[key].keys()))
+
+	return sorted(found)
+
+def evict(frame):
+	'''
+	Is deleting the results of the given frame.
+	Chunks without any results left are deleted from the disk.
+	:param frame: Frame as int or str.
+	'''
+	open_run()
+	frame_row = rows.get(str(frame))
+	if frame_row is None:
+		return
+
+	index, offset = divmod(frame_row, chunk_size)
+	for type in chunks:
+		path = os.path.join(directory, type)
+		if not os.path.isdir(path):
+			continue
+
+		for key in os.listdir(path):
+			stored, mask = chunk(type, key, index)
+			if mask is None:
+				continue
+
+			mask[offset] = False
+
+			# delete chunk if empty
+			if not mask.any():
+				del chunks[type][key][index]
+				del masks[type][key][index]
+				del stored, mask
+
+				for name in [str(index) + ".npy", str(index) + "_written.npy"]:
+					try:
+						os.remove(os.path.join(path, key, name))
+					except OSError:
+						pass